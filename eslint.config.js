@@ -19,6 +19,8 @@ export default [
                 clearInterval: "readonly",
                 requestAnimationFrame: "readonly",
                 cancelAnimationFrame: "readonly",
+                requestIdleCallback: "readonly",
+                cancelIdleCallback: "readonly",
                 navigator: "readonly",
                 fetch: "readonly",
                 AudioContext: "readonly",
@@ -74,6 +76,8 @@ export default [
                 clearInterval: "readonly",
                 requestAnimationFrame: "readonly",
                 cancelAnimationFrame: "readonly",
+                requestIdleCallback: "readonly",
+                cancelIdleCallback: "readonly",
                 navigator: "readonly",
                 fetch: "readonly",
                 AudioContext: "readonly",
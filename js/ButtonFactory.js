@@ -26,6 +26,7 @@ export class ButtonFactory {
      * @param {string} [options.textColor='#4A4A4A'] - The color of the text string.
      * @param {string} [options.fontSize='24px'] - The CSS font size for the text.
      * @param {function} [options.onDisabledClick] - Callback for when the button is clicked while disabled.
+     * @param {number} [options.disabledColor] - Background color (hex) used while the button is disabled.
      * @returns {Phaser.GameObjects.Container} The created button container.
      */
     static createButton(scene, x, y, text, callback, options = {}) {
@@ -133,10 +134,21 @@ export class ButtonFactory {
         container.setDisabled = (isDisabled) => {
             container.isDisabled = isDisabled;
             container.setAlpha(isDisabled ? 0.6 : 1.0);
+            if (options.disabledColor !== undefined) {
+                bg.setFillStyle(isDisabled ? options.disabledColor : baseColor);
+            }
 
             // Palette UX: Visual cue for disabled state (Grayscale effect if possible, but alpha is safe)
         };
 
+        /**
+         * Updates the button's label in place (used by pooled list rows).
+         * @param {string} label - The new text.
+         */
+        container.setLabel = (label) => {
+            btnText.setText(label);
+        };
+
         return container;
     }
 }
@@ -88,6 +88,13 @@ export const Config = {
         MAX_JOURNAL_ENTRIES: 100
     },
 
+    // Journal Storage
+    JOURNAL: {
+        CHUNK_SIZE: 20,            // Entries per persisted chunk (each chunk is hashed independently)
+        PAGE_SIZE: 3,              // Entries per page in the Journal view
+        ARCHIVE_OLD_CHUNKS: false  // Keep chunks older than MAX_JOURNAL_ENTRIES in storage instead of deleting them
+    },
+
     // Action Effects
     ACTIONS: {
         FEED: {
@@ -261,6 +268,23 @@ export const Config = {
         UI_THROTTLE_MS: 100
     },
 
+    // MainScene update scheduling and power saving
+    SCHEDULER: {
+        IDLE_AFTER_MS: 15000, // No input and nothing animating for this long switches to low-power pacing
+        LOW_POWER_FPS: 15,
+        CATCH_UP_STEP_MS: 60000, // Simulation step used to replay time spent in a hidden tab
+        // Target rates (Hz) for MainScene subsystems; 0 runs a subsystem every frame
+        RATES: {
+            SKY: 10,
+            LIGHTING: 0, // Every frame, so lights track the tweened pet sprite; LightingManager skips sub-pixel moves
+            WEATHER_PARTICLES: 4,
+            PROACTIVE_BEHAVIORS: 10,
+            CAREER_UNLOCK: 4,
+            PET_MOVEMENT: 10,
+            QUEST_INDICATORS: 10
+        }
+    },
+
     // Security & Hashing
     SECURITY: {
         _dnaSalt: null,
@@ -16,6 +16,10 @@ import { ItemDefinitions } from './ItemData.js';
 import { RoomDefinitions } from './RoomDefinitions.js';
 import { ButtonFactory } from './ButtonFactory.js';
 import { DebugConsole } from './DebugConsole.js';
+import { UpdateScheduler } from './UpdateScheduler.js';
+
+/** Nominal frame duration; per-frame odds are scaled against it when a check runs less often. */
+const FRAME_MS = (Config.GAME_LOOP && Config.GAME_LOOP.MS_PER_FRAME) || 1000 / 60;
 
 /**
  * @fileoverview The primary game scene.
@@ -64,9 +68,74 @@ export class MainScene extends Phaser.Scene {
         this.isMoving = false;
         /** @type {number} Timestamp for the next autonomous move. */
         this.nextMoveTime = 0;
+        /** @type {number} One-shot effects (e.g. notifications) still playing; holds off low-power pacing. */
+        this.activeEffects = 0;
 
         /** @type {boolean} Flag indicating if async initialization is complete. */
         this.isReady = false;
+
+        /** @type {UpdateScheduler} Runs per-frame subsystems at their own rates and paces the loop when idle. */
+        this.scheduler = new UpdateScheduler();
+        this._registerUpdateTasks();
+    }
+
+    /**
+     * Registers the scene's rate-limited subsystems with the update scheduler.
+     * Each task only runs when its slot is due and its dirty condition holds.
+     * @private
+     */
+    _registerUpdateTasks() {
+        // Missing rates fall back to running every frame
+        const rates = (Config.SCHEDULER && Config.SCHEDULER.RATES) || {};
+        const isNightOutdoors = () => this.location !== 'INDOOR' &&
+            (this.worldState.time === 'Night' || this.worldState.time === 'Dusk');
+        let lightingKey = null;
+        let weatherKey = null;
+
+        // Sky is hidden indoors; SkyManager skips redraws itself while daylight is stable
+        this.scheduler.register('sky', () => this.skyManager.update(), {
+            rate: rates.SKY,
+            isDirty: () => this.location !== 'INDOOR'
+        });
+        this.scheduler.register('weatherParticles', () => {
+            this.weatherParticles.update(this.worldState.weather, this.worldState.season);
+        }, {
+            rate: rates.WEATHER_PARTICLES,
+            isDirty: () => {
+                const key = `${this.worldState.weather}|${this.worldState.season}`;
+                const changed = key !== weatherKey;
+                weatherKey = key;
+                return changed;
+            }
+        });
+        this.scheduler.register('questIndicators', () => this.updateQuestIndicators(), {
+            rate: rates.QUEST_INDICATORS,
+            isDirty: () => this.location === 'GARDEN' ||
+                Object.values(this.questIndicators || {}).some(indicator => indicator.visible)
+        });
+        this.scheduler.register('proactiveBehaviors', (time, elapsed) => this.checkProactiveBehaviors(elapsed), {
+            rate: rates.PROACTIVE_BEHAVIORS,
+            isDirty: () => this.nadagotchi.mood === 'happy' && this.nadagotchi.dominantArchetype === 'Adventurer'
+        });
+        this.scheduler.register('careerUnlock', () => this.checkCareerUnlock(), {
+            rate: rates.CAREER_UNLOCK,
+            isDirty: () => !!this.nadagotchi.newCareerUnlocked
+        });
+        this.scheduler.register('petMovement', (time, elapsed) => this.updatePetMovement(time, elapsed), {
+            rate: rates.PET_MOVEMENT,
+            // Outdoors the task only needs to run to clear a stale movement flag
+            isDirty: (time) => this.location === 'INDOOR' ? (!this.isMoving && time >= this.nextMoveTime) : this.isMoving
+        });
+        // Lights only show outdoors at night, but one run after each change is needed to hide them
+        this.scheduler.register('lighting', () => this.lightingManager.update(), {
+            rate: rates.LIGHTING,
+            isDirty: () => {
+                const key = `${this.location}|${this.worldState.time}`;
+                const changed = key !== lightingKey;
+                lightingKey = key;
+                return changed || isNightOutdoors();
+            }
+        });
     }
 
     /**
@@ -252,6 +321,27 @@ export class MainScene extends Phaser.Scene {
         this.game.events.on(EventKeys.SCENE_COMPLETE, this.handleSceneCompleteBound);
         this.scale.on('resize', this.resize, this);
 
+        // --- Update Scheduling & Power Saving ---
+        this.handleScenePauseBound = () => this.scheduler.setScenePaused(true);
+        this.handleSceneResumeBound = () => this.scheduler.setScenePaused(false);
+        this.events.on('pause', this.handleScenePauseBound);
+        this.events.on('resume', this.handleSceneResumeBound);
+        this.scheduler.attach(this.game, {
+            isBusy: () => this.isAnimating(),
+            isOverlayBusy: () => this.isUIAnimating(),
+            isOtherSceneActive: () => this.isOtherSceneActive(),
+            onCatchUp: (elapsed) => this.catchUp(elapsed),
+            onHidden: () => {
+                this.persistence.savePet(this.nadagotchi);
+                this.wikiSystem.flush();
+            }
+        });
+        // Wiki saves are coalesced; write any pending unlock before the page goes away
+        this.handleBeforeUnloadBound = () => this.wikiSystem.flush();
+        if (typeof window !== 'undefined' && window.addEventListener) {
+            window.addEventListener('beforeunload', this.handleBeforeUnloadBound);
+        }
+
         // --- Debug Console ---
         this.debugConsole = new DebugConsole(this);
 
@@ -304,6 +394,16 @@ export class MainScene extends Phaser.Scene {
         }
         this.scale.off('resize', this.resize, this);
         if (this.autoSaveTimer) this.autoSaveTimer.remove();
+        if (this.events) {
+            this.events.off('pause', this.handleScenePauseBound);
+            this.events.off('resume', this.handleSceneResumeBound);
+        }
+        this.scheduler.detach();
+        this.activeEffects = 0; // Tweens killed on shutdown never complete
+        if (typeof window !== 'undefined' && window.removeEventListener) {
+            window.removeEventListener('beforeunload', this.handleBeforeUnloadBound);
+        }
+        if (this.wikiSystem) this.wikiSystem.flush();
 
         // Clean up placement listeners if active
         if (this.isPlacementMode) {
@@ -314,7 +414,7 @@ export class MainScene extends Phaser.Scene {
 
     /**
      * The core game loop, called every frame.
-     * Updates game state, systems, and visuals.
+     * Advances the simulation, then runs whichever scheduled subsystems are due.
      * @param {number} time - The current time in milliseconds.
      * @param {number} delta - The time in milliseconds since the last frame.
      */
@@ -325,7 +425,51 @@ export class MainScene extends Phaser.Scene {
         const maxDelta = Config.GAME_LOOP.MAX_DELTA || 3600000;
         const cappedDelta = Math.min(delta, maxDelta);
 
-        const daysPassed = this.worldClock.update(cappedDelta);
+        const daysPassed = this.simulate(cappedDelta);
+        if (daysPassed > 0) {
+            this.refreshDailyVisuals();
+        }
+
+        // OPTIMIZATION: Throttle stats updates to ~10Hz (every 100ms)
+        // This prevents excessive UI rebuilding in UIScene while keeping the display responsive.
+        if (time - this.lastStatsUpdate > Config.TIMING.UI_THROTTLE_MS) {
+            // Include full world state for the new calendar dropdown
+            const date = this.calendar.getDate();
+            const fullState = {
+                nadagotchi: this.nadagotchi,
+                settings: this.gameSettings,
+                world: {
+                    timePeriod: this.worldState.time,
+                    season: this.worldState.season,
+                    day: date.day,
+                    year: date.year,
+                    weather: this.worldState.weather,
+                    event: this.worldState.activeEvent
+                }
+            };
+            this.game.events.emit(EventKeys.UPDATE_STATS, fullState);
+            this.lastStatsUpdate = time;
+        }
+
+        this.updateSpriteMood();
+        this.scheduler.update(time);
+
+        if (this.nadagotchi.currentDesire && this.nadagotchi.currentDesire !== this.lastDesire) {
+            this.showNotification(`Craving: ${this.nadagotchi.currentDesire}!`, "#FFD700");
+            this.lastDesire = this.nadagotchi.currentDesire;
+        } else if (!this.nadagotchi.currentDesire) {
+            this.lastDesire = null;
+        }
+    }
+
+    /**
+     * Advances the world and the pet by one simulation step. Does no rendering work.
+     * @param {number} delta - Real milliseconds to simulate (before the game speed multiplier).
+     * @param {boolean} [silent=false] - Suppresses notifications (used during catch-up).
+     * @returns {number} The number of in-game days that passed.
+     */
+    simulate(delta, silent = false) {
+        const daysPassed = this.worldClock.update(delta);
         for (let i = 0; i < daysPassed; i++) {
             this.calendar.advanceDay();
             // Apply daily friendship decay
@@ -336,7 +480,7 @@ export class MainScene extends Phaser.Scene {
             // Generate Daily Quest
             if (this.nadagotchi.questSystem) {
                 const newQuest = this.nadagotchi.questSystem.generateDailyQuest(this.calendar.season, this.weatherSystem.getCurrentWeather());
-                if (newQuest && i === daysPassed - 1) { // Only notify for the last day passed
+                if (newQuest && i === daysPassed - 1 && !silent) { // Only notify for the last day passed
                     this.showNotification("New Daily Quest Available!", '#00FFFF');
                 }
             }
@@ -350,66 +494,86 @@ export class MainScene extends Phaser.Scene {
             this.eventManager.update();
         }
 
-        if (daysPassed > 0) {
-            this.checkMerchantVisibility();
-            if (this.nadagotchi.debrisSystem) {
-                this.renderDebris();
-            }
-        }
-
         // UPDATE properties, DO NOT reassign object
         this.worldState.time = this.worldClock.getCurrentPeriod();
         this.worldState.weather = this.weatherSystem.getCurrentWeather();
         this.worldState.activeEvent = this.eventManager.getActiveEvent();
         this.worldState.season = this.calendar.season;
 
-        // Update Managers
-        this.skyManager.update();
-        this.weatherParticles.update(this.worldState.weather, this.worldState.season);
-
         // Apply game speed multiplier to delta time
-        const simDelta = cappedDelta * (this.gameSettings.gameSpeed || 1.0);
+        const simDelta = delta * (this.gameSettings.gameSpeed || 1.0);
 
         this.nadagotchi.live(simDelta, this.worldState);
 
-        // OPTIMIZATION: Throttle stats updates to ~10Hz (every 100ms)
-        // This prevents excessive UI rebuilding in UIScene while keeping the display responsive.
-        if (time - this.lastStatsUpdate > Config.TIMING.UI_THROTTLE_MS) {
-            // Include full world state for the new calendar dropdown
-            const date = this.calendar.getDate();
-            const fullState = {
-                nadagotchi: this.nadagotchi,
-                settings: this.gameSettings,
-                world: {
-                    timePeriod: this.worldState.time,
-                    season: this.worldState.season,
-                    day: date.day,
-                    year: date.year,
-                    weather: this.worldState.weather,
-                    event: this.worldState.activeEvent
-                }
-            };
-            this.game.events.emit(EventKeys.UPDATE_STATS, fullState);
-            this.lastStatsUpdate = time;
+        return daysPassed;
+    }
 
-            // Check for Quest Indicators periodically
-            this.updateQuestIndicators();
+    /**
+     * Replays time the page spent hidden as simulation-only steps, then refreshes
+     * every scheduled subsystem once. Capped like a single frame at `GAME_LOOP.MAX_DELTA`.
+     * @param {number} elapsed - Milliseconds the page was hidden.
+     */
+    catchUp(elapsed) {
+        if (!this.isReady) return;
+
+        const stepMs = (Config.SCHEDULER && Config.SCHEDULER.CATCH_UP_STEP_MS) || 60000;
+        let remaining = Math.min(elapsed, Config.GAME_LOOP.MAX_DELTA || 3600000);
+        let daysPassed = 0;
+        while (remaining > 0) {
+            const step = Math.min(stepMs, remaining);
+            daysPassed += this.simulate(step, true);
+            remaining -= step;
         }
 
-        this.updateSpriteMood();
-        this.checkProactiveBehaviors();
-        this.checkCareerUnlock();
-        this.updatePetMovement(time);
+        if (daysPassed > 0) {
+            this.refreshDailyVisuals();
+        }
+        this.scheduler.markAllDirty();
+    }
 
-        this.lightingManager.update();
-        if (this.nadagotchi.currentDesire && this.nadagotchi.currentDesire !== this.lastDesire) {
-            this.showNotification(`Craving: ${this.nadagotchi.currentDesire}!`, "#FFD700");
-            this.lastDesire = this.nadagotchi.currentDesire;
-        } else if (!this.nadagotchi.currentDesire) {
-            this.lastDesire = null;
+    /**
+     * Refreshes world objects that only change when a day passes.
+     */
+    refreshDailyVisuals() {
+        this.checkMerchantVisibility();
+        if (this.nadagotchi.debrisSystem) {
+            this.renderDebris();
         }
     }
 
+    /**
+     * Whether the world shows significant motion, which holds off low-power pacing.
+     * Looping idle tweens and ambient particles (autumn leaves) keep running at the low-power rate.
+     * @returns {boolean} True while the pet walks, the player edits furniture, a one-shot effect plays
+     *          or rain/snow falls in the garden.
+     */
+    isAnimating() {
+        if (this.isMoving || this.isPlacementMode || this.isDecorationMode || this.activeEffects > 0) return true;
+        return this.location !== 'INDOOR' &&
+            !!(this.weatherParticles && this.weatherParticles.isHeavy && this.weatherParticles.isHeavy());
+    }
+
+    /**
+     * Whether UIScene is tweening something (toasts, button feedback, panel transitions).
+     * UIScene shares the game loop and keeps running while this scene is paused behind a modal.
+     * @returns {boolean} True while UIScene has an active tween.
+     */
+    isUIAnimating() {
+        const uiScene = this.scene && this.scene.get ? this.scene.get('UIScene') : null;
+        return !!(uiScene && uiScene.tweens && uiScene.tweens.getTweens &&
+            uiScene.tweens.getTweens().length > 0);
+    }
+
+    /**
+     * Whether a scene other than this one and UIScene (e.g. a minigame) is running.
+     * @returns {boolean} True while another gameplay scene is active.
+     */
+    isOtherSceneActive() {
+        const manager = this.scene && this.scene.manager;
+        if (!manager || !manager.getScenes) return false;
+        return manager.getScenes(true).some(scene => scene !== this && scene.sys.settings.key !== 'UIScene');
+    }
+
     updateQuestIndicators() {
         if (!this.nadagotchi.questSystem) return;
 
@@ -987,7 +1151,8 @@ export class MainScene extends Phaser.Scene {
             { fontFamily: 'VT323, Arial', fontSize: '24px', color: color, backgroundColor: 'rgba(0,0,0,0.7)', padding: { x: 15, y: 10 } }
         ).setOrigin(0.5);
 
-        this.tweens.add({ targets: notificationText, alpha: { from: 0, to: 1 }, duration: 500, yoyo: true, hold: 2500, onComplete: () => notificationText.destroy() });
+        this.activeEffects++;
+        this.tweens.add({ targets: notificationText, alpha: { from: 0, to: 1 }, duration: 500, yoyo: true, hold: 2500, onComplete: () => { this.activeEffects--; notificationText.destroy(); } });
     }
 
     /**
@@ -1145,11 +1310,14 @@ export class MainScene extends Phaser.Scene {
 
     /**
      * Checks for and triggers spontaneous, "proactive" behaviors based on the pet's state.
+     * @param {number} [elapsed] - Milliseconds covered by this check; the odds scale so the
+     *        behavior's frequency does not depend on how often the check runs.
      */
-    checkProactiveBehaviors() {
+    checkProactiveBehaviors(elapsed = FRAME_MS) {
         if (this.thoughtBubble.visible || this.exploreBubble.visible) return;
 
-        if (this.nadagotchi.mood === 'happy' && this.nadagotchi.dominantArchetype === 'Adventurer' && Phaser.Math.Between(1, 750) === 1) {
+        const odds = Math.max(1, Math.round(750 * FRAME_MS / elapsed));
+        if (this.nadagotchi.mood === 'happy' && this.nadagotchi.dominantArchetype === 'Adventurer' && Phaser.Math.Between(1, odds) === 1) {
             this.exploreBubble.setVisible(true);
             this.time.delayedCall(2000, () => this.exploreBubble.setVisible(false));
         }
@@ -1158,8 +1326,9 @@ export class MainScene extends Phaser.Scene {
     /**
      * Updates autonomous pet movement when Indoors.
      * @param {number} time - Current game time.
+     * @param {number} [elapsed] - Milliseconds covered by this check; scales the per-frame trigger chance.
      */
-    updatePetMovement(time) {
+    updatePetMovement(time, elapsed = FRAME_MS) {
         // Only move autonomously if Indoors
         if (this.location !== 'INDOOR') {
             this.isMoving = false;
@@ -1177,6 +1346,7 @@ export class MainScene extends Phaser.Scene {
         let chance = 100; // Base 1 in 100
         if (this.nadagotchi.mood === 'happy') chance = 50;
         if (this.nadagotchi.mood === 'sad') chance = 300; // Lethargic
+        chance = Math.max(1, Math.round(chance * FRAME_MS / elapsed));
 
         if (Phaser.Math.Between(1, chance) === 1) {
             const width = this.cameras.main.width;
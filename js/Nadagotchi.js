@@ -7,6 +7,7 @@ import { Recipes } from './ItemData.js';
 import { CareerDefinitions } from './CareerDefinitions.js';
 import { RoomDefinitions } from './RoomDefinitions.js';
 import { SeededRandom } from './utils/SeededRandom.js';
+import { RingBuffer } from './utils/RingBuffer.js';
 import { RelationshipSystem } from './systems/RelationshipSystem.js';
 import { InventorySystem } from './systems/InventorySystem.js';
 import { QuestSystem } from './systems/QuestSystem.js';
@@ -237,7 +238,8 @@ export class Nadagotchi {
     _initCoreSystems() {
         this.newCareerUnlocked = null;
         this.persistence = new PersistenceManager();
-        this.journal = [];
+        this._journalBuffer = new RingBuffer(Config.LIMITS.MAX_JOURNAL_ENTRIES || 100);
+        this._pendingJournalEntries = [];
         this.discoveredRecipes = [];
         this.recipes = Recipes;
     }
@@ -1216,27 +1218,42 @@ export class Nadagotchi {
         }
     }
 
+    /**
+     * The most recent journal entries (oldest first), capped at `Config.LIMITS.MAX_JOURNAL_ENTRIES`.
+     * Returns a snapshot copy of the in-memory ring buffer; use `addJournalEntry` to add entries.
+     * @type {Array<object>}
+     */
+    get journal() {
+        return this._journalBuffer.toArray();
+    }
+
+    /**
+     * Replaces the in-memory journal (e.g. after loading from persistence).
+     * @param {Array<object>} entries - The entries, oldest first.
+     */
+    set journal(entries) {
+        this._journalBuffer.reset(entries || []);
+    }
+
     /**
      * Adds a new entry to the journal and saves it to persistence.
-     * Caps the journal size and batches saves to optimize performance.
+     * The in-memory journal is a ring buffer, and persistence appends only the new entries
+     * (batched per microtask) to the chunked journal log.
      * @param {string} text - The content of the journal entry.
      */
     addJournalEntry(text) {
         const newEntry = { date: new Date().toLocaleString(), text: text };
-        this.journal.push(newEntry);
-
-        // Cap the journal growth
-        const limit = Config.LIMITS.MAX_JOURNAL_ENTRIES || 100;
-        if (this.journal.length > limit) {
-            this.journal = this.journal.slice(-limit);
-        }
+        this._journalBuffer.push(newEntry);
+        this._pendingJournalEntries.push(newEntry);
 
-        // Batch serialization and persistence to reduce frequency
+        // Batch persistence to reduce frequency
         if (!this._journalSavePending) {
             this._journalSavePending = true;
             const performSave = async () => {
-                await this.persistence.saveJournal(this.journal);
+                const batch = this._pendingJournalEntries;
+                this._pendingJournalEntries = [];
                 this._journalSavePending = false;
+                await this.persistence.appendJournal(batch);
             };
 
             // Use queueMicrotask or Promise for efficient batching
@@ -5,6 +5,11 @@
 
 import { toBase64, fromBase64 } from './utils/Encoding.js';
 import { CryptoUtils } from './utils/CryptoUtils.js';
+import { Config } from './Config.js';
+
+const JOURNAL_LEGACY_KEY = "nadagotchi_journal";
+const JOURNAL_META_KEY = "nadagotchi_journal_meta";
+const JOURNAL_CHUNK_PREFIX = "nadagotchi_journal_chunk_";
 
 /**
  * PersistenceManager handles saving and loading game data.
@@ -19,6 +24,14 @@ export class PersistenceManager {
         this._saveTimer = null;
         /** @type {boolean} Whether the pending timer is an idle callback. */
         this._isIdleCallback = false;
+        /** @type {?{head: number, tail: number, count: number}} Cached journal log metadata (oldest and newest chunk sequence numbers, stored entries). */
+        this._journalMeta = null;
+        /** @type {?string} Raw stored metadata the cache was built from; a mismatch means another instance wrote the journal. */
+        this._journalMetaRaw = null;
+        /** @type {?Array<object>} Cached entries of the newest (writable) journal chunk. */
+        this._journalTail = null;
+        /** @type {Promise<void>} Serializes journal writes so batches land in order. */
+        this._journalQueue = Promise.resolve();
     }
 
     /**
@@ -143,9 +156,13 @@ export class PersistenceManager {
 
         keysToRemove.forEach(key => localStorage.removeItem(key));
         this.lastSavedJson = {};
+        this._journalMeta = null;
+        this._journalMetaRaw = null;
+        this._journalTail = null;
         const keysToClear = [
             "nadagotchi_save",
             "nadagotchi_journal",
+            "nadagotchi_journal_meta",
             "nadagotchi_recipes",
             "nadagotchi_calendar",
             "nadagotchi_furniture",
@@ -164,20 +181,263 @@ export class PersistenceManager {
     }
 
     /**
-     * Saves the player's journal entries to localStorage.
-     * @param {Array<object>} journalEntries - The array of journal entries to save.
+     * Replaces the whole journal with the given entries.
+     * Rewrites the chunked log from scratch; prefer `appendJournal` for new entries.
+     * @param {Array<object>} journalEntries - The array of journal entries to save (oldest first).
      * @returns {Promise<void>}
      */
     async saveJournal(journalEntries) {
-        await this._save("nadagotchi_journal", journalEntries);
+        const run = () => this._rewriteJournal(journalEntries || []);
+        this._journalQueue = this._journalQueue.then(run, run);
+        await this._journalQueue;
+    }
+
+    /**
+     * Appends entries to the journal log.
+     * Only the newest chunk and the small metadata record are re-serialized and re-hashed,
+     * so the cost of a write is bounded by `Config.JOURNAL.CHUNK_SIZE` rather than the journal length.
+     * @param {Array<object>} entries - The new entries, oldest first.
+     * @returns {Promise<void>}
+     */
+    async appendJournal(entries) {
+        if (!entries || entries.length === 0) return;
+        const run = () => this._appendJournalEntries(entries);
+        this._journalQueue = this._journalQueue.then(run, run);
+        await this._journalQueue;
     }
 
     /**
-     * Loads the player's journal entries from localStorage.
-     * @returns {Promise<Array<object>>} The array of journal entries, or empty array if none found.
+     * Loads the most recent journal entries (up to `Config.LIMITS.MAX_JOURNAL_ENTRIES`).
+     * Archived chunks are not included; use `loadJournalPage` to browse them.
+     * @returns {Promise<Array<object>>} The array of journal entries (oldest first), or empty array if none found.
      */
     async loadJournal() {
-        return (await this._load("nadagotchi_journal")) || [];
+        const meta = await this._readJournalMeta();
+        const limit = Config.LIMITS.MAX_JOURNAL_ENTRIES;
+        const chunks = [];
+        let count = 0;
+        for (let seq = meta.tail; seq >= meta.head && count < limit; seq--) {
+            const chunk = await this._loadJournalChunk(seq);
+            chunks.push(chunk);
+            count += chunk.length;
+        }
+        const entries = [];
+        for (let i = chunks.length - 1; i >= 0; i--) {
+            for (const entry of chunks[i]) entries.push(entry);
+        }
+        return entries.length > limit ? entries.slice(entries.length - limit) : entries;
+    }
+
+    /**
+     * Loads one page of journal entries, newest first, walking back through the chunked log.
+     * Archived chunks are included when `Config.JOURNAL.ARCHIVE_OLD_CHUNKS` is set; otherwise paging
+     * stops after the newest `Config.LIMITS.MAX_JOURNAL_ENTRIES`, matching `loadJournal`.
+     * @param {?{chunk: number, index: ?number, offset: number}} [cursor=null] - The cursor returned by a previous call, or null for the newest page.
+     * @param {number} [limit=Config.JOURNAL.PAGE_SIZE] - Maximum number of entries to return.
+     * @returns {Promise<{entries: Array<object>, nextCursor: ?{chunk: number, index: ?number, offset: number}, total: number}>}
+     *          The page, the cursor for the next (older) page (null when there are no older entries) and the
+     *          number of entries reachable by paging.
+     */
+    async loadJournalPage(cursor = null, limit = Config.JOURNAL.PAGE_SIZE) {
+        const meta = await this._readJournalMeta();
+        const entries = [];
+        let seq = cursor ? cursor.chunk : meta.tail;
+        let index = cursor ? cursor.index : null;
+        const offset = (cursor && cursor.offset) || 0;
+
+        // Without archiving, the live window can hold up to a chunk more than loadJournal returns
+        const reachable = Config.JOURNAL.ARCHIVE_OLD_CHUNKS ? meta.count : Math.min(meta.count, Config.LIMITS.MAX_JOURNAL_ENTRIES);
+        const remaining = Config.JOURNAL.ARCHIVE_OLD_CHUNKS ? Infinity : Config.LIMITS.MAX_JOURNAL_ENTRIES - offset;
+        const pageLimit = Math.min(limit, remaining);
+        const page = (nextCursor) => ({ entries, nextCursor, total: reachable });
+        if (pageLimit <= 0) return page(null);
+
+        while (seq >= meta.head) {
+            const chunk = await this._loadJournalChunk(seq);
+            let i = index === null ? chunk.length : Math.min(index, chunk.length);
+            while (i > 0 && entries.length < pageLimit) {
+                entries.push(chunk[--i]);
+            }
+            if (entries.length >= pageLimit) {
+                const nextOffset = offset + entries.length;
+                if (entries.length >= remaining) return page(null);
+                if (i > 0) return page({ chunk: seq, index: i, offset: nextOffset });
+                return page(seq > meta.head ? { chunk: seq - 1, index: null, offset: nextOffset } : null);
+            }
+            seq--;
+            index = null;
+        }
+        return page(null);
+    }
+
+    /**
+     * Appends entries to the tail chunk, rolling over to new chunks as they fill.
+     * @param {Array<object>} entries - The new entries.
+     * @returns {Promise<void>}
+     * @private
+     */
+    async _appendJournalEntries(entries) {
+        // Another PersistenceManager (or a hard reset) changed the log since we cached it
+        if (this._journalMeta && localStorage.getItem(JOURNAL_META_KEY) !== this._journalMetaRaw) {
+            this._invalidateJournalCache();
+        }
+        if (!this._journalMeta) {
+            this._journalMeta = await this._readJournalMeta();
+            this._journalTail = null;
+        }
+        const meta = this._journalMeta;
+        if (!this._journalTail) {
+            this._journalTail = await this._loadJournalChunk(meta.tail);
+        }
+
+        // Chunks are written before the metadata, so a crash in between leaves an
+        // unreferenced chunk that _readJournalMeta adopts on the next read.
+        const chunkSize = Config.JOURNAL.CHUNK_SIZE;
+        for (const entry of entries) {
+            if (this._journalTail.length >= chunkSize) {
+                await this._save(JOURNAL_CHUNK_PREFIX + meta.tail, this._journalTail);
+                meta.tail++;
+                this._journalTail = [];
+            }
+            this._journalTail.push(entry);
+            meta.count++;
+        }
+        await this._save(JOURNAL_CHUNK_PREFIX + meta.tail, this._journalTail);
+
+        this._pruneJournalChunks(meta);
+        await this._saveJournalMeta(meta);
+    }
+
+    /**
+     * Rewrites the chunked log to contain exactly the given entries.
+     * @param {Array<object>} entries - All journal entries, oldest first.
+     * @param {?{head: number, tail: number}} [previous=null] - The metadata of the log being replaced (read from storage if omitted).
+     * @returns {Promise<void>}
+     * @private
+     */
+    async _rewriteJournal(entries, previous = null) {
+        previous = previous || await this._readJournalMeta();
+        for (let seq = previous.head; seq <= previous.tail; seq++) {
+            this._removeJournalChunk(seq);
+        }
+
+        const chunkSize = Config.JOURNAL.CHUNK_SIZE;
+        const meta = { head: 0, tail: 0, count: entries.length };
+        let tail = [];
+        for (let i = 0; i < entries.length; i += chunkSize) {
+            meta.tail = i / chunkSize;
+            tail = entries.slice(i, i + chunkSize);
+            await this._save(JOURNAL_CHUNK_PREFIX + meta.tail, tail);
+        }
+        this._pruneJournalChunks(meta);
+        await this._saveJournalMeta(meta);
+        this._journalMeta = meta;
+        this._journalTail = tail;
+    }
+
+    /**
+     * Writes the journal metadata and remembers the stored form, so later appends can tell
+     * whether another instance has written the log since.
+     * @param {{head: number, tail: number, count: number}} meta - The log metadata.
+     * @returns {Promise<void>}
+     * @private
+     */
+    async _saveJournalMeta(meta) {
+        await this._save(JOURNAL_META_KEY, meta);
+        this._journalMetaRaw = localStorage.getItem(JOURNAL_META_KEY);
+    }
+
+    /**
+     * Drops the cached journal metadata and tail chunk so the next append re-reads storage.
+     * @private
+     */
+    _invalidateJournalCache() {
+        this._journalMeta = null;
+        this._journalMetaRaw = null;
+        this._journalTail = null;
+        Object.keys(this.lastSavedJson).forEach(key => {
+            if (key === JOURNAL_META_KEY || key.startsWith(JOURNAL_CHUNK_PREFIX)) delete this.lastSavedJson[key];
+        });
+    }
+
+    /**
+     * Drops (or archives) chunks that fall outside the live window.
+     * The live window keeps enough chunks to always cover `Config.LIMITS.MAX_JOURNAL_ENTRIES`.
+     * When `Config.JOURNAL.ARCHIVE_OLD_CHUNKS` is set, old chunks are kept in storage and stay
+     * reachable through `loadJournalPage`.
+     * @param {{head: number, tail: number, count: number}} meta - The log metadata (mutated in place).
+     * @returns {boolean} True if the metadata changed.
+     * @private
+     */
+    _pruneJournalChunks(meta) {
+        if (Config.JOURNAL.ARCHIVE_OLD_CHUNKS) return false;
+        const chunkSize = Config.JOURNAL.CHUNK_SIZE;
+        const liveChunks = Math.ceil(Config.LIMITS.MAX_JOURNAL_ENTRIES / chunkSize) + 1;
+        const oldestLive = meta.tail - liveChunks + 1;
+        if (meta.head >= oldestLive) return false;
+        for (let seq = meta.head; seq < oldestLive; seq++) {
+            this._removeJournalChunk(seq);
+        }
+        // Only the tail chunk is ever partially filled
+        meta.count = Math.max(0, meta.count - (oldestLive - meta.head) * chunkSize);
+        meta.head = oldestLive;
+        return true;
+    }
+
+    /**
+     * Reads the journal log metadata, migrating a legacy single-key journal on first use.
+     * Chunks written after the metadata's tail (an append interrupted before its metadata
+     * write) are adopted, so the next append does not overwrite them.
+     * @returns {Promise<{head: number, tail: number, count: number}>}
+     * @private
+     */
+    async _readJournalMeta() {
+        let meta = await this._load(JOURNAL_META_KEY);
+        if (!meta || !Number.isInteger(meta.head) || !Number.isInteger(meta.tail)) {
+            // Migration: Legacy journals were stored as one array under a single key
+            const legacy = await this._load(JOURNAL_LEGACY_KEY);
+            if (Array.isArray(legacy) && legacy.length > 0) {
+                await this._rewriteJournal(legacy, { head: 0, tail: -1 });
+                localStorage.removeItem(JOURNAL_LEGACY_KEY);
+                delete this.lastSavedJson[JOURNAL_LEGACY_KEY];
+                return { ...this._journalMeta };
+            }
+            meta = { head: 0, tail: 0 };
+        }
+
+        let adopted = false;
+        while (localStorage.getItem(JOURNAL_CHUNK_PREFIX + (meta.tail + 1)) !== null) {
+            meta.tail++;
+            adopted = true;
+        }
+        if (adopted || !Number.isInteger(meta.count)) {
+            // Only the tail chunk is ever partially filled
+            const tailCount = (await this._loadJournalChunk(meta.tail)).length;
+            meta.count = (meta.tail - meta.head) * Config.JOURNAL.CHUNK_SIZE + tailCount;
+        }
+        return meta;
+    }
+
+    /**
+     * Loads a single journal chunk. Each chunk carries its own integrity hash,
+     * so a corrupted chunk only loses its own entries.
+     * @param {number} seq - The chunk sequence number.
+     * @returns {Promise<Array<object>>} The chunk entries, or empty array if missing or invalid.
+     * @private
+     */
+    async _loadJournalChunk(seq) {
+        const chunk = await this._load(JOURNAL_CHUNK_PREFIX + seq);
+        return Array.isArray(chunk) ? chunk : [];
+    }
+
+    /**
+     * Removes a journal chunk from storage.
+     * @param {number} seq - The chunk sequence number.
+     * @private
+     */
+    _removeJournalChunk(seq) {
+        localStorage.removeItem(JOURNAL_CHUNK_PREFIX + seq);
+        delete this.lastSavedJson[JOURNAL_CHUNK_PREFIX + seq];
     }
 
     /**
@@ -1,5 +1,6 @@
 import { ToastManager } from './systems/ToastManager.js';
 import { ButtonFactory } from './ButtonFactory.js';
+import { VirtualList } from './VirtualList.js';
 import { PersistenceManager } from './PersistenceManager.js';
 import { WikiUI } from "./WikiUI.js";
 import { NarrativeSystem } from './NarrativeSystem.js';
@@ -31,6 +32,7 @@ export class UIScene extends Phaser.Scene {
         this.tabButtons = [];
         this.actionButtons = [];
         this.allModals = [];
+        this.modalLists = {};
         this.toastManager = new ToastManager(this);
 
         this.dashboardBg = this.add.rectangle(0, 0, 1, 1, 0xA3B8A2).setOrigin(0);
@@ -395,37 +397,6 @@ export class UIScene extends Phaser.Scene {
     this.scene.pause("MainScene");
   }
 
-  changeJournalPage(delta) {
-    const modal = this.journalModal;
-    const totalPages =
-      Math.ceil(modal.entries.length / modal.entriesPerPage) || 1;
-    let newPage = modal.currentPage + delta;
-    if (newPage < 0) newPage = 0;
-    if (newPage >= totalPages) newPage = totalPages - 1;
-    modal.currentPage = newPage;
-    this.updateJournalPage();
-  }
-
-  updateJournalPage() {
-    const modal = this.journalModal;
-    const totalPages =
-      Math.ceil(modal.entries.length / modal.entriesPerPage) || 1;
-    const start = modal.currentPage * modal.entriesPerPage;
-    const pageEntries = modal.entries.slice(
-      start,
-      start + modal.entriesPerPage,
-    );
-    const text = pageEntries.length
-      ? pageEntries.map((e) => `[${e.date}]\n${e.text}`).join("\n\n---\n\n")
-      : "No entries yet.";
-    modal.content.setText(text);
-    modal.pageIndicator.setText(`${modal.currentPage + 1}/${totalPages}`);
-    modal.btnPrev.setDisabled(modal.currentPage === 0);
-    modal.btnNext.setDisabled(modal.currentPage >= totalPages - 1);
-    modal.btnPrev.setAlpha(modal.currentPage === 0 ? 0.5 : 1);
-    modal.btnNext.setAlpha(modal.currentPage >= totalPages - 1 ? 0.5 : 1);
-  }
-
     showDialogue(npcName, dialogueData) {
         this.closeAllModals();
         let text = "";
@@ -452,14 +423,9 @@ export class UIScene extends Phaser.Scene {
         this.dialogueModal.setVisible(true);
         this.scene.pause('MainScene');
     }
-    async openJournal() { this.closeAllModals(); const entries = await this.persistence.loadJournal(); const modal = this.journalModal; modal.entries = entries.slice().reverse(); modal.currentPage = 0; modal.entriesPerPage = 3; if (!modal.navButtons) { const mw = this.getModalWidth(); const mh = this.getModalHeight(); const yPos = mh/2 - 40; modal.btnPrev = ButtonFactory.createButton(this, -80, yPos, "< Prev", () => this.changeJournalPage(-1), { width: 80, height: 30 }); modal.btnNext = ButtonFactory.createButton(this, 80, yPos, "Next >", () => this.changeJournalPage(1), { width: 80, height: 30 }); modal.pageIndicator = this.add.text(0, yPos, "1/1", { fontFamily: 'VT323', fontSize: '20px' }).setOrigin(0.5); modal.add([modal.btnPrev, modal.btnNext, modal.pageIndicator]); modal.navButtons = true; } this.updateJournalPage(); this.journalModal.setVisible(true); this.scene.pause('MainScene'); }
-    changeJournalPage(delta) { const modal = this.journalModal; const totalPages = Math.ceil(modal.entries.length / modal.entriesPerPage) || 1; let newPage = modal.currentPage + delta; if (newPage < 0) newPage = 0; if (newPage >= totalPages) newPage = totalPages - 1; modal.currentPage = newPage; this.updateJournalPage(); }
-    updateJournalPage() { const modal = this.journalModal; const totalPages = Math.ceil(modal.entries.length / modal.entriesPerPage) || 1; const start = modal.currentPage * modal.entriesPerPage; const pageEntries = modal.entries.slice(start, start + modal.entriesPerPage); const text = pageEntries.length ? pageEntries.map(e => `[${e.date}]\n${e.text}`).join('\n\n---\n\n') : "No entries yet."; modal.content.setText(text); modal.pageIndicator.setText(`${modal.currentPage + 1}/${totalPages}`); modal.btnPrev.setDisabled(modal.currentPage === 0); modal.btnNext.setDisabled(modal.currentPage >= totalPages - 1); modal.btnPrev.setAlpha(modal.currentPage === 0 ? 0.5 : 1); modal.btnNext.setAlpha(modal.currentPage >= totalPages - 1 ? 0.5 : 1); }
     async openRecipeBook() { this.closeAllModals(); const discovered = (this.nadagotchiData && this.nadagotchiData.discoveredRecipes) || await this.persistence.loadRecipes(); const allRecipes = (this.nadagotchiData && this.nadagotchiData.recipes) || {}; let text = (!discovered || discovered.length === 0) ? "No recipes discovered yet." : "Discovered Recipes:\n\n" + discovered.map(name => { const r = allRecipes[name]; return r ? `• ${name}\n  "${r.description}"\n  Req: ${Object.entries(r.materials).map(([m,c]) => `${c} ${m}`).join(', ')}` : `• ${name}`; }).join('\n\n'); this.recipeModal.content.setText(text); this.recipeModal.setVisible(true); this.scene.pause('MainScene'); }
     openHobbyMenu() { this.closeAllModals(); if (!this.nadagotchiData) return; this.hobbyModal.content.setText(Object.entries(this.nadagotchiData.hobbies).map(([h, l]) => `${h}: Level ${l}`).join('\n')); this.hobbyModal.setVisible(true); this.scene.pause('MainScene'); }
     openRelationshipMenu() { this.closeAllModals(); if (!this.nadagotchiData) return; this.relationshipModal.content.setText(Object.entries(this.nadagotchiData.relationships).map(([n, d]) => `${n}: Friendship ${d.level}`).join('\n')); this.relationshipModal.setVisible(true); this.scene.pause('MainScene'); }
-    openDecorateMenu() { this.closeAllModals(); if (!this.nadagotchiData) return; if (this.decorateButtons) this.decorateButtons.forEach(btn => btn.destroy()); this.decorateButtons = []; const mw = this.getModalWidth(); const startX = mw / 2 - 80; let yPos = -this.getModalHeight() / 2 + 100; const validTypes = ['FURNITURE', 'WALLPAPER', 'FLOORING']; const furniture = Object.entries(this.nadagotchiData.inventory).filter(([item, count]) => { const def = ItemDefinitions[item]; return def && validTypes.includes(def.type) && count > 0; }); let text = "Select an item to place:\n\n" + (furniture.length === 0 ? "You have no furniture or decor." : ""); furniture.forEach(([itemName, count]) => { text += `- ${itemName}: ${count}\n`; const def = ItemDefinitions[itemName]; const isSurface = def && (def.type === 'WALLPAPER' || def.type === 'FLOORING'); const actionKey = isSurface ? EventKeys.APPLY_HOME_DECOR : EventKeys.PLACE_FURNITURE; const btnText = isSurface ? 'Apply' : 'Place'; const placeButton = ButtonFactory.createButton(this, startX + 40, yPos + 15, btnText, () => { this.game.events.emit(EventKeys.UI_ACTION, actionKey, itemName); this.decorateModal.setVisible(false); this.scene.resume('MainScene'); }, { width: 80, height: 30, color: 0x228B22 }); this.decorateModal.add(placeButton); this.decorateButtons.push(placeButton); yPos += 35; }); const moveBtnY = this.getModalHeight() / 2 - 60; const toggleBtn = ButtonFactory.createButton(this, 80, moveBtnY + 20, 'Move Furniture', () => { this.game.events.emit(EventKeys.UI_ACTION, EventKeys.TOGGLE_DECORATION_MODE); this.decorateModal.setVisible(false); this.scene.resume('MainScene'); }, { width: 160, height: 40, color: 0x4169E1 }); this.decorateModal.add(toggleBtn); this.decorateButtons.push(toggleBtn); this.decorateModal.content.setText(text); this.decorateModal.setVisible(true); this.scene.pause('MainScene'); }
-    openInventoryMenu() { this.closeAllModals(); if (!this.nadagotchiData) return; if (this.inventoryButtons) this.inventoryButtons.forEach(btn => btn.destroy()); this.inventoryButtons = []; if (this.inventoryTexts) this.inventoryTexts.forEach(t => t.destroy()); this.inventoryTexts = []; const items = Object.entries(this.nadagotchiData.inventory || {}); this.inventoryModal.content.setText(items.length === 0 ? "Empty." : ""); const mw = this.getModalWidth(); let currentY = -this.getModalHeight() / 2 + 60; const startX = -mw / 2 + 20; items.forEach(([itemName, count]) => { const def = ItemDefinitions[itemName] || { description: "Unknown", emoji: "❓", type: "Misc" }; const itemStr = `${def.emoji} ${itemName} (x${count})`; const itemText = this.add.text(startX, currentY, itemStr, { font: '20px monospace', color: '#ffffff' }); const descText = this.add.text(startX + 20, currentY + 25, def.description, { font: '16px monospace', color: '#aaaaaa', wordWrap: { width: mw - 150 } }); this.inventoryModal.add([itemText, descText]); this.inventoryTexts.push(itemText, descText); if (def.type === 'Consumable' && count > 0) { const useButton = ButtonFactory.createButton(this, (mw/2 - 60) + 30, (currentY + 10) + 15, 'Use', () => { this.game.events.emit(EventKeys.UI_ACTION, EventKeys.CONSUME_ITEM, itemName); this.inventoryModal.setVisible(false); this.scene.resume('MainScene'); }, { width: 60, height: 30, color: 0x228B22 }); this.inventoryModal.add(useButton); this.inventoryButtons.push(useButton); } currentY += 60; }); this.inventoryModal.setVisible(true); this.scene.pause('MainScene'); }
     openAncestorModal(ancestorData) { this.closeAllModals(); if (!ancestorData) return; const advice = NarrativeSystem.getAdvice(ancestorData.dominantArchetype); const text = `Name: Generation ${ancestorData.generation}\nArchetype: ${ancestorData.dominantArchetype}\nCareer: ${ancestorData.currentCareer || 'None'}\n\nStats:\nHappiness: ${Math.floor(ancestorData.stats.happiness)}\nLogic: ${ancestorData.skills.logic.toFixed(1)}\nEmpathy: ${ancestorData.skills.empathy.toFixed(1)}\n\nAdvice:\n"${advice}"`; this.ancestorModal.content.setText(text); this.ancestorModal.setVisible(true); this.scene.pause('MainScene'); }
     async openAchievementsModal() { this.closeAllModals(); const data = await this.persistence.loadAchievements(); const unlockedIds = data.unlocked || []; const text = Achievements.map(ach => unlockedIds.includes(ach.id) ? `${ach.icon} ${ach.name}\n${ach.description}` : `🔒 ${ach.name}\n(Locked)`).join('\n\n'); this.achievementsModal.content.setText(text); this.achievementsModal.setVisible(true); this.scene.pause('MainScene'); }
     openWikiMenu() { this.closeAllModals(); this.wikiUI.show(); this.scene.pause("MainScene"); }
@@ -540,135 +506,6 @@ export class UIScene extends Phaser.Scene {
     this.scene.pause("MainScene");
   }
 
-  openDecorateMenu() {
-    this.closeAllModals();
-    if (!this.nadagotchiData) return;
-    if (this.decorateButtons)
-      this.decorateButtons.forEach((btn) => btn.destroy());
-    this.decorateButtons = [];
-    const mw = this.getModalWidth();
-    const startX = mw / 2 - 80;
-    let yPos = -this.getModalHeight() / 2 + 100;
-    const validTypes = ["FURNITURE", "WALLPAPER", "FLOORING"];
-    const furniture = Object.entries(this.nadagotchiData.inventory).filter(
-      ([item, count]) => {
-        const def = ItemDefinitions[item];
-        return def && validTypes.includes(def.type) && count > 0;
-      },
-    );
-    let text =
-      "Select an item to place:\n\n" +
-      (furniture.length === 0 ? "You have no furniture or decor." : "");
-    furniture.forEach(([itemName, count]) => {
-      text += `- ${itemName}: ${count}\n`;
-      const def = ItemDefinitions[itemName];
-      const isSurface =
-        def && (def.type === "WALLPAPER" || def.type === "FLOORING");
-      const actionKey = isSurface
-        ? EventKeys.APPLY_HOME_DECOR
-        : EventKeys.PLACE_FURNITURE;
-      const btnText = isSurface ? "Apply" : "Place";
-      const placeButton = ButtonFactory.createButton(
-        this,
-        startX,
-        yPos,
-        btnText,
-        () => {
-          this.game.events.emit(EventKeys.UI_ACTION, actionKey, itemName);
-          this.decorateModal.setVisible(false);
-          this.scene.resume("MainScene");
-        },
-        { width: 80, height: 30, color: 0x228b22 },
-      );
-      this.decorateModal.add(placeButton);
-      this.decorateButtons.push(placeButton);
-      yPos += 35;
-    });
-    const moveBtnY = this.getModalHeight() / 2 - 60;
-    const toggleBtn = ButtonFactory.createButton(
-      this,
-      0,
-      moveBtnY,
-      "Move Furniture",
-      () => {
-        this.game.events.emit(
-          EventKeys.UI_ACTION,
-          EventKeys.TOGGLE_DECORATION_MODE,
-        );
-        this.decorateModal.setVisible(false);
-        this.scene.resume("MainScene");
-      },
-      { width: 160, height: 40, color: 0x4169e1 },
-    );
-    this.decorateModal.add(toggleBtn);
-    this.decorateButtons.push(toggleBtn);
-    this.decorateModal.content.setText(text);
-    this.decorateModal.setVisible(true);
-    this.scene.pause("MainScene");
-  }
-
-  openInventoryMenu() {
-    this.closeAllModals();
-    if (!this.nadagotchiData) return;
-    if (this.inventoryButtons)
-      this.inventoryButtons.forEach((btn) => btn.destroy());
-    this.inventoryButtons = [];
-    if (this.inventoryTexts) this.inventoryTexts.forEach((t) => t.destroy());
-    this.inventoryTexts = [];
-    const items = Object.entries(this.nadagotchiData.inventory || {});
-    this.inventoryModal.content.setText(items.length === 0 ? "Empty." : "");
-    const mw = this.getModalWidth();
-    let currentY = -this.getModalHeight() / 2 + 60;
-    const startX = -mw / 2 + 20;
-    items.forEach(([itemName, count]) => {
-      const def = ItemDefinitions[itemName] || {
-        description: "Unknown",
-        emoji: "❓",
-        type: "Misc",
-      };
-      const itemStr = `${def.emoji} ${itemName} (x${count})`;
-      const itemText = this.add.text(startX, currentY, itemStr, {
-        font: "20px monospace",
-        color: "#ffffff",
-      });
-      const descText = this.add.text(
-        startX + 20,
-        currentY + 25,
-        def.description,
-        {
-          font: "16px monospace",
-          color: "#aaaaaa",
-          wordWrap: { width: mw - 150 },
-        },
-      );
-      this.inventoryModal.add([itemText, descText]);
-      this.inventoryTexts.push(itemText, descText);
-      if (def.type === "Consumable" && count > 0) {
-        const useButton = ButtonFactory.createButton(
-          this,
-          mw / 2 - 60,
-          currentY + 10,
-          "Use",
-          () => {
-            this.game.events.emit(
-              EventKeys.UI_ACTION,
-              EventKeys.CONSUME_ITEM,
-              itemName,
-            );
-            this.inventoryModal.setVisible(false);
-            this.scene.resume("MainScene");
-          },
-          { width: 60, height: 30, color: 0x228b22 },
-        );
-        this.inventoryModal.add(useButton);
-        this.inventoryButtons.push(useButton);
-      }
-      currentY += 60;
-    });
-    this.inventoryModal.setVisible(true);
-    this.scene.pause("MainScene");
-  }
-
   openAncestorModal(ancestorData) {
     this.closeAllModals();
     if (!ancestorData) return;
@@ -824,8 +661,6 @@ export class UIScene extends Phaser.Scene {
     openSettingsMenu() { this.closeAllModals(); if (!this.settingsData) this.settingsData = { volume: Config.SETTINGS.DEFAULT_VOLUME, gameSpeed: Config.SETTINGS.DEFAULT_SPEED }; const vol = Math.round((this.settingsData.volume ?? 0.5) * 100); this.settingsModal.volDisplay.setText(`${vol}%`); this.updateSpeedButtons(this.settingsData.gameSpeed || 1.0); this.settingsModal.setVisible(true); this.scene.pause('MainScene'); }
     createShowcaseModal() { const modal = this.createModal("Pet Passport"); const passportContainer = this.add.container(this.cameras.main.width / 2, this.cameras.main.height / 2); modal.add(passportContainer); modal.passportContainer = passportContainer; return modal; }
     openShowcase() { this.closeAllModals(); if (!this.nadagotchiData) return; const container = this.showcaseModal.passportContainer; container.removeAll(true); const width = 400; const height = 250; const cardBg = this.add.rectangle(0, 0, width, height, 0xFFF8E7).setStrokeStyle(4, 0xD4AF37); const frame = Config.MOOD_VISUALS.FRAMES[this.nadagotchiData.mood] ?? Config.MOOD_VISUALS.DEFAULT_FRAME; const sprite = this.add.image(-120, 0, 'pet', frame).setScale(8); const name = `Archetype: ${this.nadagotchiData.dominantArchetype}`; const gen = `Generation: ${this.nadagotchiData.generation || 1}`; const career = `Career: ${this.nadagotchiData.currentCareer || 'Unemployed'}`; const age = `Age: ${Math.floor(this.nadagotchiData.age || 0)} Days`; const infoText = this.add.text(0, -60, `${name}\n${gen}\n${career}\n${age}`, { fontFamily: 'VT323, monospace', fontSize: '24px', color: '#000000', lineSpacing: 10 }).setOrigin(0, 0); const footer = this.add.text(0, 80, "OFFICIAL NADAGOTCHI PASSPORT", { fontFamily: 'Arial', fontSize: '12px', color: '#888888', fontStyle: 'italic' }).setOrigin(0.5); container.add([cardBg, sprite, infoText, footer]); this.showcaseModal.setVisible(true); this.scene.pause('MainScene'); }
-    openCareerMenu() { this.closeAllModals(); if (!this.nadagotchiData) return; const container = this.careerModal; if (this.careerDynamicItems) { this.careerDynamicItems.forEach(i => i.destroy()); } this.careerDynamicItems = []; const mw = this.getModalWidth(); const mh = this.getModalHeight(); let yPos = -mh / 2 + 80; const career = this.nadagotchiData.currentCareer; let infoText = ""; if (career) { const level = this.nadagotchiData.careerLevels[career] || 1; const xp = this.nadagotchiData.careerXP[career] || 0; const title = CareerDefinitions.TITLES[career] ? CareerDefinitions.TITLES[career][level] : 'Employee'; const nextThreshold = CareerDefinitions.XP_THRESHOLDS[level + 1] || 'MAX'; const payBonus = (Config.CAREER.LEVEL_MULTIPLIERS[level] - 1) * 100; infoText = `Current Job: ${career}\nTitle: ${title} (Lvl ${level})\nXP: ${xp} / ${nextThreshold}\nBonuses: +${Math.round(payBonus)}% Efficiency`; } else { infoText = "No Active Career.\nStudy or Explore to unlock paths!"; } const statsText = this.add.text(0, yPos, infoText, { fontFamily: 'VT323, monospace', fontSize: '24px', color: '#ffffff', align: 'center', wordWrap: { width: mw - 60 } }).setOrigin(0.5, 0); container.add(statsText); this.careerDynamicItems.push(statsText); yPos += 140; const listTitle = this.add.text(0, yPos, "Unlocked Career Paths:", { fontFamily: 'VT323', fontSize: '20px', color: '#AAAAAA' }).setOrigin(0.5); container.add(listTitle); this.careerDynamicItems.push(listTitle); yPos += 30; const unlocked = this.nadagotchiData.unlockedCareers || []; if (unlocked.length === 0) { const noneText = this.add.text(0, yPos, "(None yet)", { fontFamily: 'VT323', fontSize: '18px', color: '#888' }).setOrigin(0.5); container.add(noneText); this.careerDynamicItems.push(noneText); } else { unlocked.forEach(c => { const isCurrent = c === career; const lvl = this.nadagotchiData.careerLevels[c] || 1; const label = `${c} (Lvl ${lvl})`; const rowText = this.add.text(-mw/2 + 60, yPos + 10, label, { fontFamily: 'VT323', fontSize: '24px', color: isCurrent ? '#00FF00' : '#FFF' }); container.add(rowText); this.careerDynamicItems.push(rowText); if (!isCurrent) { const switchBtn = ButtonFactory.createButton(this, (mw/2 - 80) + 40, (yPos + 20) + 15, "Switch", () => { this.game.events.emit(EventKeys.UI_ACTION, EventKeys.SWITCH_CAREER, c); container.setVisible(false); this.scene.resume('MainScene'); }, { width: 80, height: 30, color: 0x4CAF50, fontSize: '18px' }); container.add(switchBtn); this.careerDynamicItems.push(switchBtn); } else { const activeLbl = this.add.text(mw/2 - 80, yPos + 10, "[Active]", { fontFamily: 'VT323', fontSize: '18px', color: '#00FF00' }); container.add(activeLbl); this.careerDynamicItems.push(activeLbl); } yPos += 45; }); } container.setVisible(true); this.scene.pause('MainScene'); }
-    openJobBoardMenu() { this.closeAllModals(); if (!this.nadagotchiData) return; const container = this.jobBoardModal; if (this.jobBoardDynamicItems) { this.jobBoardDynamicItems.forEach(i => i.destroy()); } this.jobBoardDynamicItems = []; const career = this.nadagotchiData.currentCareer; let text = ""; if (career) { text = `Active Assignment:\n${career}`; } else { text = "No Active Career Assignment."; } const infoText = this.add.text(0, -50, text, { fontFamily: 'VT323', fontSize: '32px', color: '#FFF', align: 'center' }).setOrigin(0.5); container.add(infoText); this.jobBoardDynamicItems.push(infoText); const startBtn = ButtonFactory.createButton(this, 80, 55, "Start Shift", () => { if (career) { this.game.events.emit(EventKeys.UI_ACTION, EventKeys.WORK); container.setVisible(false); } else { this.showToast("No Job", "Select a career first!", "🚫"); } }, { width: 160, height: 50, color: career ? 0x6A0DAD : 0x555555, fontSize: '24px' }); if (!career) startBtn.setDisabled(true); container.add(startBtn); this.jobBoardDynamicItems.push(startBtn); const careerBtn = ButtonFactory.createButton(this, 80, 120, "Career Profiles", () => { this.openCareerMenu(); }, { width: 160, height: 40, color: 0xD8A373, fontSize: '20px' }); container.add(careerBtn); this.jobBoardDynamicItems.push(careerBtn); container.setVisible(true); this.scene.pause('MainScene'); }
 //     const steps = [
 //       {
 //         text: "These are your pet's STATS.\nKeep an eye on Hunger and Energy!",
@@ -893,14 +728,166 @@ export class UIScene extends Phaser.Scene {
         this.dialogueModal.setVisible(true);
         this.scene.pause('MainScene');
     }
-    async openJournal() { this.closeAllModals(); const entries = await this.persistence.loadJournal(); const modal = this.journalModal; modal.entries = entries.slice().reverse(); modal.currentPage = 0; modal.entriesPerPage = 3; if (!modal.navButtons) { const mw = this.getModalWidth(); const mh = this.getModalHeight(); const yPos = mh/2 - 40; modal.btnPrev = ButtonFactory.createButton(this, -80, yPos, "< Prev", () => this.changeJournalPage(-1), { width: 80, height: 30 }); modal.btnNext = ButtonFactory.createButton(this, 80, yPos, "Next >", () => this.changeJournalPage(1), { width: 80, height: 30 }); modal.pageIndicator = this.add.text(0, yPos, "1/1", { fontFamily: 'VT323', fontSize: '20px' }).setOrigin(0.5); modal.add([modal.btnPrev, modal.btnNext, modal.pageIndicator]); modal.navButtons = true; } this.updateJournalPage(); this.journalModal.setVisible(true); this.scene.pause('MainScene'); }
-    changeJournalPage(delta) { const modal = this.journalModal; const totalPages = Math.ceil(modal.entries.length / modal.entriesPerPage) || 1; let newPage = modal.currentPage + delta; if (newPage < 0) newPage = 0; if (newPage >= totalPages) newPage = totalPages - 1; modal.currentPage = newPage; this.updateJournalPage(); }
-    updateJournalPage() { const modal = this.journalModal; const totalPages = Math.ceil(modal.entries.length / modal.entriesPerPage) || 1; const start = modal.currentPage * modal.entriesPerPage; const pageEntries = modal.entries.slice(start, start + modal.entriesPerPage); const text = pageEntries.length ? pageEntries.map(e => `[${e.date}]\n${e.text}`).join('\n\n---\n\n') : "No entries yet."; modal.content.setText(text); modal.pageIndicator.setText(`${modal.currentPage + 1}/${totalPages}`); modal.btnPrev.setDisabled(modal.currentPage === 0); modal.btnNext.setDisabled(modal.currentPage >= totalPages - 1); modal.btnPrev.setAlpha(modal.currentPage === 0 ? 0.5 : 1); modal.btnNext.setAlpha(modal.currentPage >= totalPages - 1 ? 0.5 : 1); }
+    async openJournal() {
+        this.closeAllModals();
+        const modal = this.journalModal;
+        if (!modal.navButtons) {
+            const yPos = this.getModalHeight() / 2 - 40;
+            modal.btnPrev = ButtonFactory.createButton(this, -80, yPos, "< Prev", () => this.changeJournalPage(-1), { width: 80, height: 30 });
+            modal.btnNext = ButtonFactory.createButton(this, 80, yPos, "Next >", () => this.changeJournalPage(1), { width: 80, height: 30 });
+            modal.pageIndicator = this.add.text(0, yPos, "1", { fontFamily: 'VT323', fontSize: '20px' }).setOrigin(0.5);
+            modal.add([modal.btnPrev, modal.btnNext, modal.pageIndicator]);
+            modal.navButtons = true;
+        }
+        // Cursor of the first entry on each visited page; index 0 is the newest page.
+        modal.pageCursors = [null];
+        modal.currentPage = 0;
+        modal.nextCursor = null;
+        await this.updateJournalPage();
+        modal.setVisible(true);
+        this.scene.pause('MainScene');
+    }
+
+    async changeJournalPage(delta) {
+        const modal = this.journalModal;
+        if (delta > 0) {
+            if (!modal.nextCursor) return;
+            modal.pageCursors[modal.currentPage + 1] = modal.nextCursor;
+            modal.currentPage++;
+        } else if (delta < 0) {
+            if (modal.currentPage === 0) return;
+            modal.currentPage--;
+        }
+        await this.updateJournalPage();
+    }
+
+    async updateJournalPage() {
+        const modal = this.journalModal;
+        const { entries, nextCursor, total } = await this.persistence.loadJournalPage(modal.pageCursors[modal.currentPage], Config.JOURNAL.PAGE_SIZE);
+        const totalPages = Math.max(1, Math.ceil((total || 0) / Config.JOURNAL.PAGE_SIZE));
+        modal.nextCursor = nextCursor;
+        const text = entries.length ? entries.map(e => `[${e.date}]\n${e.text}`).join('\n\n---\n\n') : "No entries yet.";
+        modal.content.setText(text);
+        modal.pageIndicator.setText(`${modal.currentPage + 1}/${totalPages}`);
+        modal.btnPrev.setDisabled(modal.currentPage === 0);
+        modal.btnNext.setDisabled(!nextCursor);
+        modal.btnPrev.setAlpha(modal.currentPage === 0 ? 0.5 : 1);
+        modal.btnNext.setAlpha(!nextCursor ? 0.5 : 1);
+    }
     async openRecipeBook() { this.closeAllModals(); const discovered = (this.nadagotchiData && this.nadagotchiData.discoveredRecipes) || await this.persistence.loadRecipes(); const allRecipes = (this.nadagotchiData && this.nadagotchiData.recipes) || {}; let text = (!discovered || discovered.length === 0) ? "No recipes discovered yet." : "Discovered Recipes:\n\n" + discovered.map(name => { const r = allRecipes[name]; return r ? `• ${name}\n  "${r.description}"\n  Req: ${Object.entries(r.materials).map(([m,c]) => `${c} ${m}`).join(', ')}` : `• ${name}`; }).join('\n\n'); this.recipeModal.content.setText(text); this.recipeModal.setVisible(true); this.scene.pause('MainScene'); }
     openHobbyMenu() { this.closeAllModals(); if (!this.nadagotchiData) return; this.hobbyModal.content.setText(Object.entries(this.nadagotchiData.hobbies).map(([h, l]) => `${h}: Level ${l}`).join('\n')); this.hobbyModal.setVisible(true); this.scene.pause('MainScene'); }
     openRelationshipMenu() { this.closeAllModals(); if (!this.nadagotchiData) return; this.relationshipModal.content.setText(Object.entries(this.nadagotchiData.relationships).map(([n, d]) => `${n}: Friendship ${d.level}`).join('\n')); this.relationshipModal.setVisible(true); this.scene.pause('MainScene'); }
-    openDecorateMenu() { this.closeAllModals(); if (!this.nadagotchiData) return; if (this.decorateButtons) this.decorateButtons.forEach(btn => btn.destroy()); this.decorateButtons = []; const mw = this.getModalWidth(); const startX = mw / 2 - 80; let yPos = -this.getModalHeight() / 2 + 100; const validTypes = ['FURNITURE', 'WALLPAPER', 'FLOORING']; const furniture = Object.entries(this.nadagotchiData.inventory).filter(([item, count]) => { const def = ItemDefinitions[item]; return def && validTypes.includes(def.type) && count > 0; }); let text = "Select an item to place:\n\n" + (furniture.length === 0 ? "You have no furniture or decor." : ""); furniture.forEach(([itemName, count]) => { text += `- ${itemName}: ${count}\n`; const def = ItemDefinitions[itemName]; const isSurface = def && (def.type === 'WALLPAPER' || def.type === 'FLOORING'); const actionKey = isSurface ? EventKeys.APPLY_HOME_DECOR : EventKeys.PLACE_FURNITURE; const btnText = isSurface ? 'Apply' : 'Place'; const placeButton = ButtonFactory.createButton(this, startX, yPos, btnText, () => { this.game.events.emit(EventKeys.UI_ACTION, actionKey, itemName); this.decorateModal.setVisible(false); this.scene.resume('MainScene'); }, { width: 80, height: 30, color: 0x228B22 }); this.decorateModal.add(placeButton); this.decorateButtons.push(placeButton); yPos += 35; }); const moveBtnY = this.getModalHeight() / 2 - 60; const toggleBtn = ButtonFactory.createButton(this, 0, moveBtnY, 'Move Furniture', () => { this.game.events.emit(EventKeys.UI_ACTION, EventKeys.TOGGLE_DECORATION_MODE); this.decorateModal.setVisible(false); this.scene.resume('MainScene'); }, { width: 160, height: 40, color: 0x4169E1 }); this.decorateModal.add(toggleBtn); this.decorateButtons.push(toggleBtn); this.decorateModal.content.setText(text); this.decorateModal.setVisible(true); this.scene.pause('MainScene'); }
-    openInventoryMenu() { this.closeAllModals(); if (!this.nadagotchiData) return; if (this.inventoryButtons) this.inventoryButtons.forEach(btn => btn.destroy()); this.inventoryButtons = []; if (this.inventoryTexts) this.inventoryTexts.forEach(t => t.destroy()); this.inventoryTexts = []; const items = Object.entries(this.nadagotchiData.inventory || {}); this.inventoryModal.content.setText(items.length === 0 ? "Empty." : ""); const mw = this.getModalWidth(); let currentY = -this.getModalHeight() / 2 + 60; const startX = -mw / 2 + 20; items.forEach(([itemName, count]) => { const def = ItemDefinitions[itemName] || { description: "Unknown", emoji: "❓", type: "Misc" }; const itemStr = `${def.emoji} ${itemName} (x${count})`; const itemText = this.add.text(startX, currentY, itemStr, { font: '20px monospace', color: '#ffffff' }); const descText = this.add.text(startX + 20, currentY + 25, def.description, { font: '16px monospace', color: '#aaaaaa', wordWrap: { width: mw - 150 } }); this.inventoryModal.add([itemText, descText]); this.inventoryTexts.push(itemText, descText); if (def.type === 'Consumable' && count > 0) { const useButton = ButtonFactory.createButton(this, mw/2 - 60, currentY + 10, 'Use', () => { this.game.events.emit(EventKeys.UI_ACTION, EventKeys.CONSUME_ITEM, itemName); this.inventoryModal.setVisible(false); this.scene.resume('MainScene'); }, { width: 60, height: 30, color: 0x228B22 }); this.inventoryModal.add(useButton); this.inventoryButtons.push(useButton); } currentY += 60; }); this.inventoryModal.setVisible(true); this.scene.pause('MainScene'); }
+    /**
+     * Returns the pooled list registered under `key`, rebuilding it if the modal size changed since it was built.
+     * @param {string} key - Identifier of the list (one per modal).
+     * @param {function(): VirtualList} build - Factory used when no list exists for the current layout.
+     * @returns {VirtualList} The list.
+     */
+    getModalList(key, build) {
+        const layoutKey = `${this.getModalWidth()}x${this.getModalHeight()}`;
+        const existing = this.modalLists[key];
+        if (existing && existing.layoutKey === layoutKey) return existing;
+        if (existing) existing.destroy();
+        const list = build();
+        list.layoutKey = layoutKey;
+        this.modalLists[key] = list;
+        return list;
+    }
+
+    openDecorateMenu() {
+        this.closeAllModals();
+        if (!this.nadagotchiData) return;
+        const modal = this.decorateModal;
+        const mw = this.getModalWidth();
+        const mh = this.getModalHeight();
+        if (!modal.headerText) {
+            modal.headerText = this.add.text(0, 0, "Select an item to place:", { fontSize: '24px', fontFamily: 'VT323, Arial', color: '#fff' }).setOrigin(0.5);
+            modal.moveButton = ButtonFactory.createButton(this, 0, 0, 'Move Furniture', () => { this.game.events.emit(EventKeys.UI_ACTION, EventKeys.TOGGLE_DECORATION_MODE); modal.setVisible(false); this.scene.resume('MainScene'); }, { width: 160, height: 40, color: 0x4169E1 });
+            modal.add([modal.headerText, modal.moveButton]);
+        }
+        modal.headerText.setPosition(0, -mh / 2 + 70);
+        modal.moveButton.setPosition(0, mh / 2 - 60);
+        const validTypes = ['FURNITURE', 'WALLPAPER', 'FLOORING'];
+        const furniture = Object.entries(this.nadagotchiData.inventory).filter(([item, count]) => { const def = ItemDefinitions[item]; return def && validTypes.includes(def.type) && count > 0; });
+        modal.content.setText(furniture.length === 0 ? "You have no furniture or decor." : "");
+        this.getModalList('decorate', () => this.createDecorateList(modal, mw, mh)).setData(furniture);
+        modal.setVisible(true);
+        this.scene.pause('MainScene');
+    }
+
+    /**
+     * Builds the pooled row list for the Decorate modal.
+     * @param {Phaser.GameObjects.Container} modal - The decorate modal.
+     * @param {number} mw - Modal width.
+     * @param {number} mh - Modal height.
+     * @returns {VirtualList} The list.
+     */
+    createDecorateList(modal, mw, mh) {
+        const width = mw - 40;
+        return new VirtualList(this, modal, {
+            x: -mw / 2 + 20, y: -mh / 2 + 100, width, height: mh - 190, rowHeight: 35,
+            createRow: (row) => {
+                row.label = this.add.text(0, 15, '', { fontSize: '22px', fontFamily: 'VT323, Arial', color: '#fff' }).setOrigin(0, 0.5);
+                row.button = ButtonFactory.createButton(this, width - 60, 15, 'Place', () => {
+                    if (!row.item) return;
+                    this.game.events.emit(EventKeys.UI_ACTION, row.actionKey, row.item[0]);
+                    modal.setVisible(false);
+                    this.scene.resume('MainScene');
+                }, { width: 80, height: 30, color: 0x228B22 });
+                return [row.label, row.button];
+            },
+            updateRow: (row, [itemName, count]) => {
+                const def = ItemDefinitions[itemName];
+                const isSurface = def && (def.type === 'WALLPAPER' || def.type === 'FLOORING');
+                row.actionKey = isSurface ? EventKeys.APPLY_HOME_DECOR : EventKeys.PLACE_FURNITURE;
+                row.label.setText(`- ${itemName}: ${count}`);
+                row.button.setLabel(isSurface ? 'Apply' : 'Place');
+            }
+        });
+    }
+
+    openInventoryMenu() {
+        this.closeAllModals();
+        if (!this.nadagotchiData) return;
+        const items = Object.entries(this.nadagotchiData.inventory || {});
+        this.inventoryModal.content.setText(items.length === 0 ? "Empty." : "");
+        const mw = this.getModalWidth();
+        const mh = this.getModalHeight();
+        this.getModalList('inventory', () => this.createInventoryList(this.inventoryModal, mw, mh)).setData(items);
+        this.inventoryModal.setVisible(true);
+        this.scene.pause('MainScene');
+    }
+
+    /**
+     * Builds the pooled row list for the Inventory modal.
+     * @param {Phaser.GameObjects.Container} modal - The inventory modal.
+     * @param {number} mw - Modal width.
+     * @param {number} mh - Modal height.
+     * @returns {VirtualList} The list.
+     */
+    createInventoryList(modal, mw, mh) {
+        const width = mw - 40;
+        return new VirtualList(this, modal, {
+            x: -mw / 2 + 20, y: -mh / 2 + 60, width, height: mh - 80, rowHeight: 60,
+            createRow: (row) => {
+                row.itemText = this.add.text(0, 0, '', { font: '20px monospace', color: '#ffffff' });
+                row.descText = this.add.text(20, 25, '', { font: '16px monospace', color: '#aaaaaa', wordWrap: { width: mw - 150 } });
+                row.useButton = ButtonFactory.createButton(this, width - 50, 25, 'Use', () => {
+                    if (!row.item) return;
+                    this.game.events.emit(EventKeys.UI_ACTION, EventKeys.CONSUME_ITEM, row.item[0]);
+                    modal.setVisible(false);
+                    this.scene.resume('MainScene');
+                }, { width: 60, height: 30, color: 0x228B22 });
+                return [row.itemText, row.descText, row.useButton];
+            },
+            updateRow: (row, [itemName, count]) => {
+                const def = ItemDefinitions[itemName] || { description: "Unknown", emoji: "❓", type: "Misc" };
+                row.itemText.setText(`${def.emoji} ${itemName} (x${count})`);
+                row.descText.setText(def.description);
+                row.useButton.setVisible(def.type === 'Consumable' && count > 0);
+            }
+        });
+    }
     openAncestorModal(ancestorData) { this.closeAllModals(); if (!ancestorData) return; const advice = NarrativeSystem.getAdvice(ancestorData.dominantArchetype); const text = `Name: Generation ${ancestorData.generation}\nArchetype: ${ancestorData.dominantArchetype}\nCareer: ${ancestorData.currentCareer || 'None'}\n\nStats:\nHappiness: ${Math.floor(ancestorData.stats.happiness)}\nLogic: ${ancestorData.skills.logic.toFixed(1)}\nEmpathy: ${ancestorData.skills.empathy.toFixed(1)}\n\nAdvice:\n"${advice}"`; this.ancestorModal.content.setText(text); this.ancestorModal.setVisible(true); this.scene.pause('MainScene'); }
     async openAchievementsModal() { this.closeAllModals(); const data = await this.persistence.loadAchievements(); const unlockedIds = data.unlocked || []; const text = Achievements.map(ach => unlockedIds.includes(ach.id) ? `${ach.icon} ${ach.name}\n${ach.description}` : `🔒 ${ach.name}\n(Locked)`).join('\n\n'); this.achievementsModal.content.setText(text); this.achievementsModal.setVisible(true); this.scene.pause('MainScene'); }
     openWikiMenu() { this.closeAllModals(); this.wikiUI.show(); this.scene.pause("MainScene"); }
@@ -1060,11 +1047,17 @@ export class UIScene extends Phaser.Scene {
         this.closeAllModals();
         if (!this.nadagotchiData) return;
         const container = this.careerModal;
-        if (this.careerDynamicItems) { this.careerDynamicItems.forEach(i => i.destroy()); }
-        this.careerDynamicItems = [];
         const mw = this.getModalWidth();
         const mh = this.getModalHeight();
-        let yPos = -mh / 2 + 80;
+        if (!container.statsText) {
+            container.statsText = this.add.text(0, 0, '', { fontFamily: 'VT323, monospace', fontSize: '24px', color: '#ffffff', align: 'center', wordWrap: { width: mw - 60 } }).setOrigin(0.5, 0);
+            container.listTitle = this.add.text(0, 0, "Unlocked Career Paths:", { fontFamily: 'VT323', fontSize: '20px', color: '#AAAAAA' }).setOrigin(0.5);
+            container.emptyText = this.add.text(0, 0, "(None yet)", { fontFamily: 'VT323', fontSize: '18px', color: '#888' }).setOrigin(0.5);
+            container.add([container.statsText, container.listTitle, container.emptyText]);
+        }
+        container.statsText.setPosition(0, -mh / 2 + 80);
+        container.listTitle.setPosition(0, -mh / 2 + 220);
+        container.emptyText.setPosition(0, -mh / 2 + 250);
         const career = this.nadagotchiData.currentCareer;
         let infoText = "";
         if (career) {
@@ -1077,66 +1070,60 @@ export class UIScene extends Phaser.Scene {
         } else {
             infoText = "No Active Career.\nStudy or Explore to unlock paths!";
         }
-        const statsText = this.add.text(0, yPos, infoText, { fontFamily: 'VT323, monospace', fontSize: '24px', color: '#ffffff', align: 'center', wordWrap: { width: mw - 60 } }).setOrigin(0.5, 0);
-        container.add(statsText);
-        this.careerDynamicItems.push(statsText);
-        yPos += 140;
-        const listTitle = this.add.text(0, yPos, "Unlocked Career Paths:", { fontFamily: 'VT323', fontSize: '20px', color: '#AAAAAA' }).setOrigin(0.5);
-        container.add(listTitle);
-        this.careerDynamicItems.push(listTitle);
-        yPos += 30;
+        container.statsText.setText(infoText);
         const unlocked = this.nadagotchiData.unlockedCareers || [];
-        if (unlocked.length === 0) {
-            const noneText = this.add.text(0, yPos, "(None yet)", { fontFamily: 'VT323', fontSize: '18px', color: '#888' }).setOrigin(0.5);
-            container.add(noneText);
-            this.careerDynamicItems.push(noneText);
-        } else {
-            unlocked.forEach(c => {
-                const isCurrent = c === career;
-                const lvl = this.nadagotchiData.careerLevels[c] || 1;
-                const label = `${c} (Lvl ${lvl})`;
-                const rowText = this.add.text(-mw/2 + 60, yPos + 10, label, { fontFamily: 'VT323', fontSize: '24px', color: isCurrent ? '#00FF00' : '#FFF' });
-                container.add(rowText);
-                this.careerDynamicItems.push(rowText);
-                if (!isCurrent) {
-                    const switchBtn = ButtonFactory.createButton(this, (mw/2 - 80) + 40, (yPos + 20) + 15, "Switch", () => { this.game.events.emit(EventKeys.UI_ACTION, EventKeys.SWITCH_CAREER, c); container.setVisible(false); this.scene.resume('MainScene'); }, { width: 80, height: 30, color: 0x4CAF50, fontSize: '18px' });
-                    container.add(switchBtn);
-                    this.careerDynamicItems.push(switchBtn);
-                } else {
-                    const activeLbl = this.add.text(mw/2 - 80, yPos + 10, "[Active]", { fontFamily: 'VT323', fontSize: '18px', color: '#00FF00' });
-                    container.add(activeLbl);
-                    this.careerDynamicItems.push(activeLbl);
-                }
-                yPos += 45;
-            });
-        }
+        container.emptyText.setVisible(unlocked.length === 0);
+        this.getModalList('career', () => this.createCareerList(container, mw, mh)).setData(unlocked);
         container.setVisible(true);
         this.scene.pause('MainScene');
     }
 
+    /**
+     * Builds the pooled row list for the Career Profile modal.
+     * @param {Phaser.GameObjects.Container} container - The career modal.
+     * @param {number} mw - Modal width.
+     * @param {number} mh - Modal height.
+     * @returns {VirtualList} The list.
+     */
+    createCareerList(container, mw, mh) {
+        const width = mw - 40;
+        return new VirtualList(this, container, {
+            x: -mw / 2 + 20, y: -mh / 2 + 250, width, height: mh - 270, rowHeight: 45,
+            createRow: (row) => {
+                row.label = this.add.text(40, 10, '', { fontFamily: 'VT323', fontSize: '24px', color: '#FFF' });
+                row.switchButton = ButtonFactory.createButton(this, width - 60, 22, "Switch", () => {
+                    if (!row.item) return;
+                    this.game.events.emit(EventKeys.UI_ACTION, EventKeys.SWITCH_CAREER, row.item);
+                    container.setVisible(false);
+                    this.scene.resume('MainScene');
+                }, { width: 80, height: 30, color: 0x4CAF50, fontSize: '18px' });
+                row.activeLabel = this.add.text(width - 100, 10, "[Active]", { fontFamily: 'VT323', fontSize: '18px', color: '#00FF00' });
+                return [row.label, row.switchButton, row.activeLabel];
+            },
+            updateRow: (row, careerName) => {
+                const isCurrent = careerName === this.nadagotchiData.currentCareer;
+                const lvl = this.nadagotchiData.careerLevels[careerName] || 1;
+                row.label.setText(`${careerName} (Lvl ${lvl})`);
+                row.label.setColor(isCurrent ? '#00FF00' : '#FFF');
+                row.switchButton.setVisible(!isCurrent);
+                row.activeLabel.setVisible(isCurrent);
+            }
+        });
+    }
+
     openJobBoardMenu() {
         this.closeAllModals();
         if (!this.nadagotchiData) return;
         const container = this.jobBoardModal;
-        if (this.jobBoardDynamicItems) { this.jobBoardDynamicItems.forEach(i => i.destroy()); }
-        this.jobBoardDynamicItems = [];
-        const career = this.nadagotchiData.currentCareer;
-        let text = "";
-        if (career) {
-            text = `Active Assignment:\n${career}`;
-        } else {
-            text = "No Active Career Assignment.";
+        if (!container.infoText) {
+            container.infoText = this.add.text(0, -50, '', { fontFamily: 'VT323', fontSize: '32px', color: '#FFF', align: 'center' }).setOrigin(0.5);
+            container.startButton = ButtonFactory.createButton(this, 80, 55, "Start Shift", () => { if (this.nadagotchiData && this.nadagotchiData.currentCareer) { this.game.events.emit(EventKeys.UI_ACTION, EventKeys.WORK); container.setVisible(false); } else { this.showToast("No Job", "Select a career first!", "🚫"); } }, { width: 160, height: 50, color: 0x6A0DAD, disabledColor: 0x555555, fontSize: '24px' });
+            container.careerButton = ButtonFactory.createButton(this, 80, 120, "Career Profiles", () => { this.openCareerMenu(); }, { width: 160, height: 40, color: 0xD8A373, fontSize: '20px' });
+            container.add([container.infoText, container.startButton, container.careerButton]);
         }
-        const infoText = this.add.text(0, -50, text, { fontFamily: 'VT323', fontSize: '32px', color: '#FFF', align: 'center' }).setOrigin(0.5);
-        container.add(infoText);
-        this.jobBoardDynamicItems.push(infoText);
-        const startBtn = ButtonFactory.createButton(this, 80, 55, "Start Shift", () => { if (career) { this.game.events.emit(EventKeys.UI_ACTION, EventKeys.WORK); container.setVisible(false); } else { this.showToast("No Job", "Select a career first!", "🚫"); } }, { width: 160, height: 50, color: career ? 0x6A0DAD : 0x555555, fontSize: '24px' });
-        if (!career) startBtn.setDisabled(true);
-        container.add(startBtn);
-        this.jobBoardDynamicItems.push(startBtn);
-        const careerBtn = ButtonFactory.createButton(this, 80, 120, "Career Profiles", () => { this.openCareerMenu(); }, { width: 160, height: 40, color: 0xD8A373, fontSize: '20px' });
-        container.add(careerBtn);
-        this.jobBoardDynamicItems.push(careerBtn);
+        const career = this.nadagotchiData.currentCareer;
+        container.infoText.setText(career ? `Active Assignment:\n${career}` : "No Active Career Assignment.");
+        container.startButton.setDisabled(!career);
         container.setVisible(true);
         this.scene.pause('MainScene');
     }
@@ -0,0 +1,275 @@
+/**
+ * @fileoverview Tiered update scheduler and frame pacer for MainScene.
+ * Subsystems register with a target rate and an optional dirty condition, so
+ * work that cannot change what is on screen is skipped. The scheduler also
+ * drops the game loop to a low-power frame rate when nothing is happening and
+ * replays time spent in a hidden tab as a simulation-only catch-up.
+ */
+
+import { Config } from './Config.js';
+
+const ACTIVITY_EVENTS = ['pointerdown', 'pointermove', 'keydown', 'wheel', 'touchstart'];
+const FRAME_MS = (Config.GAME_LOOP && Config.GAME_LOOP.MS_PER_FRAME) || 1000 / 60;
+
+/**
+ * @class UpdateScheduler
+ * @classdesc
+ * Runs registered tasks at their own rates and manages the game loop's power state.
+ */
+export class UpdateScheduler {
+    /**
+     * @param {object} [options] - Overrides for `Config.SCHEDULER`.
+     * @param {number} [options.idleAfterMs] - Time without input before the loop may enter low-power mode.
+     * @param {number} [options.lowPowerFps] - Frame rate used while idle.
+     * @param {number} [options.maxStepMs] - Upper bound for the elapsed time handed to a task.
+     */
+    constructor(options = {}) {
+        const defaults = Config.SCHEDULER || {};
+        this.idleAfterMs = options.idleAfterMs ?? defaults.IDLE_AFTER_MS ?? 15000;
+        this.lowPowerFps = options.lowPowerFps ?? defaults.LOW_POWER_FPS ?? 15;
+        this.maxStepMs = options.maxStepMs ?? 1000;
+
+        /** @type {Array<object>} Registered tasks, run in registration order. */
+        this.tasks = [];
+        this._taskMap = new Map();
+
+        /** @type {boolean} Whether the game loop is currently paced at the low-power rate. */
+        this.lowPower = false;
+        /** @type {boolean} Whether the scheduler has put the loop to sleep and still owes it a wake(). */
+        this.loopAsleep = false;
+        /** @type {boolean} Whether the page is hidden (Page Visibility API). */
+        this.isHidden = false;
+        /** @type {boolean} Whether the owning scene is paused (e.g. by a UIScene modal). */
+        this.isScenePaused = false;
+        this.lastActivity = Date.now();
+        this.hiddenAt = null;
+
+        this.game = null;
+        this._callbacks = {};
+        this._wakeTimer = null;
+        this._onActivity = () => this.notifyActivity();
+        this._onVisibilityChange = () => this.setHidden(typeof document !== 'undefined' && document.hidden);
+    }
+
+    /**
+     * Registers a task.
+     * @param {string} name - Unique task name (used by {@link markDirty}).
+     * @param {function(number, number): void} run - Called with the scene time and the ms since the task's previous slot.
+     * @param {object} [options] - Scheduling options.
+     * @param {number} [options.rate=0] - Target rate in Hz; 0 runs the task every frame.
+     * @param {function(number): boolean} [options.isDirty] - Checked when the task is due; returning false skips the run.
+     */
+    register(name, run, options = {}) {
+        const rate = options.rate || 0;
+        const task = {
+            name,
+            run,
+            interval: rate > 0 ? 1000 / rate : 0,
+            isDirty: options.isDirty || null,
+            lastRun: -Infinity,
+            forced: false
+        };
+        this.tasks.push(task);
+        this._taskMap.set(name, task);
+    }
+
+    /**
+     * Forces a task to run on the next update, regardless of its rate or dirty condition.
+     * @param {string} name - The task name.
+     */
+    markDirty(name) {
+        const task = this._taskMap.get(name);
+        if (task) task.forced = true;
+    }
+
+    /**
+     * Forces every task to run on the next update (e.g. after a resize or a catch-up).
+     */
+    markAllDirty() {
+        this.tasks.forEach(task => { task.forced = true; });
+    }
+
+    /**
+     * Runs every task whose slot is due and whose dirty condition holds.
+     * @param {number} time - The current scene time in milliseconds.
+     */
+    update(time) {
+        for (let i = 0; i < this.tasks.length; i++) {
+            const task = this.tasks[i];
+            const elapsed = time - task.lastRun;
+            if (!task.forced && elapsed < task.interval) continue;
+
+            // The slot is consumed even if the task is clean, so elapsed time only
+            // ever covers one slot's worth of skipped frames.
+            task.lastRun = time;
+            if (!task.forced && task.isDirty && !task.isDirty(time)) continue;
+
+            task.forced = false;
+            const step = Number.isFinite(elapsed) ? Math.min(elapsed, this.maxStepMs) : (task.interval || FRAME_MS);
+            task.run(time, step);
+        }
+    }
+
+    /**
+     * Hooks the scheduler into the game loop, input and the Page Visibility API.
+     * @param {Phaser.Game} game - The game instance.
+     * @param {object} [callbacks] - Scene hooks.
+     * @param {function(): boolean} [callbacks.isBusy] - Returns true while the owning scene shows significant motion.
+     * @param {function(): boolean} [callbacks.isOverlayBusy] - Returns true while an overlay scene that keeps
+     *        running when the owning scene pauses (UIScene toasts, button tweens) is animating.
+     * @param {function(): boolean} [callbacks.isOtherSceneActive] - Returns true while another gameplay scene
+     *        (e.g. a minigame) is running; the loop is never paced down while it does.
+     * @param {function(number): void} [callbacks.onCatchUp] - Called with the ms the page spent hidden.
+     * @param {function(): void} [callbacks.onHidden] - Called when the page becomes hidden.
+     */
+    attach(game, callbacks = {}) {
+        this.game = game;
+        this._callbacks = callbacks;
+        this.lastActivity = Date.now();
+
+        if (game && game.events) game.events.on('postrender', this.pace, this);
+        if (typeof window !== 'undefined' && window.addEventListener) {
+            ACTIVITY_EVENTS.forEach(type => window.addEventListener(type, this._onActivity, { passive: true }));
+        }
+        if (typeof document !== 'undefined' && document.addEventListener) {
+            document.addEventListener('visibilitychange', this._onVisibilityChange);
+        }
+    }
+
+    /**
+     * Removes every listener added by {@link attach} and restores the full frame rate.
+     */
+    detach() {
+        this._exitLowPower();
+        if (this.game && this.game.events) this.game.events.off('postrender', this.pace, this);
+        if (typeof window !== 'undefined' && window.removeEventListener) {
+            ACTIVITY_EVENTS.forEach(type => window.removeEventListener(type, this._onActivity));
+        }
+        if (typeof document !== 'undefined' && document.removeEventListener) {
+            document.removeEventListener('visibilitychange', this._onVisibilityChange);
+        }
+        this.game = null;
+        this._callbacks = {};
+    }
+
+    /**
+     * Records user input, leaving low-power mode immediately.
+     */
+    notifyActivity() {
+        this.lastActivity = Date.now();
+        this._exitLowPower();
+    }
+
+    /**
+     * Tracks whether the owning scene is paused. Resuming counts as activity and refreshes every task.
+     * @param {boolean} paused - The new paused state.
+     */
+    setScenePaused(paused) {
+        this.isScenePaused = paused;
+        if (!paused) {
+            this.markAllDirty();
+            this.notifyActivity();
+        }
+    }
+
+    /**
+     * Handles a page visibility change. While hidden the loop is left to the browser
+     * (Phaser pauses it); on return the loop is woken if it was asleep and the hidden
+     * duration is handed to `onCatchUp`.
+     * @param {boolean} hidden - Whether the page is now hidden.
+     */
+    setHidden(hidden) {
+        if (hidden === this.isHidden) return;
+        this.isHidden = hidden;
+
+        if (hidden) {
+            this.hiddenAt = Date.now();
+            this._cancelWake();
+            this.lowPower = false;
+            if (this._callbacks.onHidden) this._callbacks.onHidden();
+            return;
+        }
+
+        const elapsed = this.hiddenAt !== null ? Date.now() - this.hiddenAt : 0;
+        this.hiddenAt = null;
+        this.lastActivity = Date.now();
+        if (elapsed > 0 && !this.isScenePaused && this._callbacks.onCatchUp) {
+            this._callbacks.onCatchUp(elapsed);
+        }
+        this.markAllDirty();
+        this._exitLowPower();
+    }
+
+    /**
+     * Whether the loop should currently run at the low-power rate.
+     * @returns {boolean} True when the page is visible, no other scene is running, no input arrived
+     *          recently and nothing is animating.
+     */
+    shouldIdle() {
+        if (this.isHidden) return false;
+        // The loop is shared by every scene, so pacing it down would throttle a running minigame too.
+        if (this._callbacks.isOtherSceneActive && this._callbacks.isOtherSceneActive()) return false;
+        if (Date.now() - this.lastActivity < this.idleAfterMs) return false;
+        // Overlays keep animating while the owning scene is paused behind a modal.
+        if (this._callbacks.isOverlayBusy && this._callbacks.isOverlayBusy()) return false;
+        // A paused scene is frozen, so only input matters while a UIScene modal is open.
+        if (!this.isScenePaused && this._callbacks.isBusy && this._callbacks.isBusy()) return false;
+        return true;
+    }
+
+    /**
+     * Frame pacer, run after each render. When idle, the loop is put to sleep and
+     * woken again after one low-power frame interval.
+     */
+    pace() {
+        const loop = this.game && this.game.loop;
+        if (!loop || typeof loop.sleep !== 'function' || this.loopAsleep) return;
+
+        this.lowPower = this.shouldIdle();
+        if (!this.lowPower) return;
+
+        loop.sleep();
+        this.loopAsleep = true;
+        this._wakeTimer = setTimeout(() => {
+            this._wakeTimer = null;
+            if (!this.isHidden) this._wakeLoop();
+        }, 1000 / this.lowPowerFps);
+    }
+
+    /**
+     * Leaves low-power mode, waking the loop right away unless the page is hidden.
+     * @private
+     */
+    _exitLowPower() {
+        this._cancelWake();
+        this.lowPower = false;
+        if (!this.isHidden) this._wakeLoop();
+    }
+
+    /**
+     * Wakes the loop if the scheduler put it to sleep or it is otherwise stopped.
+     * @private
+     */
+    _wakeLoop() {
+        const loop = this.game && this.game.loop;
+        const asleep = this.loopAsleep;
+        this.loopAsleep = false;
+        if (!loop || typeof loop.wake !== 'function') return;
+
+        // Phaser's own visibility handler resume()s the loop, flagging it as running while the frame
+        // request stopped by sleep() is still gone; wake() ignores a running loop, so stop it cleanly first.
+        if (asleep && loop.running && typeof loop.sleep === 'function') loop.sleep();
+        if (asleep || loop.running === false) loop.wake();
+    }
+
+    /**
+     * Cancels a pending low-power wake-up.
+     * @private
+     */
+    _cancelWake() {
+        if (this._wakeTimer) {
+            clearTimeout(this._wakeTimer);
+            this._wakeTimer = null;
+        }
+    }
+}
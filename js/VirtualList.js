@@ -0,0 +1,169 @@
+/**
+ * @fileoverview A pooled, windowed list widget for modal menus.
+ * Keeps a fixed number of row containers alive and rebinds them to data as the
+ * list scrolls, so opening or scrolling a long list never creates or destroys
+ * game objects.
+ */
+
+/**
+ * @class VirtualList
+ * @classdesc
+ * Renders only the rows that fit inside its viewport. Rows are built once via
+ * `createRow` and refreshed in place via `updateRow` whenever the data or the
+ * scroll position changes.
+ */
+export class VirtualList {
+    /**
+     * @param {Phaser.Scene} scene - The scene that owns the list.
+     * @param {Phaser.GameObjects.Container} parent - The container (usually a modal) to add the list to.
+     * @param {object} config - Layout and row callbacks.
+     * @param {number} config.x - Left edge of the viewport (parent-local).
+     * @param {number} config.y - Top edge of the viewport (parent-local).
+     * @param {number} config.width - Width of the viewport.
+     * @param {number} config.height - Height of the viewport.
+     * @param {number} config.rowHeight - Height of a single row slot.
+     * @param {function(object): Array<Phaser.GameObjects.GameObject>} config.createRow - Builds the children of a pooled row.
+     *        Receives the row record (`{ container, item, index }`); children are positioned relative to the row's top-left.
+     * @param {function(object, *, number): void} config.updateRow - Refreshes a pooled row for `item` at data `index`.
+     */
+    constructor(scene, parent, config) {
+        this.scene = scene;
+        this.parent = parent;
+        this.x = config.x;
+        this.y = config.y;
+        this.width = config.width;
+        this.height = config.height;
+        this.rowHeight = config.rowHeight;
+        this.createRow = config.createRow;
+        this.updateRow = config.updateRow;
+
+        this.items = [];
+        this.scrollIndex = 0;
+        this.dragAccumulator = 0;
+        this.visibleCount = Math.max(1, Math.floor(this.height / this.rowHeight));
+
+        // Transparent hit area behind the rows; receives wheel and drag input.
+        this.hitArea = scene.add.rectangle(this.x, this.y, this.width, this.height, 0x000000, 0)
+            .setOrigin(0)
+            .setInteractive();
+        this.hitArea.on('wheel', (pointer, dx, dy) => {
+            this.scrollBy(Math.sign(dy));
+        });
+        this.hitArea.on('pointermove', (pointer) => {
+            if (!pointer.isDown) return;
+            this.dragAccumulator += pointer.y - pointer.prevPosition.y;
+            const steps = Math.trunc(this.dragAccumulator / this.rowHeight);
+            if (steps !== 0) {
+                this.dragAccumulator -= steps * this.rowHeight;
+                this.scrollBy(-steps);
+            }
+        });
+
+        this.scrollThumb = scene.add.rectangle(this.x + this.width - 4, this.y, 4, this.height, 0xFFFFFF, 0.5)
+            .setOrigin(0)
+            .setVisible(false);
+
+        parent.add([this.hitArea, this.scrollThumb]);
+
+        this.rows = [];
+        for (let i = 0; i < this.visibleCount; i++) {
+            const container = scene.add.container(this.x, this.y + i * this.rowHeight);
+            const row = { container, item: null, index: -1 };
+            container.add(this.createRow(row));
+            container.setVisible(false);
+            parent.add(container);
+            this.rows.push(row);
+        }
+    }
+
+    /**
+     * Replaces the backing data and redraws the visible window.
+     * @param {Array<*>} items - The list data.
+     * @param {boolean} [resetScroll=true] - Whether to jump back to the first row.
+     *        When false, the position is kept but clamped in case the list shrank.
+     */
+    setData(items, resetScroll = true) {
+        this.items = items || [];
+        this.scrollIndex = resetScroll ? 0 : Math.min(this.scrollIndex, this._maxScrollIndex());
+        this.dragAccumulator = 0;
+        this.refresh();
+    }
+
+    /**
+     * Scrolls by a number of rows (positive scrolls down).
+     * @param {number} delta - Rows to scroll.
+     */
+    scrollBy(delta) {
+        this.scrollTo(this.scrollIndex + delta);
+    }
+
+    /**
+     * Scrolls so that the given data index is the first visible row.
+     * @param {number} index - Target first row (clamped to the valid range).
+     */
+    scrollTo(index) {
+        const clamped = Math.min(Math.max(0, index), this._maxScrollIndex());
+        if (clamped === this.scrollIndex) return;
+        this.scrollIndex = clamped;
+        this.refresh();
+    }
+
+    /**
+     * The largest valid first row for the current data.
+     * @returns {number} The maximum scroll index.
+     * @private
+     */
+    _maxScrollIndex() {
+        return Math.max(0, this.items.length - this.visibleCount);
+    }
+
+    /**
+     * Rebinds every pooled row to the data currently in view.
+     */
+    refresh() {
+        for (let i = 0; i < this.rows.length; i++) {
+            const row = this.rows[i];
+            const dataIndex = this.scrollIndex + i;
+            if (dataIndex < this.items.length) {
+                row.item = this.items[dataIndex];
+                row.index = dataIndex;
+                this.updateRow(row, row.item, dataIndex);
+                row.container.setVisible(true);
+            } else {
+                row.item = null;
+                row.index = -1;
+                row.container.setVisible(false);
+            }
+        }
+        this._updateScrollThumb();
+    }
+
+    /**
+     * Sizes and positions the scroll thumb, hiding it when everything fits.
+     * @private
+     */
+    _updateScrollThumb() {
+        const total = this.items.length;
+        if (total <= this.visibleCount) {
+            this.scrollThumb.setVisible(false);
+            return;
+        }
+        const thumbHeight = Math.max(10, this.height * (this.visibleCount / total));
+        const maxIndex = total - this.visibleCount;
+        const thumbY = this.y + (this.height - thumbHeight) * (this.scrollIndex / maxIndex);
+        this.scrollThumb.setSize(4, thumbHeight);
+        this.scrollThumb.setPosition(this.x + this.width - 4, thumbY);
+        this.scrollThumb.setVisible(true);
+    }
+
+    /**
+     * Destroys all pooled objects.
+     */
+    destroy() {
+        this.rows.forEach(row => row.container.destroy());
+        this.rows = [];
+        this.hitArea.destroy();
+        this.scrollThumb.destroy();
+        this.items = [];
+    }
+}
@@ -92,6 +92,15 @@ export class WeatherParticleManager {
         }
     }
 
+    /**
+     * Whether dense weather (rain or snow) is falling. The sparse autumn leaves are
+     * ambient and look fine at a low frame rate, so they don't count.
+     * @returns {boolean} True while the rain or snow emitter is running.
+     */
+    isHeavy() {
+        return ['rain', 'snow'].some(key => this.emitters[key] && this.emitters[key].on);
+    }
+
     resize(width, height) {
         // Update emitter bounds
         Object.values(this.emitters).forEach(e => {
@@ -1,9 +1,50 @@
+/**
+ * @fileoverview Tracks which wiki entries the player has discovered.
+ * Entries are held in per-category Sets for O(1) lookups, persisted through
+ * coalesced idle-time saves, and indexed by word prefix for instant search.
+ */
+
+const WIKI_KEY = "nadagotchi_wiki";
+
 export class WikiSystem {
     constructor(persistenceManager) {
         this.persistence = persistenceManager;
-        this.entries = {}; // e.g. { "pets": ["Slime", "Robot"], "items": ["Apple"] }
         this.categories = ["pets", "items", "careers", "locations", "mechanics"];
         this.isReady = false;
+
+        this._entrySets = {}; // e.g. { "pets": Set{"Slime", "Robot"}, "items": Set{"Apple"} }
+        this._entryArrays = {}; // Cached array views of _entrySets, invalidated per category on unlock
+        this._searchIndex = new Map(); // Lowercased token prefix -> Set of { category, id } records
+        this._saveTimer = null;
+        this._isIdleCallback = false;
+    }
+
+    /**
+     * Array view of every category, in unlock order. This is also the persisted shape.
+     * @type {Object<string, Array<string>>}
+     */
+    get entries() {
+        const result = {};
+        Object.keys(this._entrySets).forEach(cat => {
+            result[cat] = this.getEntries(cat);
+        });
+        return result;
+    }
+
+    set entries(value) {
+        this._entrySets = {};
+        this._entryArrays = {};
+        this._searchIndex = new Map();
+        Object.keys(value || {}).forEach(cat => {
+            const set = new Set();
+            this._entrySets[cat] = set;
+            (value[cat] || []).forEach(id => {
+                if (!set.has(id)) {
+                    set.add(id);
+                    this._indexEntry(cat, id);
+                }
+            });
+        });
     }
 
     async init() {
@@ -12,51 +53,193 @@ export class WikiSystem {
     }
 
     async load() {
-        const data = (this.persistence && this.persistence._load) ? await this.persistence._load("nadagotchi_wiki") : null;
+        const data = (this.persistence && this.persistence._load) ? await this.persistence._load(WIKI_KEY) : null;
         if (data) {
             this.entries = data.entries || {};
             // Ensure all categories exist
             this.categories.forEach(cat => {
-                if (!this.entries[cat]) {
-                    this.entries[cat] = [];
+                if (!this._entrySets[cat]) {
+                    this._entrySets[cat] = new Set();
                 }
             });
         } else {
             // Initialize empty categories
+            this.entries = {};
             this.categories.forEach(cat => {
-                this.entries[cat] = [];
+                this._entrySets[cat] = new Set();
             });
             await this.save();
         }
     }
 
+    /**
+     * Writes the wiki to storage immediately, cancelling any scheduled save.
+     * @returns {Promise<void>}
+     */
     async save() {
+        this._cancelScheduledSave();
         if (this.persistence && this.persistence._save) {
-            await this.persistence._save("nadagotchi_wiki", {
+            await this.persistence._save(WIKI_KEY, {
                 entries: this.entries
             });
         }
     }
 
+    /**
+     * Writes any scheduled save now. Resolves immediately if nothing is pending.
+     * @returns {Promise<void>}
+     */
+    async flush() {
+        if (!this._saveTimer) return;
+        await this.save();
+    }
+
+    /**
+     * Unlocks an entry. Saves are coalesced, so a burst of unlocks (e.g. during
+     * onboarding or a migration) results in a single write once the browser is idle.
+     * @param {string} category - The wiki category.
+     * @param {string} entryId - The entry to unlock.
+     * @returns {Promise<boolean>} True if the entry was newly unlocked.
+     */
     async unlockEntry(category, entryId) {
         if (!this.categories.includes(category)) {
             console.warn(`Invalid wiki category: ${category}`);
             return false;
         }
 
-        if (!this.entries[category].includes(entryId)) {
-            this.entries[category].push(entryId);
-            await this.save();
+        if (!this._entrySets[category]) {
+            this._entrySets[category] = new Set();
+        }
+        const set = this._entrySets[category];
+        if (!set.has(entryId)) {
+            set.add(entryId);
+            delete this._entryArrays[category];
+            this._indexEntry(category, entryId);
+            this._scheduleSave();
             return true; // Newly unlocked
         }
         return false; // Already unlocked
     }
 
     hasEntry(category, entryId) {
-        return this.entries[category] && this.entries[category].includes(entryId);
+        return this._entrySets[category] && this._entrySets[category].has(entryId);
     }
 
     getEntries(category) {
-        return this.entries[category] || [];
+        const set = this._entrySets[category];
+        if (!set) return [];
+        if (!this._entryArrays[category]) {
+            this._entryArrays[category] = Array.from(set);
+        }
+        return this._entryArrays[category];
+    }
+
+    /**
+     * Finds unlocked entries whose words start with every word of the query.
+     * Matching is case-insensitive, e.g. "gold fi" matches "Goldfish Fillet".
+     * @param {string} query - The search text.
+     * @param {string} [category] - Restricts results to one category.
+     * @returns {Array<string>|Array<{category: string, id: string}>} Entry ids when a category is given,
+     *          otherwise `{ category, id }` records. Results are in unlock order.
+     */
+    search(query, category = null) {
+        const tokens = WikiSystem.tokenize(query);
+        if (tokens.length === 0) {
+            if (category) return this.getEntries(category).slice();
+            const all = [];
+            this.categories.forEach(cat => {
+                this.getEntries(cat).forEach(id => all.push({ category: cat, id }));
+            });
+            return all;
+        }
+
+        // Intersect posting sets, scanning the smallest one
+        const postings = [];
+        for (const token of tokens) {
+            const set = this._searchIndex.get(token);
+            if (!set) return [];
+            postings.push(set);
+        }
+        postings.sort((a, b) => a.size - b.size);
+
+        const results = [];
+        for (const record of postings[0]) {
+            if (category && record.category !== category) continue;
+            let matchesAll = true;
+            for (let i = 1; i < postings.length; i++) {
+                if (!postings[i].has(record)) {
+                    matchesAll = false;
+                    break;
+                }
+            }
+            if (matchesAll) results.push(category ? record.id : record);
+        }
+        return results;
+    }
+
+    /**
+     * Splits text into lowercase search tokens.
+     * @param {string} text - The text to tokenize.
+     * @returns {Array<string>} The tokens.
+     */
+    static tokenize(text) {
+        return String(text || '').toLowerCase().split(/[^\p{L}\p{N}]+/u).filter(Boolean);
+    }
+
+    /**
+     * Adds every prefix of every word of an entry to the search index.
+     * @param {string} category - The entry's category.
+     * @param {string} entryId - The entry id.
+     * @private
+     */
+    _indexEntry(category, entryId) {
+        const record = { category, id: entryId };
+        WikiSystem.tokenize(entryId).forEach(token => {
+            for (let len = 1; len <= token.length; len++) {
+                const prefix = token.slice(0, len);
+                let set = this._searchIndex.get(prefix);
+                if (!set) {
+                    set = new Set();
+                    this._searchIndex.set(prefix, set);
+                }
+                set.add(record);
+            }
+        });
+    }
+
+    /**
+     * Schedules a save during idle time (or after a short delay), collapsing
+     * repeated requests into a single write.
+     * @private
+     */
+    _scheduleSave() {
+        if (this._saveTimer) return;
+
+        const task = () => {
+            this._saveTimer = null;
+            this.save();
+        };
+
+        if (typeof requestIdleCallback !== 'undefined') {
+            this._isIdleCallback = true;
+            this._saveTimer = requestIdleCallback(task, { timeout: 2000 });
+        } else {
+            this._isIdleCallback = false;
+            this._saveTimer = setTimeout(task, 200);
+        }
+    }
+
+    /**
+     * Cancels a scheduled save, if any.
+     * @private
+     */
+    _cancelScheduledSave() {
+        if (!this._saveTimer) return;
+        if (this._isIdleCallback && typeof cancelIdleCallback !== 'undefined') {
+            cancelIdleCallback(this._saveTimer);
+        } else {
+            clearTimeout(this._saveTimer);
+        }
+        this._saveTimer = null;
     }
 }
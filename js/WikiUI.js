@@ -13,6 +13,8 @@ export class WikiUI {
         this.contentContainer = null;
         this.currentCategory = null;
         this.scrollOffset = 0;
+        this.searchQuery = '';
+        this.searchInput = null;
     }
 
     create() {
@@ -58,6 +60,25 @@ export class WikiUI {
         this.entryContainer = this.scene.add.container(startX + 20, startY + 110);
         this.container.add([this.categoryContainer, this.entryContainer]);
 
+        // Prefix search box (DOM input, like the StartScene name entry)
+        if (this.scene.add.dom) {
+            const inputElement = document.createElement('input');
+            inputElement.type = 'text';
+            inputElement.placeholder = 'Search...';
+            inputElement.maxLength = 24;
+            inputElement.style.fontFamily = "'VT323', monospace";
+            inputElement.style.fontSize = '18px';
+            inputElement.style.width = '120px';
+            inputElement.style.padding = '2px 6px';
+            inputElement.style.border = '2px solid #4A4A4A';
+            inputElement.style.outline = 'none';
+            inputElement.value = this.searchQuery;
+            inputElement.addEventListener('input', () => this.setSearchQuery(inputElement.value));
+
+            this.searchInput = this.scene.add.dom(startX + 15, startY + 20, inputElement).setOrigin(0, 0.5);
+            this.container.add(this.searchInput);
+        }
+
         // Input handling for scrolling entries
         this.background.setInteractive().on('wheel', (pointer, dx, dy, dz, event) => {
             this.scrollOffset -= dy;
@@ -79,6 +100,7 @@ export class WikiUI {
         this.isVisible = true;
         this.container.setVisible(true);
         this.scene.children.bringToTop(this.container);
+        if (this.searchInput) this.searchInput.setVisible(true);
         this.currentCategory = this.wikiSystem.categories[0];
         this.renderCategories();
         this.renderEntries();
@@ -87,6 +109,7 @@ export class WikiUI {
     hide() {
         this.isVisible = false;
         if (this.container) this.container.setVisible(false);
+        if (this.searchInput) this.searchInput.setVisible(false);
         this.scene.scene.resume("MainScene");
     }
 
@@ -115,11 +138,23 @@ export class WikiUI {
         });
     }
 
+    /**
+     * Filters the current category to entries matching a prefix query.
+     * @param {string} query - The search text; empty shows every entry.
+     */
+    setSearchQuery(query) {
+        this.searchQuery = query || '';
+        this.scrollOffset = 0;
+        if (this.entryContainer) this.renderEntries();
+    }
+
     renderEntries() {
         this.entryContainer.removeAll(true);
         if (!this.wikiSystem) return;
 
-        const entries = this.wikiSystem.getEntries(this.currentCategory) || [];
+        const entries = (this.searchQuery.trim()
+            ? this.wikiSystem.search(this.searchQuery, this.currentCategory)
+            : this.wikiSystem.getEntries(this.currentCategory)) || [];
         const modalHeight = this.background.height;
         const maxScroll = Math.min(0, -((entries.length * 40) - (modalHeight - 150)));
 
@@ -128,7 +163,8 @@ export class WikiUI {
         if (entries.length * 40 <= modalHeight - 150) this.scrollOffset = 0;
 
         if (entries.length === 0) {
-            this.entryContainer.add(this.scene.add.text(10, 20, "No entries discovered yet...", {
+            const emptyMessage = this.searchQuery.trim() ? "No matching entries..." : "No entries discovered yet...";
+            this.entryContainer.add(this.scene.add.text(10, 20, emptyMessage, {
                 fontFamily: 'VT323, monospace', fontSize: '24px', color: '#555555'
             }));
             return;
@@ -0,0 +1,79 @@
+/**
+ * @fileoverview A fixed-capacity circular buffer.
+ * Appends are O(1) and overwrite the oldest item once the buffer is full,
+ * avoiding the array copies of a push-then-slice cap.
+ */
+
+export class RingBuffer {
+    /**
+     * Creates a new RingBuffer.
+     * @param {number} capacity - The maximum number of items retained.
+     */
+    constructor(capacity) {
+        this.capacity = Math.max(1, Math.floor(capacity));
+        this.items = new Array(this.capacity);
+        this.start = 0;
+        this.length = 0;
+    }
+
+    /**
+     * Appends an item, evicting the oldest one if the buffer is full.
+     * @param {*} item - The item to append.
+     * @returns {*} The evicted item, or undefined if nothing was evicted.
+     */
+    push(item) {
+        if (this.length < this.capacity) {
+            this.items[(this.start + this.length) % this.capacity] = item;
+            this.length++;
+            return undefined;
+        }
+        const evicted = this.items[this.start];
+        this.items[this.start] = item;
+        this.start = (this.start + 1) % this.capacity;
+        return evicted;
+    }
+
+    /**
+     * Returns the item at a logical index (0 is the oldest retained item).
+     * @param {number} index - The logical index.
+     * @returns {*} The item, or undefined if out of range.
+     */
+    get(index) {
+        if (index < 0 || index >= this.length) return undefined;
+        return this.items[(this.start + index) % this.capacity];
+    }
+
+    /**
+     * Returns the most recently appended item.
+     * @returns {*} The newest item, or undefined if empty.
+     */
+    peekLast() {
+        return this.get(this.length - 1);
+    }
+
+    /**
+     * Copies the retained items into a new array, oldest first.
+     * @returns {Array<*>} The items.
+     */
+    toArray() {
+        const result = new Array(this.length);
+        for (let i = 0; i < this.length; i++) {
+            result[i] = this.items[(this.start + i) % this.capacity];
+        }
+        return result;
+    }
+
+    /**
+     * Replaces the contents with the last `capacity` items of the given list.
+     * @param {Array<*>} [items=[]] - The items to load, oldest first.
+     */
+    reset(items = []) {
+        this.items = new Array(this.capacity);
+        this.start = 0;
+        this.length = 0;
+        const offset = Math.max(0, items.length - this.capacity);
+        for (let i = offset; i < items.length; i++) {
+            this.push(items[i]);
+        }
+    }
+}
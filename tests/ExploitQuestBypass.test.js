@@ -16,6 +16,7 @@ describe('Exploit: Quest Logic Bypass (Artisan)', () => {
         PersistenceManager.mockImplementation(() => ({
             loadJournal: jest.fn().mockReturnValue([]),
             saveJournal: jest.fn(),
+            appendJournal: jest.fn(),
             loadRecipes: jest.fn().mockReturnValue([]),
             saveRecipes: jest.fn(),
             loadPet: jest.fn().mockReturnValue(null),
@@ -53,6 +53,7 @@ jest.mock('../js/PersistenceManager.js', () => {
             saveRecipes: jest.fn(),
             savePet: jest.fn(),
             saveJournal: jest.fn(), // Added missing mock
+            appendJournal: jest.fn(),
         }))
     };
 });
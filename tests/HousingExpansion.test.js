@@ -42,7 +42,8 @@ describe('Housing Expansion System', () => {
         // Mock PersistenceManager to prevent actual saves
         pet.persistenceManager = {
             savePet: jest.fn(),
-            saveJournal: jest.fn()
+            saveJournal: jest.fn(),
+            appendJournal: jest.fn()
         };
 
         // Clear inventory
@@ -15,6 +15,7 @@ jest.mock('../js/PersistenceManager.js', () => {
         PersistenceManager: jest.fn().mockImplementation(() => ({
             loadJournal: jest.fn().mockReturnValue([]),
             saveJournal: jest.fn(),
+            appendJournal: jest.fn(),
             loadRecipes: jest.fn().mockReturnValue([]),
             saveRecipes: jest.fn(),
             loadHallOfFame: jest.fn().mockReturnValue([]),
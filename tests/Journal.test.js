@@ -31,7 +31,7 @@ describe('Journal Capping and Batching', () => {
     });
 
     test('should batch saves using queueMicrotask', (done) => {
-        const saveSpy = jest.spyOn(pet.persistence, 'saveJournal');
+        const saveSpy = jest.spyOn(pet.persistence, 'appendJournal');
 
         pet.addJournalEntry('Entry 1');
         pet.addJournalEntry('Entry 2');
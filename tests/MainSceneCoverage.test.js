@@ -258,4 +258,61 @@ describe('MainScene Coverage', () => {
         expect(scene.placedFurniture['Entryway'].length).toBe(1);
         expect(scene.isPlacementMode).toBe(false);
     });
+
+    test('pending wiki unlocks are written when the page hides, unloads or the scene shuts down', async () => {
+        scene.create();
+        await scene._initPromise;
+        const saveWiki = jest.fn().mockResolvedValue();
+        scene.wikiSystem.persistence._save = saveWiki;
+        const wikiSaves = () => saveWiki.mock.calls.filter(call => call[0] === 'nadagotchi_wiki').length;
+
+        await scene.wikiSystem.unlockEntry('pets', 'Robot');
+        expect(wikiSaves()).toBe(0);
+        scene.scheduler.setHidden(true);
+        expect(wikiSaves()).toBe(1);
+        expect(scene.persistence.savePet).toHaveBeenCalled();
+
+        await scene.wikiSystem.unlockEntry('pets', 'Slime');
+        window.dispatchEvent(new Event('beforeunload'));
+        expect(wikiSaves()).toBe(2);
+
+        await scene.wikiSystem.unlockEntry('items', 'Stick');
+        scene.shutdown();
+        expect(wikiSaves()).toBe(3);
+    });
+
+    test('only significant motion, UIScene tweens and other running scenes hold off low-power pacing', async () => {
+        scene.create();
+        await scene._initPromise;
+        scene.activeEffects = 0;
+        mockWeatherParticles.isHeavy = jest.fn().mockReturnValue(false);
+        expect(scene.isAnimating()).toBe(false);
+
+        // Rain or snow only counts while it falls in the garden
+        mockWeatherParticles.isHeavy.mockReturnValue(true);
+        expect(scene.isAnimating()).toBe(true);
+        scene.location = 'INDOOR';
+        expect(scene.isAnimating()).toBe(false);
+
+        scene.showNotification('Hello!');
+        expect(scene.isAnimating()).toBe(true);
+        const notificationTween = scene.tweens.add.mock.calls[scene.tweens.add.mock.calls.length - 1][0];
+        notificationTween.onComplete();
+        expect(scene.isAnimating()).toBe(false);
+
+        // Toasts and button feedback tween in UIScene, which keeps running behind modals
+        const uiTweens = [];
+        scene.scene.get.mockReturnValue({ tweens: { getTweens: () => uiTweens } });
+        expect(scene.isUIAnimating()).toBe(false);
+        uiTweens.push({});
+        expect(scene.isUIAnimating()).toBe(true);
+        expect(scene.scene.get).toHaveBeenLastCalledWith('UIScene');
+
+        const uiScene = { sys: { settings: { key: 'UIScene' } } };
+        const running = [scene, uiScene];
+        scene.scene.manager = { getScenes: jest.fn(() => running) };
+        expect(scene.isOtherSceneActive()).toBe(false);
+        running.push({ sys: { settings: { key: 'StudyMinigameScene' } } });
+        expect(scene.isOtherSceneActive()).toBe(true);
+    });
 });
@@ -1,5 +1,6 @@
 import { PersistenceManager } from '../js/PersistenceManager.js';
 import { setupLocalStorageMock } from './helpers/mockLocalStorage.js';
+import { Config } from '../js/Config.js';
 
 describe('PersistenceManager', () => {
     let persistenceManager;
@@ -84,6 +85,152 @@ describe('PersistenceManager', () => {
         expect(loadedEntries).toEqual([]);
     });
 
+    describe('chunked journal log', () => {
+        const makeEntries = (count, offset = 0) =>
+            Array.from({ length: count }, (_, i) => ({ date: 'Day', text: `Entry ${i + offset}` }));
+
+        afterEach(() => {
+            Config.JOURNAL.ARCHIVE_OLD_CHUNKS = false;
+        });
+
+        test('appendJournal writes fixed-size chunks and only rewrites the tail', async () => {
+            const chunkSize = Config.JOURNAL.CHUNK_SIZE;
+            await persistenceManager.appendJournal(makeEntries(chunkSize + 1));
+
+            expect(localStorage.getItem('nadagotchi_journal_chunk_0')).not.toBeNull();
+            expect(localStorage.getItem('nadagotchi_journal_chunk_1')).not.toBeNull();
+
+            const firstChunk = localStorage.getItem('nadagotchi_journal_chunk_0');
+            await persistenceManager.appendJournal(makeEntries(1, chunkSize + 1));
+            expect(localStorage.getItem('nadagotchi_journal_chunk_0')).toBe(firstChunk);
+
+            const loaded = await persistenceManager.loadJournal();
+            expect(loaded).toHaveLength(chunkSize + 2);
+            expect(loaded[loaded.length - 1].text).toBe(`Entry ${chunkSize + 1}`);
+        });
+
+        test('loadJournal returns only the newest MAX_JOURNAL_ENTRIES and old chunks are dropped', async () => {
+            const limit = Config.LIMITS.MAX_JOURNAL_ENTRIES;
+            await persistenceManager.appendJournal(makeEntries(limit * 3));
+
+            const loaded = await persistenceManager.loadJournal();
+            expect(loaded).toHaveLength(limit);
+            expect(loaded[0].text).toBe(`Entry ${limit * 2}`);
+            expect(localStorage.getItem('nadagotchi_journal_chunk_0')).toBeNull();
+        });
+
+        test('loadJournalPage walks back through the log with cursors', async () => {
+            await persistenceManager.appendJournal(makeEntries(45));
+
+            const seen = [];
+            let cursor = null;
+            do {
+                const page = await persistenceManager.loadJournalPage(cursor, 7);
+                seen.push(...page.entries.map(e => e.text));
+                cursor = page.nextCursor;
+            } while (cursor);
+
+            expect(seen).toHaveLength(45);
+            expect(seen[0]).toBe('Entry 44');
+            expect(seen[44]).toBe('Entry 0');
+        });
+
+        test('without archiving, paged reads stop at MAX_JOURNAL_ENTRIES like loadJournal', async () => {
+            const limit = Config.LIMITS.MAX_JOURNAL_ENTRIES;
+            await persistenceManager.appendJournal(makeEntries(limit * 2 + 5));
+
+            const seen = [];
+            let cursor = null;
+            do {
+                const page = await persistenceManager.loadJournalPage(cursor, 7);
+                seen.push(...page.entries.map(e => e.text));
+                cursor = page.nextCursor;
+            } while (cursor);
+
+            const loaded = await persistenceManager.loadJournal();
+            expect(seen).toHaveLength(limit);
+            expect(seen.slice().reverse()).toEqual(loaded.map(e => e.text));
+        });
+
+        test('pages report how many entries paging can reach', async () => {
+            const limit = Config.LIMITS.MAX_JOURNAL_ENTRIES;
+            await persistenceManager.appendJournal(makeEntries(45));
+            expect((await persistenceManager.loadJournalPage(null, 7)).total).toBe(45);
+
+            await persistenceManager.appendJournal(makeEntries(limit * 2, 45));
+            expect((await persistenceManager.loadJournalPage(null, 7)).total).toBe(limit);
+        });
+
+        test('a chunk written before an interrupted metadata write is adopted, not overwritten', async () => {
+            const chunkSize = Config.JOURNAL.CHUNK_SIZE;
+            await persistenceManager.appendJournal(makeEntries(chunkSize));
+            // Simulate a crash between the rollover chunk write and the metadata write
+            await persistenceManager._save('nadagotchi_journal_chunk_1', makeEntries(2, chunkSize));
+
+            const reloaded = new PersistenceManager();
+            await reloaded.appendJournal(makeEntries(1, chunkSize + 2));
+
+            const loaded = await reloaded.loadJournal();
+            expect(loaded).toHaveLength(chunkSize + 3);
+            expect(loaded[loaded.length - 1].text).toBe(`Entry ${chunkSize + 2}`);
+            expect((await reloaded.loadJournalPage(null, 5)).total).toBe(chunkSize + 3);
+        });
+
+        test('appends from a second instance are not overwritten by a stale cache', async () => {
+            const other = new PersistenceManager();
+            await persistenceManager.appendJournal(makeEntries(3));
+            await other.appendJournal(makeEntries(2, 3));
+            await persistenceManager.appendJournal(makeEntries(1, 5));
+
+            const loaded = await persistenceManager.loadJournal();
+            expect(loaded.map(e => e.text)).toEqual(makeEntries(6).map(e => e.text));
+        });
+
+        test('archived chunks stay reachable through paged reads', async () => {
+            Config.JOURNAL.ARCHIVE_OLD_CHUNKS = true;
+            const limit = Config.LIMITS.MAX_JOURNAL_ENTRIES;
+            await persistenceManager.appendJournal(makeEntries(limit * 2));
+
+            expect(await persistenceManager.loadJournal()).toHaveLength(limit);
+            expect(localStorage.getItem('nadagotchi_journal_chunk_0')).not.toBeNull();
+
+            let total = 0;
+            let cursor = null;
+            do {
+                const page = await persistenceManager.loadJournalPage(cursor, 50);
+                total += page.entries.length;
+                cursor = page.nextCursor;
+            } while (cursor);
+            expect(total).toBe(limit * 2);
+        });
+
+        test('a tampered chunk only loses its own entries', async () => {
+            const warnSpy = jest.spyOn(console, 'warn').mockImplementation(() => {});
+            const chunkSize = Config.JOURNAL.CHUNK_SIZE;
+            await persistenceManager.appendJournal(makeEntries(chunkSize * 2));
+
+            const [encoded] = localStorage.getItem('nadagotchi_journal_chunk_0').split('|');
+            localStorage.setItem('nadagotchi_journal_chunk_0', `${encoded}|${'0'.repeat(64)}`);
+
+            const loaded = await persistenceManager.loadJournal();
+            expect(loaded).toHaveLength(chunkSize);
+            expect(loaded[0].text).toBe(`Entry ${chunkSize}`);
+            warnSpy.mockRestore();
+        });
+
+        test('migrates a legacy single-key journal', async () => {
+            await persistenceManager._save('nadagotchi_journal', makeEntries(3));
+
+            const loaded = await persistenceManager.loadJournal();
+            expect(loaded.map(e => e.text)).toEqual(['Entry 0', 'Entry 1', 'Entry 2']);
+            expect(localStorage.getItem('nadagotchi_journal')).toBeNull();
+
+            await persistenceManager.appendJournal(makeEntries(1, 3));
+            const page = await persistenceManager.loadJournalPage(null, 2);
+            expect(page.entries.map(e => e.text)).toEqual(['Entry 3', 'Entry 2']);
+        });
+    });
+
     test('should save and load recipes', async () => {
         const recipes = ['Recipe A', 'Recipe B'];
         await persistenceManager.saveRecipes(recipes);
@@ -0,0 +1,28 @@
+import { RingBuffer } from '../js/utils/RingBuffer.js';
+
+describe('RingBuffer', () => {
+    test('push appends until capacity and then evicts the oldest item', () => {
+        const buffer = new RingBuffer(3);
+        expect(buffer.push('a')).toBeUndefined();
+        buffer.push('b');
+        buffer.push('c');
+        expect(buffer.push('d')).toBe('a');
+
+        expect(buffer.length).toBe(3);
+        expect(buffer.toArray()).toEqual(['b', 'c', 'd']);
+        expect(buffer.get(0)).toBe('b');
+        expect(buffer.peekLast()).toBe('d');
+        expect(buffer.get(3)).toBeUndefined();
+    });
+
+    test('reset keeps only the newest items that fit', () => {
+        const buffer = new RingBuffer(2);
+        buffer.push('x');
+        buffer.reset(['a', 'b', 'c']);
+        expect(buffer.toArray()).toEqual(['b', 'c']);
+
+        buffer.reset();
+        expect(buffer.length).toBe(0);
+        expect(buffer.toArray()).toEqual([]);
+    });
+});
@@ -11,6 +11,7 @@ jest.mock('../js/PersistenceManager.js', () => {
                 loadSettings: () => ({}),
                 loadCalendar: () => ({ season: 'Spring', day: 1 }),
                 saveJournal: () => {},
+                appendJournal: () => {},
                 saveRecipes: () => {},
                 saveSettings: () => {},
                 savePet: () => {},
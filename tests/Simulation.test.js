@@ -0,0 +1,102 @@
+import { Config } from '../js/Config.js';
+import { HeadlessPet } from './simulation/HeadlessPet.js';
+import { applyOverrides, createDailyTotals, deriveSeed, mergeDailyTotals, runChunk } from './simulation/lifeSim.js';
+import { toColumns } from './simulation/columnar.js';
+
+describe('Headless life simulator', () => {
+    const task = (policy, firstPet = 0, count = 2) => ({
+        chunkIndex: 0,
+        scenario: { id: 0, policy, overrides: {} },
+        firstPet,
+        count,
+        options: { days: 2, stepMs: 2000 }
+    });
+
+    test('HeadlessPet is reproducible from its seed and keeps its journal in memory', async () => {
+        const a = new HeadlessPet('Adventurer', 42);
+        const b = new HeadlessPet('Adventurer', 42);
+        expect(a.universeSeed).toBe(42);
+        expect(a.uuid).toBe(b.uuid);
+        expect(a.genome.phenotype).toEqual(b.genome.phenotype);
+
+        const saveSpy = jest.spyOn(a.persistence, 'appendJournal');
+        a.addJournalEntry('Hello');
+        await Promise.resolve();
+        expect(a.journalCount).toBe(1);
+        expect(saveSpy).not.toHaveBeenCalled();
+    });
+
+    test('runChunk is deterministic and independent of how pets are chunked', () => {
+        const whole = runChunk(task('caretaker', 0, 3));
+        const again = runChunk(task('caretaker', 0, 3));
+        const split = [runChunk(task('caretaker', 0, 1)), runChunk(task('caretaker', 1, 2))];
+
+        expect(again).toEqual(whole);
+        expect(split.flatMap(r => r.rows)).toEqual(whole.rows);
+
+        const merged = createDailyTotals(2);
+        split.forEach(r => mergeDailyTotals(merged, r.daily));
+        expect(merged.pets).toEqual([3, 3]);
+        expect(merged.debris).toEqual(whole.daily.debris);
+        merged.happiness.forEach((value, day) => expect(value).toBeCloseTo(whole.daily.happiness[day], 6));
+    });
+
+    test('records per-pet metrics for each policy', () => {
+        ['idle', 'random', 'caretaker'].forEach(policy => {
+            const { rows } = runChunk(task(policy));
+            rows.forEach(row => {
+                expect(row.policy).toBe(policy);
+                expect(row.happyFrac + row.neutralFrac + row.sadFrac + row.angryFrac).toBeCloseTo(1, 5);
+                expect(row.finalDebris).toBeLessThanOrEqual(Config.DEBRIS.MAX_COUNT);
+            });
+        });
+
+        const idle = runChunk(task('idle')).rows;
+        idle.forEach(row => {
+            expect(row.workShifts).toBe(0);
+            expect(row.debrisCleaned).toBe(0);
+        });
+    });
+
+    test('rejects unknown policies', () => {
+        expect(() => runChunk(task('speedrun'))).toThrow('Unknown policy: speedrun');
+    });
+
+    test('applyOverrides sets dotted Config paths and restores them', () => {
+        const original = Config.DEBRIS.MAX_COUNT;
+        const restore = applyOverrides(Config, { 'DEBRIS.MAX_COUNT': 3 });
+        expect(Config.DEBRIS.MAX_COUNT).toBe(3);
+        restore();
+        expect(Config.DEBRIS.MAX_COUNT).toBe(original);
+
+        expect(() => applyOverrides(Config, { 'DEBRIS.NOPE': 1 })).toThrow('Unknown Config key: DEBRIS.NOPE');
+    });
+
+    test('scenario overrides only apply while their chunk runs', () => {
+        const original = Config.DEBRIS.SPAWN_CHANCE_DAILY;
+        const { rows } = runChunk({ ...task('idle'), scenario: { id: 1, policy: 'idle', overrides: { 'DEBRIS.SPAWN_CHANCE_DAILY': 0 } } });
+        expect(Config.DEBRIS.SPAWN_CHANCE_DAILY).toBe(original);
+        expect(rows[0].scenario).toBe(1);
+    });
+
+    test('deriveSeed spreads neighbouring indices', () => {
+        const seeds = new Set([0, 1, 2, 3, 4].map(i => deriveSeed(1, i)));
+        expect(seeds.size).toBe(5);
+        seeds.forEach(seed => expect(seed).toBe(seed >>> 0));
+    });
+
+    test('toColumns stores numbers as float64 and strings as dictionary codes', () => {
+        const columns = toColumns([
+            { pet: 0, career: 'Scout', day: 1.5 },
+            { pet: 1, career: '', day: NaN },
+            { pet: 2, career: 'Scout', day: null }
+        ]);
+
+        expect(columns.map(c => c.name)).toEqual(['pet', 'career', 'day']);
+        expect(columns[0].values).toEqual(new Float64Array([0, 1, 2]));
+        expect(columns[1].type).toBe('dict');
+        expect(columns[1].dictionary).toEqual(['Scout', '']);
+        expect(Array.from(columns[1].values)).toEqual([0, 1, 0]);
+        expect(Number.isNaN(columns[2].values[2])).toBe(true);
+    });
+});
@@ -15,6 +15,7 @@ jest.mock('../js/PersistenceManager.js', () => ({
         saveToHallOfFame: jest.fn(),
         loadJournal: jest.fn().mockReturnValue([]),
         saveJournal: jest.fn(),
+        appendJournal: jest.fn(),
         loadRecipes: jest.fn().mockReturnValue([]),
         saveRecipes: jest.fn()
     }))
@@ -174,6 +175,7 @@ describe('StartScene', () => {
             saveToHallOfFame: jest.fn(),
             loadJournal: jest.fn().mockReturnValue([]),
             saveJournal: jest.fn(),
+            appendJournal: jest.fn(),
             loadRecipes: jest.fn().mockReturnValue([]),
             saveRecipes: jest.fn()
         }));
@@ -65,6 +65,7 @@ jest.mock('../js/ButtonFactory', () => {
 });
 
 const mockLoadJournal = jest.fn().mockReturnValue([{ date: 'Day 1', text: 'Diary Entry' }]);
+const mockLoadJournalPage = jest.fn().mockResolvedValue({ entries: [{ date: 'Day 1', text: 'Diary Entry' }], nextCursor: null, total: 1 });
 const mockLoadRecipes = jest.fn().mockReturnValue(['Fancy Bookshelf']);
 const mockLoadHallOfFame = jest.fn().mockReturnValue([]);
 
@@ -73,6 +74,7 @@ jest.mock('../js/PersistenceManager', () => {
         PersistenceManager: jest.fn().mockImplementation(() => {
             return {
                 loadJournal: mockLoadJournal,
+                loadJournalPage: mockLoadJournalPage,
                 loadRecipes: mockLoadRecipes,
                 loadHallOfFame: mockLoadHallOfFame
             };
@@ -100,6 +102,7 @@ describe('UIScene', () => {
 
     beforeEach(() => {
         mockLoadJournal.mockClear();
+        mockLoadJournalPage.mockClear();
         mockLoadRecipes.mockClear();
         mockLoadHallOfFame.mockClear();
         // Access the mocked function from the module if we need to spy on it
@@ -223,6 +226,22 @@ describe('UIScene', () => {
         expect(mockGameEvents.emit).toHaveBeenCalledWith(EventKeys.UI_ACTION, EventKeys.OPEN_JOB_BOARD);
     });
 
+    test('Job Board start button is grayed out without a career', () => {
+        const { ButtonFactory } = require('../js/ButtonFactory');
+        scene.create();
+        scene.nadagotchiData = { currentCareer: null };
+
+        scene.openJobBoardMenu();
+
+        const startCall = ButtonFactory.createButton.mock.calls.find(call => call[3] === 'Start Shift');
+        expect(startCall[5].disabledColor).toBe(0x555555);
+        expect(scene.jobBoardModal.startButton.setDisabled).toHaveBeenLastCalledWith(true);
+
+        scene.nadagotchiData = { currentCareer: 'Scout' };
+        scene.openJobBoardMenu();
+        expect(scene.jobBoardModal.startButton.setDisabled).toHaveBeenLastCalledWith(false);
+    });
+
     test('should open modals correctly', async () => {
         scene.create();
         scene.nadagotchiData = { inventory: {} }; // Mock data needed for some modals
@@ -231,7 +250,8 @@ describe('UIScene', () => {
         await scene.handleUIActions(EventKeys.OPEN_JOURNAL);
         expect(scene.journalModal.setVisible).toHaveBeenCalledWith(true);
         expect(scene.scene.pause).toHaveBeenCalledWith('MainScene');
-        expect(mockLoadJournal).toHaveBeenCalled();
+        expect(mockLoadJournalPage).toHaveBeenCalled();
+        expect(scene.journalModal.pageIndicator.setText).toHaveBeenLastCalledWith('1/1');
 
         // Inventory
         scene.handleUIActions(EventKeys.OPEN_INVENTORY);
@@ -99,6 +99,7 @@ jest.mock('../js/ButtonFactory', () => {
 });
 
 const mockLoadJournal = jest.fn().mockReturnValue([{ date: 'Day 1', text: 'Diary Entry' }]);
+const mockLoadJournalPage = jest.fn().mockResolvedValue({ entries: [{ date: 'Day 1', text: 'Diary Entry' }], nextCursor: null, total: 1 });
 const mockLoadRecipes = jest.fn().mockReturnValue(['Fancy Bookshelf']);
 const mockLoadHallOfFame = jest.fn().mockReturnValue([]);
 
@@ -107,6 +108,7 @@ jest.mock('../js/PersistenceManager', () => {
         PersistenceManager: jest.fn().mockImplementation(() => {
             return {
                 loadJournal: mockLoadJournal,
+                loadJournalPage: mockLoadJournalPage,
                 loadRecipes: mockLoadRecipes,
                 loadHallOfFame: mockLoadHallOfFame
             };
@@ -123,6 +125,7 @@ describe('UIScene Modal Management', () => {
 
     beforeEach(() => {
         mockLoadJournal.mockClear();
+        mockLoadJournalPage.mockClear();
         mockLoadRecipes.mockClear();
         mockLoadHallOfFame.mockClear();
 
@@ -0,0 +1,330 @@
+import { UpdateScheduler } from '../js/UpdateScheduler.js';
+
+describe('UpdateScheduler', () => {
+    let scheduler;
+
+    beforeEach(() => {
+        jest.useFakeTimers();
+        jest.setSystemTime(0);
+        scheduler = new UpdateScheduler({ idleAfterMs: 1000, lowPowerFps: 10 });
+    });
+
+    afterEach(() => {
+        scheduler.detach();
+        jest.useRealTimers();
+    });
+
+    describe('task scheduling', () => {
+        test('runs tasks at their registered rate and passes the elapsed slot time', () => {
+            const run = jest.fn();
+            scheduler.register('slow', run, { rate: 10 });
+
+            scheduler.update(0);
+            scheduler.update(50);
+            scheduler.update(100);
+            scheduler.update(150);
+            scheduler.update(250);
+
+            expect(run).toHaveBeenCalledTimes(3);
+            expect(run.mock.calls[1]).toEqual([100, 100]);
+            expect(run.mock.calls[2]).toEqual([250, 150]);
+        });
+
+        test('runs tasks without a rate every frame', () => {
+            const run = jest.fn();
+            scheduler.register('everyFrame', run);
+
+            scheduler.update(0);
+            scheduler.update(16);
+            scheduler.update(32);
+
+            expect(run).toHaveBeenCalledTimes(3);
+        });
+
+        test('skips clean tasks but still consumes their slot', () => {
+            let dirty = false;
+            const run = jest.fn();
+            scheduler.register('sky', run, { rate: 10, isDirty: () => dirty });
+
+            scheduler.update(0);
+            expect(run).not.toHaveBeenCalled();
+
+            dirty = true;
+            scheduler.update(50); // Slot not due yet
+            expect(run).not.toHaveBeenCalled();
+
+            scheduler.update(100);
+            expect(run).toHaveBeenCalledWith(100, 100);
+        });
+
+        test('markDirty forces a run on the next update regardless of rate or dirty state', () => {
+            const run = jest.fn();
+            scheduler.register('lighting', run, { rate: 1, isDirty: () => false });
+
+            scheduler.update(0);
+            scheduler.markDirty('lighting');
+            scheduler.update(16);
+            scheduler.update(32);
+
+            expect(run).toHaveBeenCalledTimes(1);
+            expect(run).toHaveBeenCalledWith(16, 16);
+        });
+
+        test('markAllDirty forces every task and unknown names are ignored', () => {
+            const a = jest.fn();
+            const b = jest.fn();
+            scheduler.register('a', a, { rate: 1, isDirty: () => false });
+            scheduler.register('b', b, { rate: 1, isDirty: () => false });
+            scheduler.update(0);
+
+            scheduler.markDirty('missing');
+            scheduler.markAllDirty();
+            scheduler.update(16);
+
+            expect(a).toHaveBeenCalledTimes(1);
+            expect(b).toHaveBeenCalledTimes(1);
+        });
+
+        test('caps the elapsed time handed to a task', () => {
+            const run = jest.fn();
+            scheduler.register('movement', run, { rate: 10 });
+
+            scheduler.update(0);
+            scheduler.update(60000);
+
+            expect(run).toHaveBeenLastCalledWith(60000, scheduler.maxStepMs);
+        });
+    });
+
+    describe('frame pacing', () => {
+        let game;
+
+        beforeEach(() => {
+            game = {
+                events: { on: jest.fn(), off: jest.fn() },
+                loop: { sleep: jest.fn(), wake: jest.fn() }
+            };
+        });
+
+        test('attach listens for postrender and detach removes the listener', () => {
+            scheduler.attach(game);
+            expect(game.events.on).toHaveBeenCalledWith('postrender', scheduler.pace, scheduler);
+
+            scheduler.detach();
+            expect(game.events.off).toHaveBeenCalledWith('postrender', scheduler.pace, scheduler);
+            expect(scheduler.game).toBeNull();
+        });
+
+        test('keeps the full frame rate while there is recent input', () => {
+            scheduler.attach(game);
+            jest.advanceTimersByTime(500);
+            scheduler.pace();
+
+            expect(scheduler.lowPower).toBe(false);
+            expect(game.loop.sleep).not.toHaveBeenCalled();
+        });
+
+        test('sleeps the loop for one low-power frame once idle', () => {
+            scheduler.attach(game);
+            jest.advanceTimersByTime(1500);
+            scheduler.pace();
+
+            expect(scheduler.lowPower).toBe(true);
+            expect(game.loop.sleep).toHaveBeenCalledTimes(1);
+            expect(game.loop.wake).not.toHaveBeenCalled();
+
+            // A second render while asleep does not stack timers
+            scheduler.pace();
+            expect(game.loop.sleep).toHaveBeenCalledTimes(1);
+
+            jest.advanceTimersByTime(100);
+            expect(game.loop.wake).toHaveBeenCalledTimes(1);
+        });
+
+        test('does not idle while the scene reports it is busy', () => {
+            let busy = true;
+            scheduler.attach(game, { isBusy: () => busy });
+            jest.advanceTimersByTime(1500);
+
+            scheduler.pace();
+            expect(game.loop.sleep).not.toHaveBeenCalled();
+
+            busy = false;
+            scheduler.pace();
+            expect(game.loop.sleep).toHaveBeenCalled();
+        });
+
+        test('a paused scene idles even if it reported being busy', () => {
+            scheduler.attach(game, { isBusy: () => true });
+            scheduler.setScenePaused(true);
+            jest.advanceTimersByTime(1500);
+
+            expect(scheduler.shouldIdle()).toBe(true);
+        });
+
+        test('never paces the loop while another scene such as a minigame runs', () => {
+            let minigame = true;
+            scheduler.attach(game, { isBusy: () => false, isOtherSceneActive: () => minigame });
+            scheduler.setScenePaused(true);
+            jest.advanceTimersByTime(1500);
+
+            scheduler.pace();
+            expect(game.loop.sleep).not.toHaveBeenCalled();
+
+            minigame = false;
+            scheduler.pace();
+            expect(game.loop.sleep).toHaveBeenCalledTimes(1);
+        });
+
+        test('input wakes the loop immediately', () => {
+            scheduler.attach(game);
+            jest.advanceTimersByTime(1500);
+            scheduler.pace();
+
+            window.dispatchEvent(new Event('pointerdown'));
+
+            expect(game.loop.wake).toHaveBeenCalledTimes(1);
+            expect(scheduler.lowPower).toBe(false);
+            jest.advanceTimersByTime(100);
+            expect(game.loop.wake).toHaveBeenCalledTimes(1);
+        });
+
+        test('does not idle while an overlay scene is animating, even behind a modal', () => {
+            let toast = true;
+            scheduler.attach(game, { isBusy: () => false, isOverlayBusy: () => toast });
+            scheduler.setScenePaused(true);
+            jest.advanceTimersByTime(1500);
+
+            scheduler.pace();
+            expect(game.loop.sleep).not.toHaveBeenCalled();
+
+            toast = false;
+            scheduler.pace();
+            expect(game.loop.sleep).toHaveBeenCalledTimes(1);
+        });
+
+        describe('after a tab switch', () => {
+            let loop;
+
+            beforeEach(() => {
+                // Mirrors Phaser's TimeStep: sleep() stops the frame request, pause()/resume() only flip the flag
+                loop = {
+                    running: true,
+                    sleep: jest.fn(() => { loop.running = false; }),
+                    wake: jest.fn(() => { loop.running = true; }),
+                    pause: () => { loop.running = false; },
+                    resume: () => { loop.running = true; }
+                };
+                game.loop = loop;
+                scheduler.attach(game);
+                jest.advanceTimersByTime(1500);
+                scheduler.pace();
+                expect(loop.sleep).toHaveBeenCalledTimes(1);
+            });
+
+            test('wakes a loop that was asleep when the page was hidden', () => {
+                loop.pause();
+                scheduler.setHidden(true);
+                jest.advanceTimersByTime(5000);
+                expect(loop.wake).not.toHaveBeenCalled();
+
+                scheduler.setHidden(false);
+                expect(loop.wake).toHaveBeenCalledTimes(1);
+                expect(loop.running).toBe(true);
+                expect(scheduler.lowPower).toBe(false);
+            });
+
+            test('wakes the loop even when Phaser resumed it first', () => {
+                loop.pause();
+                scheduler.setHidden(true);
+                loop.resume();
+                scheduler.setHidden(false);
+
+                expect(loop.sleep).toHaveBeenCalledTimes(2);
+                expect(loop.wake).toHaveBeenCalledTimes(1);
+                expect(loop.running).toBe(true);
+            });
+
+            test('input wakes a loop left stopped after the page returns', () => {
+                scheduler.setHidden(true);
+                scheduler.notifyActivity();
+                expect(loop.wake).not.toHaveBeenCalled();
+
+                scheduler.setHidden(false);
+                expect(loop.wake).toHaveBeenCalledTimes(1);
+
+                loop.running = false;
+                scheduler.notifyActivity();
+                expect(loop.wake).toHaveBeenCalledTimes(2);
+                expect(loop.running).toBe(true);
+            });
+        });
+
+        test('resuming the scene refreshes every task and counts as activity', () => {
+            const run = jest.fn();
+            scheduler.register('indicators', run, { rate: 1, isDirty: () => false });
+            scheduler.update(0);
+            scheduler.attach(game);
+            jest.advanceTimersByTime(1500);
+
+            scheduler.setScenePaused(true);
+            scheduler.setScenePaused(false);
+            scheduler.update(16);
+
+            expect(run).toHaveBeenCalledTimes(1);
+            expect(scheduler.shouldIdle()).toBe(false);
+        });
+    });
+
+    describe('page visibility', () => {
+        let callbacks;
+
+        beforeEach(() => {
+            callbacks = { onCatchUp: jest.fn(), onHidden: jest.fn() };
+            scheduler.attach({ events: { on: jest.fn(), off: jest.fn() } }, callbacks);
+        });
+
+        test('hands the hidden duration to onCatchUp when the page returns', () => {
+            scheduler.setHidden(true);
+            expect(callbacks.onHidden).toHaveBeenCalledTimes(1);
+            expect(scheduler.shouldIdle()).toBe(false);
+
+            jest.advanceTimersByTime(90000);
+            scheduler.setHidden(false);
+
+            expect(callbacks.onCatchUp).toHaveBeenCalledWith(90000);
+            expect(scheduler.isHidden).toBe(false);
+        });
+
+        test('ignores repeated visibility states', () => {
+            scheduler.setHidden(false);
+            scheduler.setHidden(true);
+            scheduler.setHidden(true);
+
+            expect(callbacks.onHidden).toHaveBeenCalledTimes(1);
+            expect(callbacks.onCatchUp).not.toHaveBeenCalled();
+        });
+
+        test('skips the catch-up while a modal has paused the scene', () => {
+            scheduler.setScenePaused(true);
+            scheduler.setHidden(true);
+            jest.advanceTimersByTime(5000);
+            scheduler.setHidden(false);
+
+            expect(callbacks.onCatchUp).not.toHaveBeenCalled();
+        });
+
+        test('reacts to the visibilitychange event', () => {
+            const hidden = jest.spyOn(document, 'hidden', 'get').mockReturnValue(true);
+            document.dispatchEvent(new Event('visibilitychange'));
+            expect(scheduler.isHidden).toBe(true);
+
+            jest.advanceTimersByTime(2000);
+            hidden.mockReturnValue(false);
+            document.dispatchEvent(new Event('visibilitychange'));
+
+            expect(callbacks.onCatchUp).toHaveBeenCalledWith(2000);
+            hidden.mockRestore();
+        });
+    });
+});
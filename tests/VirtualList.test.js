@@ -0,0 +1,111 @@
+import { jest } from '@jest/globals';
+import { setupPhaserMock, createMockAdd } from './helpers/mockPhaser';
+
+setupPhaserMock();
+
+import { VirtualList } from '../js/VirtualList.js';
+
+describe('VirtualList', () => {
+    let scene;
+    let parent;
+    let createRow;
+    let updateRow;
+
+    const buildList = () => new VirtualList(scene, parent, {
+        x: 0, y: 0, width: 200, height: 100, rowHeight: 25,
+        createRow,
+        updateRow
+    });
+
+    beforeEach(() => {
+        scene = { add: createMockAdd() };
+        parent = { add: jest.fn() };
+        createRow = jest.fn((row) => {
+            row.label = scene.add.text(0, 0, '');
+            return [row.label];
+        });
+        updateRow = jest.fn((row, item) => row.label.setText(item));
+    });
+
+    test('creates a fixed pool sized to the viewport', () => {
+        const list = buildList();
+        expect(list.rows).toHaveLength(4);
+        expect(createRow).toHaveBeenCalledTimes(4);
+    });
+
+    test('setData only binds visible rows and hides spare rows', () => {
+        const list = buildList();
+        list.setData(['a', 'b']);
+
+        expect(updateRow).toHaveBeenCalledTimes(2);
+        expect(list.rows[0].item).toBe('a');
+        expect(list.rows[1].item).toBe('b');
+        expect(list.rows[2].item).toBeNull();
+        expect(list.rows[2].container.setVisible).toHaveBeenLastCalledWith(false);
+    });
+
+    test('large data sets reuse the pool instead of creating objects', () => {
+        const list = buildList();
+        const items = Array.from({ length: 1000 }, (_, i) => `item-${i}`);
+        const textCalls = scene.add.text.mock.calls.length;
+
+        list.setData(items);
+
+        expect(scene.add.text.mock.calls.length).toBe(textCalls);
+        expect(updateRow).toHaveBeenCalledTimes(4);
+    });
+
+    test('scrolling rebinds rows in place and clamps to the data range', () => {
+        const list = buildList();
+        const items = Array.from({ length: 10 }, (_, i) => `item-${i}`);
+        list.setData(items);
+
+        list.scrollBy(3);
+        expect(list.scrollIndex).toBe(3);
+        expect(list.rows[0].item).toBe('item-3');
+        expect(list.rows[0].label.setText).toHaveBeenLastCalledWith('item-3');
+
+        list.scrollTo(100);
+        expect(list.scrollIndex).toBe(6);
+        expect(list.rows[3].item).toBe('item-9');
+
+        list.scrollBy(-100);
+        expect(list.scrollIndex).toBe(0);
+    });
+
+    test('wheel and drag input scroll the list', () => {
+        const list = buildList();
+        list.setData(Array.from({ length: 10 }, (_, i) => i));
+
+        list.hitArea.emit('wheel', {}, 0, 120);
+        expect(list.scrollIndex).toBe(1);
+
+        list.hitArea.emit('pointermove', { isDown: true, y: 0, prevPosition: { y: 50 } });
+        expect(list.scrollIndex).toBe(3);
+    });
+
+    test('setData resets the scroll position by default', () => {
+        const list = buildList();
+        list.setData(Array.from({ length: 10 }, (_, i) => i));
+        list.scrollTo(5);
+
+        list.setData([1, 2, 3, 4, 5, 6]);
+        expect(list.scrollIndex).toBe(0);
+    });
+
+    test('setData without a reset clamps the scroll position when the list shrinks', () => {
+        const list = buildList();
+        list.setData(Array.from({ length: 10 }, (_, i) => `item-${i}`));
+        list.scrollTo(6);
+
+        list.setData(['a', 'b', 'c', 'd', 'e'], false);
+        expect(list.scrollIndex).toBe(1);
+        expect(list.rows[0].item).toBe('b');
+        expect(list.rows[3].item).toBe('e');
+        expect(list.rows[3].container.setVisible).toHaveBeenLastCalledWith(true);
+
+        list.setData(['a', 'b'], false);
+        expect(list.scrollIndex).toBe(0);
+        expect(list.scrollThumb.setVisible).toHaveBeenLastCalledWith(false);
+    });
+});
@@ -16,6 +16,7 @@ describe('WikiSystem', () => {
     });
 
     afterEach(() => {
+        jest.useRealTimers();
         jest.restoreAllMocks();
     });
 
@@ -115,13 +116,42 @@ describe('WikiSystem', () => {
             expect(console.warn).toHaveBeenCalledWith('Invalid wiki category: invalid_category');
         });
 
-        it('should add entry, save, and return true for new entry', async () => {
-            const saveSpy = jest.spyOn(wikiSystem, 'save').mockResolvedValue();
+        it('should add entry, schedule a save, and return true for new entry', async () => {
+            jest.useFakeTimers();
+            const saveSpy = jest.spyOn(wikiSystem, 'save');
             const result = await wikiSystem.unlockEntry('pets', 'Robot');
 
             expect(result).toBe(true);
             expect(wikiSystem.entries.pets).toContain('Robot');
-            expect(saveSpy).toHaveBeenCalled();
+            expect(saveSpy).not.toHaveBeenCalled();
+
+            jest.runAllTimers();
+            expect(saveSpy).toHaveBeenCalledTimes(1);
+        });
+
+        it('should coalesce a burst of unlocks into a single save', async () => {
+            jest.useFakeTimers();
+            for (let i = 0; i < 50; i++) {
+                await wikiSystem.unlockEntry('items', `Item ${i}`);
+            }
+            expect(mockPersistenceManager._save).not.toHaveBeenCalled();
+
+            jest.runAllTimers();
+            expect(mockPersistenceManager._save).toHaveBeenCalledTimes(1);
+            expect(mockPersistenceManager._save.mock.calls[0][1].entries.items).toHaveLength(50);
+        });
+
+        it('should write a pending save immediately on flush', async () => {
+            jest.useFakeTimers();
+            await wikiSystem.unlockEntry('pets', 'Robot');
+            await wikiSystem.flush();
+
+            expect(mockPersistenceManager._save).toHaveBeenCalledWith('nadagotchi_wiki', {
+                entries: { pets: ['Slime', 'Robot'], items: [] }
+            });
+
+            jest.runAllTimers();
+            expect(mockPersistenceManager._save).toHaveBeenCalledTimes(1);
         });
 
         it('should return false for already unlocked entry', async () => {
@@ -172,4 +202,47 @@ describe('WikiSystem', () => {
             expect(wikiSystem.getEntries('invalid_category')).toEqual([]);
         });
     });
+
+    describe('search', () => {
+        beforeEach(() => {
+            wikiSystem.entries = {
+                pets: ["Slime", "Robot"],
+                items: ["Goldfish Fillet", "Golden Apple", "Apple"]
+            };
+        });
+
+        it('should match word prefixes case-insensitively', () => {
+            expect(wikiSystem.search('gol', 'items')).toEqual(["Goldfish Fillet", "Golden Apple"]);
+            expect(wikiSystem.search('APP', 'items')).toEqual(["Golden Apple", "Apple"]);
+        });
+
+        it('should require every query word to match', () => {
+            expect(wikiSystem.search('gold fi', 'items')).toEqual(["Goldfish Fillet"]);
+            expect(wikiSystem.search('gold zzz', 'items')).toEqual([]);
+        });
+
+        it('should search across categories when no category is given', () => {
+            expect(wikiSystem.search('s')).toEqual([{ category: 'pets', id: 'Slime' }]);
+        });
+
+        it('should match names with non-ASCII letters', () => {
+            wikiSystem.entries = { items: ["Crème Brûlée", "Café Latte"] };
+            expect(wikiSystem.search('brû', 'items')).toEqual(["Crème Brûlée"]);
+            expect(wikiSystem.search('CAFÉ', 'items')).toEqual(["Café Latte"]);
+        });
+
+        it('should return all entries for an empty query', () => {
+            expect(wikiSystem.search('  ', 'pets')).toEqual(["Slime", "Robot"]);
+        });
+
+        it('should index newly unlocked entries', async () => {
+            jest.useFakeTimers();
+            await wikiSystem.unlockEntry('pets', 'Golem');
+            expect(wikiSystem.search('go')).toEqual([
+                { category: 'items', id: 'Goldfish Fillet' },
+                { category: 'items', id: 'Golden Apple' },
+                { category: 'pets', id: 'Golem' }
+            ]);
+        });
+    });
 });
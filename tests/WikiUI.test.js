@@ -199,6 +199,39 @@ describe('WikiUI', () => {
         });
     });
 
+    describe('setSearchQuery', () => {
+        beforeEach(() => {
+            mainScene.wikiSystem.search = jest.fn().mockReturnValue(["Slime"]);
+            wikiUI.create();
+            wikiUI.show();
+        });
+
+        it('should render search results for the current category', () => {
+            wikiUI.scrollOffset = -40;
+            wikiUI.setSearchQuery('sl');
+
+            expect(wikiUI.scrollOffset).toBe(0);
+            expect(mainScene.wikiSystem.search).toHaveBeenCalledWith('sl', 'pets');
+            expect(scene.add.text).toHaveBeenCalledWith(10, 17, "📖 Slime", expect.any(Object));
+        });
+
+        it('should show a no-match message when nothing matches', () => {
+            mainScene.wikiSystem.search.mockReturnValue([]);
+            wikiUI.setSearchQuery('zzz');
+
+            expect(scene.add.text).toHaveBeenCalledWith(10, 20, "No matching entries...", expect.any(Object));
+        });
+
+        it('should fall back to the full list when the query is cleared', () => {
+            wikiUI.setSearchQuery('sl');
+            mainScene.wikiSystem.search.mockClear();
+            wikiUI.setSearchQuery('');
+
+            expect(mainScene.wikiSystem.search).not.toHaveBeenCalled();
+            expect(mainScene.wikiSystem.getEntries).toHaveBeenCalledWith('pets');
+        });
+    });
+
     describe('resize', () => {
         it('should do nothing if not visible', () => {
             const createSpy = jest.spyOn(wikiUI, 'create');
@@ -0,0 +1,185 @@
+/**
+ * @fileoverview Shared micro-benchmark runner for tests/performance.
+ * Runs warmup passes, collects repeated timed samples, rejects outliers with
+ * Tukey fences and reports ops/sec, a 95% confidence interval and an
+ * approximate allocation cost per operation. Reports are written as JSON when
+ * BENCH_OUTPUT_DIR is set, for tests/performance/compare_baselines.py.
+ */
+
+import fs from 'fs';
+import path from 'path';
+
+// Two-sided 95% Student t critical values, indexed by degrees of freedom (1-30).
+const T_95 = [
+    NaN, 12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+    2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+    2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042
+];
+
+const now = () => performance.now();
+
+const heapUsed = () => (typeof process !== 'undefined' && process.memoryUsage)
+    ? process.memoryUsage().heapUsed
+    : null;
+
+/**
+ * Returns the two-sided 95% t critical value for the given degrees of freedom.
+ * @param {number} df - Degrees of freedom.
+ * @returns {number} The critical value.
+ */
+export function tCritical95(df) {
+    if (df < 1) return NaN;
+    return df < T_95.length ? T_95[df] : 1.96;
+}
+
+/**
+ * Linear-interpolated quantile of a sorted array.
+ * @param {Array<number>} sorted - Ascending values.
+ * @param {number} q - Quantile in [0, 1].
+ * @returns {number} The quantile.
+ */
+export function quantile(sorted, q) {
+    if (sorted.length === 0) return NaN;
+    const pos = (sorted.length - 1) * q;
+    const lo = Math.floor(pos);
+    const hi = Math.ceil(pos);
+    return sorted[lo] + (sorted[hi] - sorted[lo]) * (pos - lo);
+}
+
+/**
+ * Splits samples into kept values and outliers using 1.5 * IQR Tukey fences.
+ * @param {Array<number>} values - The raw samples.
+ * @returns {{kept: Array<number>, outliers: Array<number>}} The partition, in original order.
+ */
+export function rejectOutliers(values) {
+    if (values.length < 4) return { kept: values.slice(), outliers: [] };
+    const sorted = values.slice().sort((a, b) => a - b);
+    const q1 = quantile(sorted, 0.25);
+    const q3 = quantile(sorted, 0.75);
+    const fence = 1.5 * (q3 - q1);
+    const kept = [];
+    const outliers = [];
+    values.forEach(v => {
+        if (v < q1 - fence || v > q3 + fence) outliers.push(v);
+        else kept.push(v);
+    });
+    return { kept, outliers };
+}
+
+/**
+ * Computes summary statistics for a list of per-operation timings.
+ * @param {Array<number>} values - Per-operation times in milliseconds.
+ * @returns {{mean: number, median: number, stdDev: number, moe: number, rme: number}} The statistics.
+ */
+export function summarize(values) {
+    const n = values.length;
+    const mean = values.reduce((sum, v) => sum + v, 0) / n;
+    const variance = n > 1 ? values.reduce((sum, v) => sum + (v - mean) ** 2, 0) / (n - 1) : 0;
+    const stdDev = Math.sqrt(variance);
+    const moe = n > 1 ? tCritical95(n - 1) * stdDev / Math.sqrt(n) : 0;
+    const median = quantile(values.slice().sort((a, b) => a - b), 0.5);
+    return { mean, median, stdDev, moe, rme: mean > 0 ? (moe / mean) * 100 : 0 };
+}
+
+/**
+ * Benchmarks a function.
+ * @param {string} name - The benchmark name (unique within its suite).
+ * @param {function(number): *} fn - The operation under test; receives the iteration index within the sample.
+ * @param {object} [options] - Sampling options.
+ * @param {number} [options.iterations=1000] - Operations per sample.
+ * @param {number} [options.samples=10] - Timed samples to collect.
+ * @param {number} [options.warmup=2] - Untimed samples run first to let the JIT settle.
+ * @param {function(): void} [options.setup] - Untimed hook run before every sample (including warmup).
+ * @returns {object} The benchmark result. Callers may add deterministic metrics to `result.counters`.
+ */
+export function benchmark(name, fn, options = {}) {
+    const iterations = options.iterations || 1000;
+    const sampleCount = options.samples || 10;
+    const warmup = options.warmup !== undefined ? options.warmup : 2;
+    const setup = options.setup || null;
+    const canGc = typeof global !== 'undefined' && typeof global.gc === 'function';
+
+    for (let w = 0; w < warmup; w++) {
+        if (setup) setup();
+        for (let i = 0; i < iterations; i++) fn(i);
+    }
+
+    const perOpMs = [];
+    const bytesPerOp = [];
+    let totalMs = 0;
+    for (let s = 0; s < sampleCount; s++) {
+        if (setup) setup();
+        if (canGc) global.gc();
+        const heapBefore = heapUsed();
+        const start = now();
+        for (let i = 0; i < iterations; i++) fn(i);
+        const elapsed = now() - start;
+        const heapAfter = heapUsed();
+
+        totalMs += elapsed;
+        perOpMs.push(elapsed / iterations);
+        // A collection during the sample makes the delta negative; skip those.
+        if (heapBefore !== null && heapAfter >= heapBefore) {
+            bytesPerOp.push((heapAfter - heapBefore) / iterations);
+        }
+    }
+
+    const { kept, outliers } = rejectOutliers(perOpMs);
+    const stats = summarize(kept);
+    const sortedBytes = bytesPerOp.slice().sort((a, b) => a - b);
+
+    return {
+        name,
+        iterations,
+        warmup,
+        samples: kept.length,
+        rejected: outliers.length,
+        meanMs: stats.mean,
+        medianMs: stats.median,
+        stdDevMs: stats.stdDev,
+        ci95Ms: [stats.mean - stats.moe, stats.mean + stats.moe],
+        rme: stats.rme,
+        opsPerSec: stats.mean > 0 ? 1000 / stats.mean : Infinity,
+        bytesPerOp: sortedBytes.length > 0 ? quantile(sortedBytes, 0.5) : null,
+        gcExposed: canGc,
+        totalMs,
+        sampleMs: kept,
+        counters: {}
+    };
+}
+
+/**
+ * Formats a result as a one-line summary.
+ * @param {object} result - A result from {@link benchmark}.
+ * @returns {string} The summary.
+ */
+export function formatResult(result) {
+    const ops = Math.round(result.opsPerSec).toLocaleString('en-US');
+    const bytes = result.bytesPerOp !== null ? `, ~${Math.round(result.bytesPerOp)} B/op` : '';
+    return `[Benchmark] ${result.name}: ${ops} ops/sec ±${result.rme.toFixed(2)}% ` +
+        `(${result.samples} samples, ${result.rejected} rejected${bytes})`;
+}
+
+/**
+ * Writes a suite's results to `<BENCH_OUTPUT_DIR>/<suite>.json`.
+ * Does nothing unless BENCH_OUTPUT_DIR is set, so regular test runs leave no files behind.
+ * @param {string} suite - The suite name, used as the file name.
+ * @param {Array<object>} results - Results from {@link benchmark}.
+ * @returns {string|null} The written path, or null if reporting is disabled.
+ */
+export function writeBenchmarkReport(suite, results) {
+    const outputDir = typeof process !== 'undefined' ? process.env.BENCH_OUTPUT_DIR : undefined;
+    if (!outputDir) return null;
+
+    fs.mkdirSync(outputDir, { recursive: true });
+    const file = path.join(outputDir, `${suite}.json`);
+    const report = {
+        suite,
+        timestamp: new Date().toISOString(),
+        node: process.version,
+        platform: `${process.platform}-${process.arch}`,
+        results
+    };
+    fs.writeFileSync(file, JSON.stringify(report, null, 2));
+    return file;
+}
@@ -1,7 +1,11 @@
 // Micro-benchmark for DanceMinigameScene lane lookup optimization
+// Run with: node tests/performance/DanceMinigame.perf.js
 
-const iterations = 1000000;
-console.log(`Running lookup benchmark for ${iterations} iterations...\n`);
+import { benchmark, formatResult, writeBenchmarkReport } from '../helpers/benchmark.js';
+
+const iterations = 100000;
+const samples = 10;
+console.log(`Running lookup benchmark (${samples} samples x ${iterations} iterations)...\n`);
 
 // Data Setup
 const lanes = [
@@ -25,24 +29,25 @@ const laneIndicators = {
 const keys = ['LEFT', 'DOWN', 'UP', 'RIGHT'];
 
 // Baseline: O(N) Array findIndex
-console.time('Baseline: O(N) findIndex');
 let baselineCount = 0;
-for (let i = 0; i < iterations; i++) {
+const baseline = benchmark('Baseline: O(N) findIndex', (i) => {
     const key = keys[i % 4];
     const index = lanes.findIndex(l => l.key === key);
     const target = laneTargets[index];
     if (target) baselineCount++;
-}
-console.timeEnd('Baseline: O(N) findIndex');
+}, { iterations, samples });
+console.log(formatResult(baseline));
 
 // Optimization: O(1) Dictionary Lookup
-console.time('Optimized: O(1) Dictionary Lookup');
 let optimizedCount = 0;
-for (let i = 0; i < iterations; i++) {
+const optimized = benchmark('Optimized: O(1) Dictionary Lookup', (i) => {
     const key = keys[i % 4];
     const target = laneIndicators[key];
     if (target) optimizedCount++;
-}
-console.timeEnd('Optimized: O(1) Dictionary Lookup');
+}, { iterations, samples });
+console.log(formatResult(optimized));
 
 console.log(`\nResults verification: Baseline hit ${baselineCount}, Optimized hit ${optimizedCount}`);
+
+const reportPath = writeBenchmarkReport('DanceMinigame', [baseline, optimized]);
+if (reportPath) console.log(`Report written to ${reportPath}`);
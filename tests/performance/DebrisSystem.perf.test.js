@@ -3,6 +3,7 @@ import { Nadagotchi } from '../../js/Nadagotchi.js';
 import { DebrisSystem } from '../../js/systems/DebrisSystem.js';
 import { setupPhaserMock } from '../helpers/mockPhaser.js';
 import { setupLocalStorageMock } from '../helpers/mockLocalStorage.js';
+import { benchmark, formatResult, writeBenchmarkReport } from '../helpers/benchmark.js';
 
 // Consolidate mocks into shared setup to reduce line duplication across perf tests
 setupPhaserMock();
@@ -13,6 +14,7 @@ describe('Performance: Debris System', () => {
     let system;
     const N_CLEAN = 10000;
     const N_PENALTY = 50000;
+    const results = [];
 
     beforeEach(() => {
         pet = new Nadagotchi('Adventurer');
@@ -21,18 +23,32 @@ describe('Performance: Debris System', () => {
         system = new DebrisSystem(pet);
     });
 
+    afterAll(() => {
+        writeBenchmarkReport('DebrisSystem', results);
+    });
+
     test('clean (O1)', () => {
-        for (let i = 0; i < N_CLEAN; i++) {
-            const id = `id-${i}`;
-            pet.debris[id] = { id, type: 'weed', location: 'GARDEN', x: 0.5, y: 0.5, created: Date.now() };
-        }
-        pet.debrisCount = N_CLEAN;
+        const initialEnergy = pet.stats.energy;
 
-        const start = performance.now();
-        for (let i = N_CLEAN - 1; i >= 0; i--) {
-            system.clean(`id-${i}`);
-        }
-        console.log(`Clean ${N_CLEAN}: ${(performance.now() - start).toFixed(2)}ms`);
+        // Each sample starts from a full garden and a rested pet
+        const result = benchmark(`clean x ${N_CLEAN}`, (i) => {
+            system.clean(`id-${N_CLEAN - 1 - i}`);
+        }, {
+            iterations: N_CLEAN,
+            samples: 5,
+            setup: () => {
+                pet.debris = {};
+                for (let i = 0; i < N_CLEAN; i++) {
+                    const id = `id-${i}`;
+                    pet.debris[id] = { id, type: 'weed', location: 'GARDEN', x: 0.5, y: 0.5, created: Date.now() };
+                }
+                pet.debrisCount = N_CLEAN;
+                pet.stats.energy = initialEnergy;
+            }
+        });
+        results.push(result);
+
+        console.log(formatResult(result));
     });
 
     test('penalty (Iter)', () => {
@@ -44,10 +60,12 @@ describe('Performance: Debris System', () => {
         pet.debrisCount = count;
         pet.recalculateCleanlinessPenalty();
 
-        const start = performance.now();
-        for (let i = 0; i < N_PENALTY; i++) {
-            pet.live(16, { weather: 'Sunny', time: 'Day', activeEvent: null });
-        }
-        console.log(`Penalty ${N_PENALTY}: ${(performance.now() - start).toFixed(2)}ms`);
+        const world = { weather: 'Sunny', time: 'Day', activeEvent: null };
+        const result = benchmark('live() with 100 debris', () => {
+            pet.live(16, world);
+        }, { iterations: N_PENALTY / 5, samples: 5 });
+        results.push(result);
+
+        console.log(formatResult(result));
     });
 });
@@ -1,7 +1,14 @@
 import { GeneticsSystem, Genome } from '../../js/GeneticsSystem.js';
 import { SeededRandom } from '../../js/utils/SeededRandom.js';
+import { benchmark, formatResult, writeBenchmarkReport } from '../helpers/benchmark.js';
 
 describe('GeneticsSystem Performance', () => {
+    const results = [];
+
+    afterAll(() => {
+        writeBenchmarkReport('GeneticsSystem', results);
+    });
+
     test('breed() with large environmental items list', () => {
         const deterministicRng = new SeededRandom('performance_seed');
         const parentGenome = new Genome(null, null, deterministicRng); // Random wild genome
@@ -25,20 +32,16 @@ describe('GeneticsSystem Performance', () => {
             }
         }
 
-        const iterations = 50000; // Increase iterations to make difference more noticeable
-        const start = Date.now();
-
-        for (let i = 0; i < iterations; i++) {
+        // 10 samples x 5000 iterations keeps the total work at 50000 breeds
+        const result = benchmark('breed() with 200 environmental items', () => {
             GeneticsSystem.breed(parentGenome, environmentalItems, deterministicRng);
-        }
-
-        const end = Date.now();
-        const duration = end - start;
+        }, { iterations: 5000, samples: 10 });
+        results.push(result);
 
-        console.log(`[Benchmark] GeneticsSystem.breed x ${iterations} with ${environmentalItems.length} items: ${duration}ms`);
+        console.log(formatResult(result));
 
         // Assert that it runs within a reasonable time (e.g. < 10000ms) to pass as a test
         // This is a loose bound just to prevent timeout
-        expect(duration).toBeLessThan(10000); // Tighter bound now that deterministic RNG is used
+        expect(result.totalMs).toBeLessThan(10000); // Tighter bound now that deterministic RNG is used
     });
 });
@@ -4,6 +4,7 @@ import { setupPhaserMock, mockGameObject } from '../helpers/mockPhaser';
 setupPhaserMock();
 
 import { LightingManager } from '../../js/LightingManager';
+import { benchmark, formatResult, writeBenchmarkReport } from '../helpers/benchmark';
 
 describe('LightingManager Performance Benchmark', () => {
     let scene;
@@ -12,6 +13,11 @@ describe('LightingManager Performance Benchmark', () => {
     let mockLightImage;
     let mockRenderTexture;
     let mockDummyLight;
+    const results = [];
+
+    afterAll(() => {
+        writeBenchmarkReport('LightingManager', results);
+    });
 
     beforeEach(() => {
         jest.clearAllMocks();
@@ -116,22 +122,36 @@ describe('LightingManager Performance Benchmark', () => {
         const fillRectSpy = mockLightTexture.context.fillRect; // Used for Cookie generation
         const rtDrawSpy = mockRenderTexture.draw;
         const rtFillSpy = mockRenderTexture.fill;
+        const constructionFillRects = fillRectSpy.mock.calls.length;
 
-        const startTime = Date.now();
-
-        for (let i = 0; i < frames; i++) {
+        // Every sample replays the same 1000-frame walk, so the draw counters
+        // below describe a single pass
+        const result = benchmark('update() over 1000 frames of micro-movement', () => {
             // Move player slightly
             scene.sprite.x += movementSpeed;
             scene.sprite.y += movementSpeed;
 
             // Update Lighting
             lightingManager.update();
-        }
-
-        const endTime = Date.now();
-        const duration = endTime - startTime;
+        }, {
+            iterations: frames,
+            samples: 10,
+            setup: () => {
+                scene.sprite.x = 100;
+                scene.sprite.y = 100;
+                fillRectSpy.mockClear();
+                rtDrawSpy.mockClear();
+                rtFillSpy.mockClear();
+            }
+        });
+        result.counters = {
+            cookieFillRect: fillRectSpy.mock.calls.length,
+            renderTextureFill: rtFillSpy.mock.calls.length,
+            renderTextureDraw: rtDrawSpy.mock.calls.length
+        };
+        results.push(result);
 
-        console.log(`[BENCHMARK] Total Duration: ${duration}ms`);
+        console.log(formatResult(result));
         console.log(`[BENCHMARK] Canvas fillRect calls (Cookie Generation): ${fillRectSpy.mock.calls.length}`);
         console.log(`[BENCHMARK] RenderTexture fill calls (Clears): ${rtFillSpy.mock.calls.length}`);
         console.log(`[BENCHMARK] RenderTexture draw calls (Lights): ${rtDrawSpy.mock.calls.length}`);
@@ -143,6 +163,7 @@ describe('LightingManager Performance Benchmark', () => {
 
         expect(rtDrawSpy.mock.calls.length).toBeGreaterThan(0);
         expect(rtDrawSpy.mock.calls.length).toBeLessThan(3500);
-        expect(fillRectSpy.mock.calls.length).toBe(1); // Only once!
+        expect(constructionFillRects).toBe(1); // Cookie generated once, at construction
+        expect(fillRectSpy.mock.calls.length).toBe(0); // ...and never regenerated by update()
     });
 });
@@ -5,11 +5,17 @@ import { setupPhaserMock, mockGameObject } from '../helpers/mockPhaser';
 setupPhaserMock();
 
 const { SkyManager } = require('../../js/SkyManager');
+const { benchmark, formatResult, writeBenchmarkReport } = require('../helpers/benchmark');
 
 describe('SkyManager Performance Benchmark', () => {
     let scene;
     let skyManager;
     let mockWorldClock;
+    const results = [];
+
+    afterAll(() => {
+        writeBenchmarkReport('SkyManager', results);
+    });
 
     beforeEach(() => {
         jest.clearAllMocks();
@@ -46,19 +52,16 @@ describe('SkyManager Performance Benchmark', () => {
     test('Benchmark: Canvas operations during slow daylight transition', () => {
         const iterations = 1000;
 
-        const canvas = skyManager.skyTexture;
-        const ctx = canvas.context;
-
-        // Spy on operations
-        const clearSpy = jest.spyOn(canvas, 'clear');
-        const gradientSpy = jest.spyOn(ctx, 'createLinearGradient');
-        const fillRectSpy = jest.spyOn(ctx, 'fillRect');
-        const refreshSpy = jest.spyOn(canvas, 'refresh');
+        let clearSpy;
+        let gradientSpy;
+        let fillRectSpy;
+        let refreshSpy;
 
         // Simulate a slow transition (0.001 per frame)
         // Without optimization: 1001 redraws
         // With optimization (0.01 threshold): ~101 redraws
-        for (let i = 0; i <= iterations; i++) {
+        // Each sample replays the transition on a fresh SkyManager so the spies count a single pass
+        const result = benchmark(`update() over ${iterations} slow daylight transitions`, (i) => {
             const factor = i / iterations; // 0.0 to 1.0
             mockWorldClock.getDaylightFactor.mockReturnValue(factor);
 
@@ -68,13 +71,32 @@ describe('SkyManager Performance Benchmark', () => {
 
             scene.time.now += 16; // Simulate 16ms per frame
             skyManager.update();
-        }
+        }, {
+            iterations: iterations + 1,
+            samples: 10,
+            setup: () => {
+                scene.time.now = 0;
+                skyManager = new SkyManager(scene);
+
+                const canvas = skyManager.skyTexture;
+                const ctx = canvas.context;
+
+                // Spy on operations
+                clearSpy = jest.spyOn(canvas, 'clear');
+                gradientSpy = jest.spyOn(ctx, 'createLinearGradient');
+                fillRectSpy = jest.spyOn(ctx, 'fillRect');
+                refreshSpy = jest.spyOn(canvas, 'refresh');
+            }
+        });
 
         const totalOps = clearSpy.mock.calls.length +
                          gradientSpy.mock.calls.length +
                          fillRectSpy.mock.calls.length +
                          refreshSpy.mock.calls.length;
+        result.counters = { canvasOps: totalOps, redraws: clearSpy.mock.calls.length };
+        results.push(result);
 
+        console.log(formatResult(result));
         console.log(`[OPTIMIZED] Total canvas operations for ${iterations} transitions: ${totalOps}`);
 
         // Expect roughly iterations / 10 redraws
@@ -1,5 +1,6 @@
 import { WorldClock } from '../../js/WorldClock.js';
 import { SeededRandom } from '../../js/utils/SeededRandom.js';
+import { benchmark, formatResult, writeBenchmarkReport } from '../helpers/benchmark.js';
 
 // Mock Scene
 const mockScene = {
@@ -8,44 +9,44 @@ const mockScene = {
 };
 
 describe('WorldClock Performance', () => {
+    const results = [];
+
+    afterAll(() => {
+        writeBenchmarkReport('WorldClock', results);
+    });
+
     test('getCurrentPeriod() benchmark - Cached vs Uncached', () => {
         const clock = new WorldClock(mockScene);
 
         // Scenario 1: Mostly Cache Hits (Time changes slightly but stays in same period)
         // Simulate normal game loop where time increments by small delta
-        const iterations = 1000000;
+        const iterations = 100000;
+        const samples = 10;
         const delta = 1000 / 60; // 16ms per frame (approx)
 
-        const start = Date.now();
-
-        for (let i = 0; i < iterations; i++) {
+        const sequential = benchmark('getCurrentPeriod (sequential update)', () => {
             // Update time slightly
             clock.update(delta);
             // Call getCurrentPeriod
             clock.getCurrentPeriod();
-        }
-
-        const end = Date.now();
-        const duration = end - start;
+        }, { iterations, samples });
+        results.push(sequential);
 
-        console.log(`[Benchmark] WorldClock.getCurrentPeriod x ${iterations} (sequential update): ${duration}ms`);
+        console.log(formatResult(sequential));
 
         // Scenario 2: Random Access (Cache Misses)
         // Reset clock
         const randomClock = new WorldClock(mockScene);
         const rng = new SeededRandom(12345); // Use seeded random to avoid Security Hotspot
-        const randomStart = Date.now();
 
-        for (let i = 0; i < iterations; i++) {
+        const random = benchmark('getCurrentPeriod (random access)', () => {
             randomClock.time = rng.random(); // Random time 0-1
             randomClock.getCurrentPeriod();
-        }
-
-        const randomEnd = Date.now();
-        const randomDuration = randomEnd - randomStart;
+        }, { iterations, samples });
+        results.push(random);
 
-        console.log(`[Benchmark] WorldClock.getCurrentPeriod x ${iterations} (random access): ${randomDuration}ms`);
+        console.log(formatResult(random));
 
-        expect(duration).toBeLessThan(5000); // Sanity check
+        expect(sequential.totalMs).toBeLessThan(5000); // Sanity check
     });
 });
@@ -0,0 +1,226 @@
+"""Compare benchmark reports against the committed baselines.
+
+Reads the JSON reports written by tests/helpers/benchmark.js (one file per
+suite, see BENCH_OUTPUT_DIR) and compares each benchmark with its entry in
+tests/performance/baselines.json using a one-sided Welch's t-test on the
+per-operation sample times. A benchmark is flagged as a regression when it is
+significantly slower (p < alpha) *and* slower by more than the relative
+threshold, or when one of its deterministic counters grew. Baseline entries
+may hold only counters (draw calls, redraws, ...), which compare exactly on any
+machine; the timing test is skipped for them.
+
+Usage:
+    BENCH_OUTPUT_DIR=tests/performance/results npm run bench
+    python3 tests/performance/compare_baselines.py
+    python3 tests/performance/compare_baselines.py --update   # accept current results
+
+Exits with status 1 when a regression is found. Uses only the standard library.
+"""
+
+import argparse
+import glob
+import json
+import math
+import os
+import statistics
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_RESULTS = os.path.join(HERE, "results")
+DEFAULT_BASELINE = os.path.join(HERE, "baselines.json")
+
+
+def _betacf(a, b, x):
+    """Continued fraction for the regularized incomplete beta function."""
+    max_iter, eps, fpmin = 200, 3e-14, 1e-300
+    qab, qap, qam = a + b, a + 1.0, a - 1.0
+    c, d = 1.0, 1.0 - qab * x / qap
+    d = 1.0 / (d if abs(d) > fpmin else fpmin)
+    h = d
+    for m in range(1, max_iter + 1):
+        m2 = 2 * m
+        aa = m * (b - m) * x / ((qam + m2) * (a + m2))
+        d = 1.0 + aa * d
+        d = 1.0 / (d if abs(d) > fpmin else fpmin)
+        c = 1.0 + aa / c
+        c = c if abs(c) > fpmin else fpmin
+        h *= d * c
+        aa = -(a + m) * (qab + m) * x / ((a + m2) * (qap + m2))
+        d = 1.0 + aa * d
+        d = 1.0 / (d if abs(d) > fpmin else fpmin)
+        c = 1.0 + aa / c
+        c = c if abs(c) > fpmin else fpmin
+        delta = d * c
+        h *= delta
+        if abs(delta - 1.0) < eps:
+            break
+    return h
+
+
+def _betainc(a, b, x):
+    """Regularized incomplete beta function I_x(a, b)."""
+    if x <= 0.0:
+        return 0.0
+    if x >= 1.0:
+        return 1.0
+    ln_front = (math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b)
+                + a * math.log(x) + b * math.log(1.0 - x))
+    front = math.exp(ln_front)
+    if x < (a + 1.0) / (a + b + 2.0):
+        return front * _betacf(a, b, x) / a
+    return 1.0 - front * _betacf(b, a, 1.0 - x) / b
+
+
+def t_sf(t, df):
+    """Survival function P(T > t) of Student's t distribution."""
+    tail = 0.5 * _betainc(df / 2.0, 0.5, df / (df + t * t))
+    return tail if t > 0 else 1.0 - tail
+
+
+def welch_slower_p(current, baseline):
+    """One-sided Welch's t-test p-value for "current is slower than baseline".
+
+    Both arguments are lists of per-operation times (ms). Returns None when
+    either side has fewer than two samples.
+    """
+    n1, n2 = len(current), len(baseline)
+    if n1 < 2 or n2 < 2:
+        return None
+    m1, m2 = statistics.fmean(current), statistics.fmean(baseline)
+    v1, v2 = statistics.variance(current) / n1, statistics.variance(baseline) / n2
+    se = math.sqrt(v1 + v2)
+    if se == 0:
+        return 0.0 if m1 > m2 else 1.0
+    t = (m1 - m2) / se
+    df = (v1 + v2) ** 2 / ((v1 ** 2) / (n1 - 1) + (v2 ** 2) / (n2 - 1))
+    return t_sf(t, df)
+
+
+def load_results(results_dir):
+    """Loads every suite report in a directory, keyed by "suite::name"."""
+    results = {}
+    for path in sorted(glob.glob(os.path.join(results_dir, "*.json"))):
+        with open(path, encoding="utf-8") as handle:
+            report = json.load(handle)
+        for result in report.get("results", []):
+            key = f"{report['suite']}::{result['name']}"
+            results[key] = dict(result, node=report.get("node"), platform=report.get("platform"),
+                                recorded=report.get("timestamp"))
+    return results
+
+
+def load_baseline(path):
+    """Loads the baseline file, returning an empty one if it does not exist."""
+    if not os.path.exists(path):
+        return {"version": 1, "benchmarks": {}}
+    with open(path, encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def compare(key, current, baseline, alpha, threshold):
+    """Compares one benchmark with its baseline entry and returns a row dict."""
+    row = {
+        "benchmark": key,
+        "opsPerSec": current.get("opsPerSec"),
+        "bytesPerOp": current.get("bytesPerOp"),
+        "status": "new",
+        "change": None,
+        "p": None,
+        "notes": [],
+    }
+    if baseline is None:
+        return row
+
+    row["status"] = "unchanged"
+
+    # Timings are machine-dependent, so a baseline may hold only counters; skip the t-test then.
+    before_ms, after_ms = baseline.get("meanMs"), current.get("meanMs")
+    before_samples, after_samples = baseline.get("sampleMs") or [], current.get("sampleMs") or []
+    if before_ms is not None and after_ms is not None:
+        change = after_ms / before_ms - 1.0 if before_ms else 0.0
+        p_slower = welch_slower_p(after_samples, before_samples)
+        p_faster = welch_slower_p(before_samples, after_samples)
+        row["change"], row["p"] = change, p_slower
+
+        if p_slower is not None and p_slower < alpha and change > threshold:
+            row["status"] = "regression"
+        elif p_faster is not None and p_faster < alpha and change < -threshold:
+            row["status"], row["p"] = "improvement", p_faster
+
+    # Counters (draw calls, redraws, ...) are deterministic: any increase is a regression.
+    for name, value in (current.get("counters") or {}).items():
+        previous = (baseline.get("counters") or {}).get(name)
+        if previous is not None and value > previous:
+            row["status"] = "regression"
+            row["notes"].append(f"{name} {previous} -> {value}")
+
+    before, after = baseline.get("bytesPerOp"), current.get("bytesPerOp")
+    if before is not None and after is not None and after > before * (1.0 + threshold) + 1:
+        row["notes"].append(f"allocations {before:.0f} -> {after:.0f} B/op")
+
+    return row
+
+
+def format_rows(rows):
+    """Renders comparison rows as a plain-text table."""
+    lines = [f"{'benchmark':<64} {'ops/sec':>14} {'change':>8} {'p':>8}  status"]
+    for row in rows:
+        change = f"{row['change'] * 100:+.1f}%" if row["change"] is not None else "-"
+        p_value = f"{row['p']:.3f}" if row["p"] is not None else "-"
+        notes = f"  ({'; '.join(row['notes'])})" if row["notes"] else ""
+        ops = f"{row['opsPerSec']:,.0f}" if row["opsPerSec"] is not None else "-"
+        lines.append(f"{row['benchmark'][:64]:<64} {ops:>14} {change:>8} {p_value:>8}  "
+                     f"{row['status']}{notes}")
+    return "\n".join(lines)
+
+
+def update_baseline(baseline, results, path):
+    """Stores the current results as the new baseline entries."""
+    fields = ("meanMs", "stdDevMs", "samples", "sampleMs", "opsPerSec", "bytesPerOp",
+              "counters", "node", "platform", "recorded")
+    for key, result in results.items():
+        baseline["benchmarks"][key] = {field: result.get(field) for field in fields}
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(baseline, handle, indent=2, sort_keys=True)
+        handle.write("\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--results", default=DEFAULT_RESULTS, help="directory of suite reports")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline JSON file")
+    parser.add_argument("--alpha", type=float, default=0.05, help="significance level (default 0.05)")
+    parser.add_argument("--threshold", type=float, default=0.05,
+                        help="minimum relative slowdown to report (default 0.05 = 5%%)")
+    parser.add_argument("--json", dest="json_out", help="also write the comparison to this file")
+    parser.add_argument("--update", action="store_true", help="write current results into the baseline")
+    args = parser.parse_args(argv)
+
+    results = load_results(args.results)
+    if not results:
+        print(f"No benchmark reports found in {args.results}", file=sys.stderr)
+        return 2
+
+    baseline = load_baseline(args.baseline)
+    rows = [compare(key, results[key], baseline["benchmarks"].get(key), args.alpha, args.threshold)
+            for key in sorted(results)]
+    print(format_rows(rows))
+
+    if args.json_out:
+        with open(args.json_out, "w", encoding="utf-8") as handle:
+            json.dump(rows, handle, indent=2)
+
+    if args.update:
+        update_baseline(baseline, results, args.baseline)
+        print(f"\nBaseline updated: {args.baseline}")
+        return 0
+
+    regressions = [row for row in rows if row["status"] == "regression"]
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) detected.", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,74 @@
+"""Tests for the benchmark baseline comparison (run with `python3 -m pytest tests/performance`)."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from compare_baselines import compare, format_rows, welch_slower_p  # noqa: E402
+
+KEY = "Suite::bench"
+SLOW = [1.20, 1.22, 1.19, 1.21, 1.23, 1.20, 1.18, 1.22, 1.21, 1.20]
+FAST = [1.00, 1.02, 0.99, 1.01, 1.03, 1.00, 0.98, 1.02, 1.01, 1.00]
+
+
+def result(samples, counters=None):
+    mean = sum(samples) / len(samples)
+    return {"meanMs": mean, "sampleMs": samples, "opsPerSec": 1000 / mean, "counters": counters or {}}
+
+
+def test_welch_needs_two_samples_per_side():
+    assert welch_slower_p([1.0], FAST) is None
+    assert welch_slower_p(FAST, []) is None
+
+
+def test_welch_is_one_sided():
+    assert welch_slower_p(SLOW, FAST) < 0.001
+    assert welch_slower_p(FAST, SLOW) > 0.999
+    assert 0.4 < welch_slower_p(FAST, list(FAST)) < 0.6
+
+
+def test_welch_handles_zero_variance():
+    assert welch_slower_p([2.0, 2.0], [1.0, 1.0]) == 0.0
+    assert welch_slower_p([1.0, 1.0], [2.0, 2.0]) == 1.0
+
+
+def test_compare_without_baseline_is_new():
+    row = compare(KEY, result(FAST), None, 0.05, 0.05)
+    assert row["status"] == "new"
+    assert row["change"] is None
+
+
+def test_compare_flags_timing_regressions_and_improvements():
+    slower = compare(KEY, result(SLOW), result(FAST), 0.05, 0.05)
+    assert slower["status"] == "regression"
+    assert abs(slower["change"] - 0.2) < 0.01
+
+    faster = compare(KEY, result(FAST), result(SLOW), 0.05, 0.05)
+    assert faster["status"] == "improvement"
+
+    same = compare(KEY, result(FAST), result(list(FAST)), 0.05, 0.05)
+    assert same["status"] == "unchanged"
+
+
+def test_compare_ignores_slowdowns_below_the_threshold():
+    row = compare(KEY, result(SLOW), result(FAST), 0.05, 0.5)
+    assert row["status"] == "unchanged"
+
+
+def test_compare_against_a_counters_only_baseline():
+    baseline = {"counters": {"redraws": 99, "canvasOps": 5296}}
+
+    row = compare(KEY, result(SLOW, {"redraws": 99, "canvasOps": 5296}), baseline, 0.05, 0.05)
+    assert row["status"] == "unchanged"
+    assert row["change"] is None and row["p"] is None
+
+    row = compare(KEY, result(FAST, {"redraws": 101, "canvasOps": 5000}), baseline, 0.05, 0.05)
+    assert row["status"] == "regression"
+    assert row["notes"] == ["redraws 99 -> 101"]
+    assert "redraws 99 -> 101" in format_rows([row])
+
+
+def test_counter_growth_overrides_a_timing_improvement():
+    row = compare(KEY, result(FAST, {"draws": 2}), result(SLOW, {"draws": 1}), 0.05, 0.05)
+    assert row["status"] == "regression"
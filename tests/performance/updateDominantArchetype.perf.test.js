@@ -3,6 +3,7 @@ import { jest } from '@jest/globals';
 import { Nadagotchi } from '../../js/Nadagotchi';
 import { setupPhaserMock } from '../helpers/mockPhaser';
 import { setupLocalStorageMock } from '../helpers/mockLocalStorage';
+import { benchmark, formatResult, writeBenchmarkReport } from '../helpers/benchmark';
 
 // Setup Mocks
 setupPhaserMock();
@@ -10,13 +11,19 @@ setupLocalStorageMock();
 
 describe('Performance Benchmark: updateDominantArchetype', () => {
     let pet;
+    const results = [];
 
     beforeEach(() => {
         pet = new Nadagotchi('Intellectual');
     });
 
+    afterAll(() => {
+        writeBenchmarkReport('updateDominantArchetype', results);
+    });
+
     test('Benchmark updateDominantArchetype', () => {
-        const iterations = 100000;
+        const iterations = 10000;
+        const samples = 10;
 
         // Define Scenarios as data objects to avoid code duplication
         const scenarios = [
@@ -44,22 +51,17 @@ describe('Performance Benchmark: updateDominantArchetype', () => {
            }
         ];
 
-        const startTime = performance.now();
         const numScenarios = scenarios.length;
 
-        for (let i = 0; i < iterations; i++) {
+        const result = benchmark('updateDominantArchetype (4 tie scenarios)', (i) => {
             // Rotate through scenarios to average out the cost
             scenarios[i % numScenarios]();
             pet.updateDominantArchetype();
-        }
-
-        const endTime = performance.now();
-        const duration = endTime - startTime;
+        }, { iterations, samples });
+        results.push(result);
 
-        console.log(`Benchmark Results:`);
-        console.log(`Iterations: ${iterations}`);
-        console.log(`Total Time: ${duration.toFixed(2)} ms`);
-        console.log(`Average Time per Call: ${(duration / iterations).toFixed(4)} ms`);
+        console.log(formatResult(result));
+        console.log(`Average Time per Call: ${result.meanMs.toFixed(4)} ms (95% CI ${result.ci95Ms[0].toFixed(4)}-${result.ci95Ms[1].toFixed(4)} ms)`);
 
         expect(true).toBe(true);
     });
@@ -0,0 +1,51 @@
+/**
+ * @fileoverview A Nadagotchi that can run outside the browser for balance simulations.
+ * The universe seed is injected instead of drawn from the platform CSPRNG, so a pet
+ * is fully reproducible from its seed, and nothing is written to storage: the journal
+ * stays in the in-memory ring buffer and persistence calls resolve without saving.
+ */
+
+import { Nadagotchi } from '../../js/Nadagotchi.js';
+import { PersistenceManager } from '../../js/PersistenceManager.js';
+
+// The constructor seeds the RNG before subclass fields exist, so the seed is handed over here.
+let pendingSeed = null;
+
+/**
+ * Persistence that discards every write. Reads fall through to localStorage
+ * (the mockLocalStorage helper in simulations), which holds no pet data.
+ */
+export class HeadlessPersistence extends PersistenceManager {
+    async _save() {}
+}
+
+export class HeadlessPet extends Nadagotchi {
+    /**
+     * @param {string} initialArchetype - The starting archetype.
+     * @param {number} seed - The universe seed (unsigned 32-bit).
+     */
+    constructor(initialArchetype, seed) {
+        pendingSeed = seed >>> 0;
+        try {
+            super(initialArchetype);
+        } finally {
+            pendingSeed = null;
+        }
+        this.persistence = new HeadlessPersistence();
+        /** @type {number} Journal entries written over the pet's life. */
+        this.journalCount = 0;
+    }
+
+    _generateSeed() {
+        return pendingSeed !== null ? pendingSeed : super._generateSeed();
+    }
+
+    /**
+     * Keeps the entry in memory only.
+     * @param {string} text - The content of the journal entry.
+     */
+    addJournalEntry(text) {
+        this._journalBuffer.push({ date: null, text });
+        this.journalCount++;
+    }
+}
@@ -0,0 +1,93 @@
+/**
+ * @fileoverview Minimal columnar table format for simulation results.
+ * Each column is a raw little-endian binary file (`<table>.<column>.bin`):
+ * numbers as float64, strings dictionary-encoded as int32 codes. `manifest.json`
+ * lists every table's row count, column types and string dictionaries.
+ * tests/simulation/load_results.py reads it with the standard library.
+ */
+
+import fs from 'fs';
+import path from 'path';
+
+export const FORMAT = 'nadagotchi-sim-columnar';
+export const VERSION = 1;
+
+/**
+ * Converts an array of row objects into typed columns.
+ * Column order follows the keys of the first row; a column is a string column
+ * if any of its values is a string.
+ * @param {Array<object>} rows - The rows.
+ * @returns {Array<{name: string, type: string, values: (Float64Array|Int32Array), dictionary?: Array<string>}>} The columns.
+ */
+export function toColumns(rows) {
+    if (rows.length === 0) return [];
+    return Object.keys(rows[0]).map(name => {
+        const isString = rows.some(row => typeof row[name] === 'string');
+        if (!isString) {
+            const values = new Float64Array(rows.length);
+            rows.forEach((row, i) => { values[i] = row[name] === undefined || row[name] === null ? NaN : Number(row[name]); });
+            return { name, type: 'float64', values };
+        }
+
+        const dictionary = [];
+        const codes = new Map();
+        const values = new Int32Array(rows.length);
+        rows.forEach((row, i) => {
+            const value = row[name] === undefined || row[name] === null ? '' : String(row[name]);
+            let code = codes.get(value);
+            if (code === undefined) {
+                code = dictionary.length;
+                codes.set(value, code);
+                dictionary.push(value);
+            }
+            values[i] = code;
+        });
+        return { name, type: 'dict', values, dictionary };
+    });
+}
+
+/**
+ * Encodes a typed array as little-endian bytes.
+ * @param {Float64Array|Int32Array} values - The values.
+ * @returns {Buffer} The encoded bytes.
+ * @private
+ */
+function encode(values) {
+    const buffer = Buffer.alloc(values.length * values.BYTES_PER_ELEMENT);
+    const isFloat = values instanceof Float64Array;
+    for (let i = 0; i < values.length; i++) {
+        if (isFloat) buffer.writeDoubleLE(values[i], i * 8);
+        else buffer.writeInt32LE(values[i], i * 4);
+    }
+    return buffer;
+}
+
+/**
+ * Writes tables of row objects to a directory.
+ * @param {string} dir - Output directory (created if needed).
+ * @param {Object<string, Array<object>>} tables - Rows keyed by table name.
+ * @param {object} [metadata] - Extra fields stored in the manifest (options, scenarios, ...).
+ * @returns {string} Path of the written manifest.
+ */
+export function writeTables(dir, tables, metadata = {}) {
+    fs.mkdirSync(dir, { recursive: true });
+    const manifest = { format: FORMAT, version: VERSION, ...metadata, tables: {} };
+
+    Object.keys(tables).forEach(table => {
+        const rows = tables[table];
+        manifest.tables[table] = {
+            rows: rows.length,
+            columns: toColumns(rows).map(column => {
+                const file = `${table}.${column.name}.bin`;
+                fs.writeFileSync(path.join(dir, file), encode(column.values));
+                const entry = { name: column.name, type: column.type === 'dict' ? 'int32' : 'float64', file };
+                if (column.dictionary) entry.dictionary = column.dictionary;
+                return entry;
+            })
+        };
+    });
+
+    const manifestPath = path.join(dir, 'manifest.json');
+    fs.writeFileSync(manifestPath, JSON.stringify(manifest, null, 2));
+    return manifestPath;
+}
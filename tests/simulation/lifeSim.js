@@ -0,0 +1,271 @@
+/**
+ * @fileoverview Headless pet-life simulation.
+ * Advances a HeadlessPet through the same per-frame and per-day steps as
+ * MainScene.simulate (WorldClock, Calendar, daily quests, debris, `live`) while a
+ * policy plays the game, and records per-pet metrics and per-day aggregates.
+ */
+
+import { Config } from '../../js/Config.js';
+import { Calendar } from '../../js/Calendar.js';
+import { WorldClock } from '../../js/WorldClock.js';
+import { SeededRandom } from '../../js/utils/SeededRandom.js';
+import { HeadlessPet } from './HeadlessPet.js';
+import { Policies } from './policies.js';
+
+export const MOODS = ['happy', 'neutral', 'sad', 'angry'];
+export const ARCHETYPES = ['Adventurer', 'Nurturer', 'Mischievous', 'Intellectual', 'Recluse'];
+
+// Mirrors WeatherSystem, which needs a Phaser scene for its timer
+const WEATHER_TYPES = ['Sunny', 'Cloudy', 'Rainy', 'Stormy'];
+const DAILY_FIELDS = ['pets', 'debris', 'happiness', 'hunger', 'energy', 'careers', ...MOODS.map(m => `${m}Ms`)];
+
+export const DEFAULT_OPTIONS = {
+    seed: 1,
+    days: 28,
+    dayMs: 420000, // WorldClock default: 7 real minutes per game day
+    stepMs: 1000,
+    decisionMs: 2000, // How often the policy acts (game time)
+    workSuccess: 0.75,
+    cleanPerDay: 2,
+    archetypes: ARCHETYPES
+};
+
+/**
+ * Derives a well-mixed 32-bit seed from a base seed and an index (murmur3 finalizer).
+ * @param {number} seed - The base seed.
+ * @param {number} index - The stream index (e.g. the pet index).
+ * @returns {number} The derived unsigned 32-bit seed.
+ */
+export function deriveSeed(seed, index) {
+    let h = (seed ^ Math.imul(index + 1, 0x9E3779B1)) >>> 0;
+    h = Math.imul(h ^ (h >>> 16), 0x85EBCA6B);
+    h = Math.imul(h ^ (h >>> 13), 0xC2B2AE35);
+    return (h ^ (h >>> 16)) >>> 0;
+}
+
+/**
+ * Creates zeroed per-day accumulators.
+ * @param {number} days - Number of simulated days.
+ * @returns {Object<string, Array<number>>} One array per field, indexed by day.
+ */
+export function createDailyTotals(days) {
+    const totals = {};
+    DAILY_FIELDS.forEach(field => { totals[field] = new Array(days).fill(0); });
+    return totals;
+}
+
+/**
+ * Adds one set of per-day accumulators into another.
+ * @param {Object<string, Array<number>>} into - The accumulators to add to.
+ * @param {Object<string, Array<number>>} from - The accumulators to add.
+ */
+export function mergeDailyTotals(into, from) {
+    DAILY_FIELDS.forEach(field => {
+        const target = into[field];
+        const source = from[field];
+        for (let i = 0; i < target.length; i++) target[i] += source[i];
+    });
+}
+
+/**
+ * Applies `Config` overrides given as dotted paths, e.g. `{ 'DEBRIS.MAX_COUNT': 5 }`.
+ * @param {object} config - The config object to modify.
+ * @param {Object<string, *>} overrides - Values keyed by dotted path.
+ * @returns {function(): void} Restores the previous values.
+ */
+export function applyOverrides(config, overrides = {}) {
+    const previous = [];
+    Object.keys(overrides).forEach(path => {
+        const keys = path.split('.');
+        const last = keys.pop();
+        let target = config;
+        keys.forEach(key => {
+            target = target !== null && typeof target === 'object' ? target[key] : undefined;
+        });
+        if (target === null || typeof target !== 'object' || !(last in target)) {
+            throw new Error(`Unknown Config key: ${path}`);
+        }
+        previous.push([target, last, target[last]]);
+        target[last] = overrides[path];
+    });
+    return () => {
+        for (let i = previous.length - 1; i >= 0; i--) {
+            const [target, key, value] = previous[i];
+            target[key] = value;
+        }
+    };
+}
+
+/**
+ * Simulates one pet's life.
+ * @param {object} options - Simulation options (see {@link DEFAULT_OPTIONS}).
+ * @param {number} options.seed - The pet's universe seed.
+ * @param {string} options.archetype - The starting archetype.
+ * @param {string} options.policy - A key of {@link Policies}.
+ * @param {Object<string, Array<number>>} [daily] - Per-day accumulators to add this pet to.
+ * @returns {object} The pet's metrics.
+ */
+export function simulateLife(options, daily = null) {
+    const { days, dayMs, stepMs, decisionMs } = options;
+    const policy = Policies[options.policy];
+    if (!policy) throw new Error(`Unknown policy: ${options.policy}`);
+
+    const pet = new HeadlessPet(options.archetype, options.seed);
+    const rng = new SeededRandom(deriveSeed(options.seed, 0x5157));
+    const clock = new WorldClock(null, dayMs / 1000);
+    const calendar = new Calendar();
+    const worldState = { time: clock.getCurrentPeriod(), weather: 'Sunny', season: calendar.season, activeEvent: null };
+    const weatherInterval = rng.range(30000, 90001);
+    let nextWeatherChange = weatherInterval;
+
+    const metrics = {
+        workShifts: 0, workSuccesses: 0, promotions: 0,
+        debrisSpawned: 0, debrisCleaned: 0, dailyQuests: 0
+    };
+    const ctx = {
+        worldState,
+        workSuccess: options.workSuccess,
+        cleanPerDay: options.cleanPerDay,
+        workedToday: false,
+        cleanedToday: 0,
+        recordShift(summary) {
+            if (!summary) return;
+            metrics.workShifts++;
+            if (summary.success) metrics.workSuccesses++;
+            if (summary.promoted) metrics.promotions++;
+        },
+        recordClean() { metrics.debrisCleaned++; }
+    };
+
+    const moodMs = { happy: 0, neutral: 0, sad: 0, angry: 0 };
+    const totalMs = days * dayMs;
+    const settleDay = Math.floor(days / 2);
+    let careerDay = NaN;
+    let firstCareer = '';
+    let happinessMs = 0;
+    let maxDebris = 0;
+    let settledDebris = 0;
+    let sampledDays = 0;
+    let elapsed = 0;
+    let nextDecision = decisionMs;
+
+    while (elapsed < totalMs) {
+        const step = Math.min(stepMs, totalMs - elapsed);
+        const dayIndex = Math.floor(elapsed / dayMs);
+
+        // Same order as MainScene.simulate
+        const daysPassed = clock.update(step);
+        for (let i = 0; i < daysPassed; i++) {
+            calendar.advanceDay();
+            pet.relationshipSystem.dailyUpdate();
+            if (pet.questSystem.generateDailyQuest(calendar.season, worldState.weather)) metrics.dailyQuests++;
+
+            const debrisBefore = pet.debrisCount;
+            pet.debrisSystem.spawnDaily(calendar.season, worldState.weather);
+            if (pet.stats.hunger < 50) pet.debrisSystem.spawnPoop();
+            metrics.debrisSpawned += pet.debrisCount - debrisBefore;
+
+            pet.updateCareer();
+            ctx.workedToday = false;
+            ctx.cleanedToday = 0;
+        }
+
+        nextWeatherChange -= step;
+        if (nextWeatherChange <= 0) {
+            worldState.weather = rng.choice(WEATHER_TYPES.filter(w => w !== worldState.weather));
+            nextWeatherChange += weatherInterval;
+        }
+        worldState.time = clock.getCurrentPeriod();
+        worldState.season = calendar.season;
+
+        pet.live(step, worldState);
+        elapsed += step;
+
+        while (elapsed >= nextDecision) {
+            policy.decide(pet, rng, ctx);
+            nextDecision += decisionMs;
+        }
+
+        if (Number.isNaN(careerDay) && pet.unlockedCareers.length > 0) {
+            careerDay = elapsed / dayMs;
+            firstCareer = pet.unlockedCareers[0];
+        }
+        moodMs[pet.mood] = (moodMs[pet.mood] || 0) + step;
+        happinessMs += pet.stats.happiness * step;
+        maxDebris = Math.max(maxDebris, pet.debrisCount);
+        if (daily && daily[`${pet.mood}Ms`]) daily[`${pet.mood}Ms`][dayIndex] += step;
+
+        // End-of-day samples
+        while (sampledDays < days && elapsed >= (sampledDays + 1) * dayMs) {
+            if (sampledDays >= settleDay) settledDebris += pet.debrisCount;
+            if (daily) {
+                daily.pets[sampledDays] += 1;
+                daily.debris[sampledDays] += pet.debrisCount;
+                daily.happiness[sampledDays] += pet.stats.happiness;
+                daily.hunger[sampledDays] += pet.stats.hunger;
+                daily.energy[sampledDays] += pet.stats.energy;
+                daily.careers[sampledDays] += pet.unlockedCareers.length > 0 ? 1 : 0;
+            }
+            sampledDays++;
+        }
+    }
+
+    const career = pet.currentCareer || '';
+    return {
+        seed: options.seed,
+        archetype: options.archetype,
+        policy: options.policy,
+        days,
+        careerDay,
+        firstCareer,
+        currentCareer: career,
+        careerLevel: career ? (pet.careerLevels[career] || 1) : 0,
+        careersUnlocked: pet.unlockedCareers.length,
+        happyFrac: moodMs.happy / totalMs,
+        neutralFrac: moodMs.neutral / totalMs,
+        sadFrac: moodMs.sad / totalMs,
+        angryFrac: moodMs.angry / totalMs,
+        meanHappiness: happinessMs / totalMs,
+        finalHunger: pet.stats.hunger,
+        finalEnergy: pet.stats.energy,
+        finalHappiness: pet.stats.happiness,
+        equilibriumDebris: settledDebris / Math.max(1, days - settleDay),
+        finalDebris: pet.debrisCount,
+        maxDebris,
+        ...metrics,
+        journalEntries: pet.journalCount,
+        age: pet.age,
+        legacyReady: pet.isLegacyReady ? 1 : 0
+    };
+}
+
+/**
+ * Runs a contiguous block of pets for one scenario. Pet seeds and archetypes are
+ * derived from the base seed and the pet index only, so results do not depend on
+ * how pets are split across workers, and every scenario sees the same pets.
+ * @param {object} task - The work unit.
+ * @param {number} task.chunkIndex - Position of the chunk, used to merge results in order.
+ * @param {{id: number, policy: string, overrides: object}} task.scenario - The scenario.
+ * @param {number} task.firstPet - Index of the first pet in the chunk.
+ * @param {number} task.count - Number of pets.
+ * @param {object} task.options - Simulation options (see {@link DEFAULT_OPTIONS}).
+ * @returns {{chunkIndex: number, rows: Array<object>, daily: Object<string, Array<number>>}} The chunk's results.
+ */
+export function runChunk(task) {
+    const options = { ...DEFAULT_OPTIONS, ...task.options };
+    const restore = applyOverrides(Config, task.scenario.overrides);
+    try {
+        const daily = createDailyTotals(options.days);
+        const rows = [];
+        for (let i = 0; i < task.count; i++) {
+            const petIndex = task.firstPet + i;
+            const seed = deriveSeed(options.seed, petIndex);
+            const archetype = options.archetypes[deriveSeed(seed, 1) % options.archetypes.length];
+            const result = simulateLife({ ...options, seed, archetype, policy: task.scenario.policy }, daily);
+            rows.push({ scenario: task.scenario.id, pet: petIndex, ...result });
+        }
+        return { chunkIndex: task.chunkIndex, rows, daily };
+    } finally {
+        restore();
+    }
+}
@@ -0,0 +1,188 @@
+"""Load and summarize headless pet-life simulation results.
+
+Reads the columnar output of tests/simulation/simulate.js: a manifest.json plus
+one little-endian binary file per column (float64 numbers, int32 dictionary
+codes for strings), plus run.json with the run's timing. Uses only the standard
+library; `to_dataframe` returns a pandas DataFrame when pandas is installed.
+
+Usage:
+    python3 tests/simulation/load_results.py [RUN_DIR]
+    python3 tests/simulation/load_results.py RUN_DIR --by archetype
+    python3 tests/simulation/load_results.py RUN_DIR --table daily --csv daily.csv
+
+From Python:
+    from load_results import load_table
+    pets = load_table("tests/simulation/results", "pets")
+    pets["careerDay"][:10]
+"""
+
+import argparse
+import array
+import csv
+import json
+import math
+import os
+import statistics
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_RUN = os.path.join(HERE, "results")
+FORMAT = "nadagotchi-sim-columnar"
+MOODS = ("happy", "neutral", "sad", "angry")
+
+
+def load_run_info(run_dir):
+    """Loads a run's run.json (start time, duration, Node version), or {} if it is missing."""
+    path = os.path.join(run_dir, "run.json")
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def load_manifest(run_dir):
+    """Loads and validates a run's manifest.json."""
+    with open(os.path.join(run_dir, "manifest.json"), encoding="utf-8") as handle:
+        manifest = json.load(handle)
+    if manifest.get("format") != FORMAT:
+        raise ValueError(f"{run_dir} is not a simulation run (format {manifest.get('format')!r})")
+    return manifest
+
+
+def _read_column(run_dir, column):
+    values = array.array("d" if column["type"] == "float64" else "i")
+    with open(os.path.join(run_dir, column["file"]), "rb") as handle:
+        values.frombytes(handle.read())
+    if sys.byteorder != "little":
+        values.byteswap()
+    if "dictionary" in column:
+        dictionary = column["dictionary"]
+        return [dictionary[code] for code in values]
+    return values
+
+
+def load_table(run_dir, name, columns=None):
+    """Loads a table as a dict of column name -> sequence.
+
+    Numeric columns are array('d') (NaN marks missing values, e.g. careerDay for
+    pets that never unlocked a career); string columns are lists of str.
+    """
+    manifest = load_manifest(run_dir)
+    if name not in manifest["tables"]:
+        raise KeyError(f"No table {name!r}; available: {', '.join(manifest['tables'])}")
+    return {
+        column["name"]: _read_column(run_dir, column)
+        for column in manifest["tables"][name]["columns"]
+        if columns is None or column["name"] in columns
+    }
+
+
+def to_dataframe(table):
+    """Converts a loaded table to a pandas DataFrame (requires pandas)."""
+    import pandas as pd  # Optional dependency, only needed for this helper
+
+    return pd.DataFrame({name: list(values) for name, values in table.items()})
+
+
+def rows(table):
+    """Iterates a loaded table row by row as dicts."""
+    names = list(table)
+    for i in range(len(table[names[0]]) if names else 0):
+        yield {name: table[name][i] for name in names}
+
+
+def _quantile(values, q):
+    finite = sorted(v for v in values if not math.isnan(v))
+    if not finite:
+        return math.nan
+    pos = (len(finite) - 1) * q
+    lo, hi = math.floor(pos), math.ceil(pos)
+    return finite[lo] + (finite[hi] - finite[lo]) * (pos - lo)
+
+
+def summarize(pets, by=None):
+    """Aggregates a pets table per scenario (and optionally per another column).
+
+    Returns rows with the career rate, time-to-career quantiles (over pets that
+    unlocked a career), the time-weighted mood distribution and the debris
+    equilibrium (mean end-of-day debris over the second half of each run).
+    """
+    groups = {}
+    for row in rows(pets):
+        key = (int(row["scenario"]), row[by] if by else None)
+        groups.setdefault(key, []).append(row)
+
+    result = []
+    for (scenario, group), members in sorted(groups.items(), key=lambda item: (item[0][0], str(item[0][1]))):
+        career_days = [m["careerDay"] for m in members]
+        reached = [d for d in career_days if not math.isnan(d)]
+        summary = {
+            "scenario": scenario,
+            "group": group,
+            "pets": len(members),
+            "careerRate": len(reached) / len(members),
+            "careerDayP50": _quantile(career_days, 0.5),
+            "careerDayP90": _quantile(career_days, 0.9),
+            "equilibriumDebris": statistics.fmean(m["equilibriumDebris"] for m in members),
+            "meanHappiness": statistics.fmean(m["meanHappiness"] for m in members),
+        }
+        for mood in MOODS:
+            summary[f"{mood}Frac"] = statistics.fmean(m[f"{mood}Frac"] for m in members)
+        result.append(summary)
+    return result
+
+
+def _fmt(value, digits=2):
+    return "-" if value is None or (isinstance(value, float) and math.isnan(value)) else f"{value:.{digits}f}"
+
+
+def format_summary(summary, labels, by=None):
+    """Renders summary rows as a plain-text table."""
+    header = f"{'scenario':<44} {by or '':<13} {'pets':>6} {'career%':>8} {'p50':>6} {'p90':>6}  " \
+             f"{'happy/neutral/sad/angry':<23} {'debris':>6}"
+    lines = [header]
+    for row in summary:
+        moods = "/".join(_fmt(row[f"{mood}Frac"]) for mood in MOODS)
+        lines.append(f"{labels.get(row['scenario'], row['scenario'])[:44]:<44} {str(row['group'] or '')[:13]:<13} "
+                     f"{row['pets']:>6} {_fmt(row['careerRate'] * 100, 1):>8} {_fmt(row['careerDayP50'], 1):>6} "
+                     f"{_fmt(row['careerDayP90'], 1):>6}  {moods:<23} {_fmt(row['equilibriumDebris'], 1):>6}")
+    return "\n".join(lines)
+
+
+def write_csv(table, path):
+    """Writes a loaded table to CSV."""
+    with open(path, "w", newline="", encoding="utf-8") as handle:
+        writer = csv.DictWriter(handle, fieldnames=list(table))
+        writer.writeheader()
+        writer.writerows(rows(table))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("run_dir", nargs="?", default=DEFAULT_RUN, help="simulation output directory")
+    parser.add_argument("--by", help="also group pets by this column (e.g. archetype, firstCareer)")
+    parser.add_argument("--table", help="table to export with --csv (pets, daily, scenarios, summary)")
+    parser.add_argument("--csv", dest="csv_out", help="write --table (default pets) to this CSV file")
+    args = parser.parse_args(argv)
+
+    manifest = load_manifest(args.run_dir)
+    if args.csv_out:
+        write_csv(load_table(args.run_dir, args.table or "pets"), args.csv_out)
+        print(f"Wrote {args.csv_out}")
+        return 0
+
+    scenarios = load_table(args.run_dir, "scenarios", columns=("scenario", "label"))
+    labels = {int(s): label for s, label in zip(scenarios["scenario"], scenarios["label"])}
+    options = manifest.get("options", {})
+    print(f"Run {load_run_info(args.run_dir).get('created', '?')}: {manifest['tables']['pets']['rows']} pets, "
+          f"{options.get('days', '?')} days, seed {options.get('seed', '?')}\n")
+
+    pets = load_table(args.run_dir, "pets")
+    if args.by and args.by not in pets:
+        parser.error(f"unknown column {args.by!r}")
+    print(format_summary(summarize(pets, args.by), labels, args.by))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+/**
+ * @fileoverview Player policies for the headless life simulator.
+ * A policy is called at every decision point with the pet, a seeded RNG and the
+ * simulation context, and plays the game through the same entry points as the UI:
+ * `handleAction`, `completeWorkShift`, `updateCareer` and `DebrisSystem.clean`.
+ */
+
+import { Config } from '../../js/Config.js';
+
+const RANDOM_ACTIONS = ['FEED', 'PLAY', 'STUDY', 'EXPLORE', 'MEDITATE', 'FORAGE', 'INTERACT_PLANT', 'INTERACT_BOOKSHELF', 'WORK', 'CLEAN'];
+
+// The action that trains the skill each archetype's career path needs
+const TRAINING_ACTIONS = {
+    Adventurer: 'EXPLORE',
+    Intellectual: 'STUDY',
+    Nurturer: 'INTERACT_PLANT',
+    Recluse: 'MEDITATE',
+    Mischievous: 'PLAY'
+};
+
+/**
+ * Works one shift in the current career. The minigame outcome is drawn from `ctx.workSuccess`.
+ * @param {import('./HeadlessPet.js').HeadlessPet} pet - The pet.
+ * @param {import('../../js/utils/SeededRandom.js').SeededRandom} rng - The policy RNG.
+ * @param {object} ctx - The simulation context.
+ * @returns {boolean} True if a shift was worked.
+ */
+export function workShift(pet, rng, ctx) {
+    if (!pet.currentCareer) return false;
+    const summary = pet.completeWorkShift({ success: rng.random() < ctx.workSuccess, career: pet.currentCareer });
+    pet.updateCareer();
+    ctx.recordShift(summary);
+    return true;
+}
+
+/**
+ * Cleans the oldest debris item, if any.
+ * @param {import('./HeadlessPet.js').HeadlessPet} pet - The pet.
+ * @param {object} ctx - The simulation context.
+ * @returns {boolean} True if something was cleaned.
+ */
+export function cleanDebris(pet, ctx) {
+    for (const id in pet.debris) {
+        const result = pet.debrisSystem.clean(id);
+        if (result.success) ctx.recordClean();
+        return result.success;
+    }
+    return false;
+}
+
+export const Policies = {
+    /** Never interacts; measures the pet left alone. */
+    idle: {
+        decide() {}
+    },
+
+    /** Picks a uniformly random action at every decision point. */
+    random: {
+        decide(pet, rng, ctx) {
+            const action = rng.choice(RANDOM_ACTIONS);
+            if (action === 'WORK') {
+                if (!ctx.workedToday) ctx.workedToday = workShift(pet, rng, ctx);
+            } else if (action === 'CLEAN') {
+                cleanDebris(pet, ctx);
+            } else {
+                pet.handleAction(action);
+            }
+        }
+    },
+
+    /**
+     * An attentive player: fulfils cravings, keeps hunger and energy up, trains the
+     * pet's archetype, works one daytime shift and tidies the garden.
+     */
+    caretaker: {
+        decide(pet, rng, ctx) {
+            if (pet.stats.hunger < Config.THRESHOLDS.HUNGER_SAD + 10) {
+                pet.handleAction('FEED');
+            } else if (pet.stats.energy < Config.THRESHOLDS.ENERGY_SAD + 10) {
+                pet.handleAction('MEDITATE');
+            } else if (pet.currentDesire) {
+                pet.handleAction(pet.currentDesire);
+            } else if (!ctx.workedToday && ctx.worldState.time === 'Day' && pet.currentCareer) {
+                ctx.workedToday = workShift(pet, rng, ctx);
+            } else if (ctx.cleanedToday < ctx.cleanPerDay && pet.debrisCount > 0) {
+                if (cleanDebris(pet, ctx)) ctx.cleanedToday++;
+                else ctx.cleanedToday = ctx.cleanPerDay;
+            } else {
+                pet.handleAction(TRAINING_ACTIONS[pet.dominantArchetype] || 'PLAY');
+            }
+        }
+    }
+};
@@ -0,0 +1,303 @@
+/**
+ * @fileoverview Headless pet-life simulator for balance sweeps.
+ * Runs thousands of HeadlessPets across a worker_threads pool and writes per-pet
+ * and per-day results as columnar files (see columnar.js).
+ *
+ * Usage:
+ *   node tests/simulation/simulate.js --pets 2000 --days 56 --policy caretaker,random
+ *   node tests/simulation/simulate.js --set DEBRIS.SPAWN_CHANCE_DAILY=0.4,0.8 --set DECAY.HUNGER=0.03,0.05
+ *   python3 tests/simulation/load_results.py tests/simulation/results
+ *
+ * Every combination of --policy and --set values is a scenario. Pet seeds come from
+ * --seed and the pet index, so each scenario simulates the same pets and manifest.json
+ * and the column files are byte-identical for any --workers count (for a given --chunk
+ * size). Details that differ between runs (start time, duration, Node version, worker
+ * count) go to a separate run.json.
+ */
+
+import fs from 'fs';
+import os from 'os';
+import path from 'path';
+import { fileURLToPath } from 'url';
+import { parseArgs } from 'util';
+import { Worker } from 'worker_threads';
+import { writeTables } from './columnar.js';
+import { ARCHETYPES, DEFAULT_OPTIONS, MOODS, createDailyTotals, mergeDailyTotals } from './lifeSim.js';
+
+const HERE = path.dirname(fileURLToPath(import.meta.url));
+
+const HELP = `Usage: node tests/simulation/simulate.js [options]
+
+  --pets <n>            Pets per scenario (default 1000)
+  --days <n>            Game days per pet (default ${DEFAULT_OPTIONS.days})
+  --policy <list>       Comma-separated policies: idle, random, caretaker (default caretaker)
+  --set <KEY=v1,v2>     Config override to sweep, as a dotted path (repeatable)
+  --archetypes <list>   Starting archetypes to draw from (default all)
+  --seed <n>            Base seed (default ${DEFAULT_OPTIONS.seed})
+  --step-ms <n>         Simulation step in game ms (default ${DEFAULT_OPTIONS.stepMs})
+  --decision-ms <n>     Policy decision interval in game ms (default ${DEFAULT_OPTIONS.decisionMs})
+  --work-success <p>    Probability a work shift succeeds (default ${DEFAULT_OPTIONS.workSuccess})
+  --clean-per-day <n>   Debris the caretaker cleans per day (default ${DEFAULT_OPTIONS.cleanPerDay})
+  --workers <n>         Worker threads (default: available cores)
+  --chunk <n>           Pets per work unit (default 25)
+  --out <dir>           Output directory (default tests/simulation/results)
+  -h, --help            Show this help`;
+
+/**
+ * Parses a sweep value: JSON literals (numbers, booleans, null) or plain strings.
+ * @param {string} raw - The raw value.
+ * @returns {*} The parsed value.
+ */
+function parseValue(raw) {
+    try {
+        return JSON.parse(raw);
+    } catch (e) {
+        return raw;
+    }
+}
+
+/**
+ * Builds the scenario grid: every policy crossed with every combination of sweep values.
+ * @param {Array<string>} policies - Policy names.
+ * @param {Array<string>} sets - Raw `KEY=v1,v2` arguments.
+ * @returns {Array<{id: number, policy: string, overrides: object, label: string}>} The scenarios.
+ */
+export function buildScenarios(policies, sets = []) {
+    let grid = [{}];
+    sets.forEach(arg => {
+        const eq = arg.indexOf('=');
+        if (eq <= 0) throw new Error(`Invalid --set "${arg}", expected KEY=value[,value...]`);
+        const key = arg.slice(0, eq);
+        const values = arg.slice(eq + 1).split(',').map(parseValue);
+        grid = grid.flatMap(overrides => values.map(value => ({ ...overrides, [key]: value })));
+    });
+
+    const scenarios = [];
+    policies.forEach(policy => {
+        grid.forEach(overrides => {
+            const parts = Object.keys(overrides).map(key => `${key}=${overrides[key]}`);
+            scenarios.push({ id: scenarios.length, policy, overrides, label: [policy, ...parts].join(' ') });
+        });
+    });
+    return scenarios;
+}
+
+/**
+ * Runs tasks on a pool of workers, handing out the next task as each one finishes.
+ * @param {Array<object>} tasks - Chunk tasks for worker.js.
+ * @param {number} workerCount - Pool size.
+ * @param {function(number, number): void} [onProgress] - Called with (done, total).
+ * @returns {Promise<Array<object>>} Results, indexed by chunk.
+ */
+function runPool(tasks, workerCount, onProgress = () => {}) {
+    return new Promise((resolve, reject) => {
+        const results = new Array(tasks.length);
+        const workers = [];
+        let next = 0;
+        let done = 0;
+        let settled = false;
+
+        const finish = (err) => {
+            if (settled) return;
+            settled = true;
+            workers.forEach(worker => worker.terminate());
+            if (err) reject(err);
+            else resolve(results);
+        };
+        const dispatch = (worker) => {
+            if (next < tasks.length) worker.postMessage(tasks[next++]);
+        };
+
+        for (let i = 0; i < Math.min(workerCount, tasks.length); i++) {
+            const worker = new Worker(new URL('./worker.js', import.meta.url));
+            worker.on('message', (message) => {
+                if (!message.ok) {
+                    finish(new Error(`Chunk ${message.chunkIndex} failed:\n${message.error}`));
+                    return;
+                }
+                results[message.result.chunkIndex] = message.result;
+                onProgress(++done, tasks.length);
+                if (done === tasks.length) finish();
+                else dispatch(worker);
+            });
+            worker.on('error', finish);
+            workers.push(worker);
+            dispatch(worker);
+        }
+    });
+}
+
+/**
+ * Quantile of the finite values in a list.
+ * @param {Array<number>} values - The values.
+ * @param {number} [q=0.5] - Quantile.
+ * @returns {number} The quantile, or NaN if there are no finite values.
+ */
+function quantile(values, q = 0.5) {
+    const sorted = values.filter(Number.isFinite).sort((a, b) => a - b);
+    if (sorted.length === 0) return NaN;
+    const pos = (sorted.length - 1) * q;
+    const lo = Math.floor(pos);
+    return sorted[lo] + (sorted[Math.ceil(pos)] - sorted[lo]) * (pos - lo);
+}
+
+/**
+ * Aggregates per-pet rows into one summary row per scenario.
+ * @param {Array<object>} scenarios - The scenarios.
+ * @param {Array<object>} rows - Per-pet rows.
+ * @returns {Array<object>} Summary rows.
+ */
+export function summarize(scenarios, rows) {
+    return scenarios.map(scenario => {
+        const own = rows.filter(row => row.scenario === scenario.id);
+        const mean = (key) => own.reduce((sum, row) => sum + row[key], 0) / Math.max(1, own.length);
+        const careerDays = own.map(row => row.careerDay);
+        const summary = {
+            scenario: scenario.id,
+            label: scenario.label,
+            pets: own.length,
+            careerRate: careerDays.filter(Number.isFinite).length / Math.max(1, own.length),
+            medianCareerDay: quantile(careerDays),
+            p90CareerDay: quantile(careerDays, 0.9)
+        };
+        MOODS.forEach(mood => { summary[`${mood}Frac`] = mean(`${mood}Frac`); });
+        summary.meanHappiness = mean('meanHappiness');
+        summary.equilibriumDebris = mean('equilibriumDebris');
+        return summary;
+    });
+}
+
+/**
+ * Turns merged per-day accumulators into per-scenario daily means.
+ * @param {number} scenarioId - The scenario id.
+ * @param {Object<string, Array<number>>} daily - Merged accumulators.
+ * @param {number} dayMs - Length of a game day in ms.
+ * @returns {Array<object>} One row per day.
+ */
+function dailyRows(scenarioId, daily, dayMs) {
+    return daily.pets.map((pets, d) => {
+        const n = Math.max(1, pets);
+        const row = {
+            scenario: scenarioId,
+            day: d + 1,
+            pets,
+            meanDebris: daily.debris[d] / n,
+            meanHappiness: daily.happiness[d] / n,
+            meanHunger: daily.hunger[d] / n,
+            meanEnergy: daily.energy[d] / n,
+            careerFrac: daily.careers[d] / n
+        };
+        MOODS.forEach(mood => { row[`${mood}Frac`] = daily[`${mood}Ms`][d] / (n * dayMs); });
+        return row;
+    });
+}
+
+const fmt = (value, digits = 2) => (Number.isFinite(value) ? value.toFixed(digits) : '-');
+
+async function main() {
+    const { values: args } = parseArgs({
+        options: {
+            pets: { type: 'string', default: '1000' },
+            days: { type: 'string' },
+            policy: { type: 'string', default: 'caretaker' },
+            set: { type: 'string', multiple: true, default: [] },
+            archetypes: { type: 'string' },
+            seed: { type: 'string' },
+            'step-ms': { type: 'string' },
+            'decision-ms': { type: 'string' },
+            'work-success': { type: 'string' },
+            'clean-per-day': { type: 'string' },
+            workers: { type: 'string' },
+            chunk: { type: 'string', default: '25' },
+            out: { type: 'string', default: path.join(HERE, 'results') },
+            help: { type: 'boolean', short: 'h', default: false }
+        }
+    });
+    if (args.help) {
+        console.log(HELP);
+        return 0;
+    }
+
+    const numberArg = (name, fallback) => (args[name] !== undefined ? Number(args[name]) : fallback);
+    const options = {
+        seed: numberArg('seed', DEFAULT_OPTIONS.seed) >>> 0,
+        days: numberArg('days', DEFAULT_OPTIONS.days),
+        dayMs: DEFAULT_OPTIONS.dayMs,
+        stepMs: numberArg('step-ms', DEFAULT_OPTIONS.stepMs),
+        decisionMs: numberArg('decision-ms', DEFAULT_OPTIONS.decisionMs),
+        workSuccess: numberArg('work-success', DEFAULT_OPTIONS.workSuccess),
+        cleanPerDay: numberArg('clean-per-day', DEFAULT_OPTIONS.cleanPerDay),
+        archetypes: args.archetypes ? args.archetypes.split(',') : ARCHETYPES
+    };
+    const pets = Number(args.pets);
+    const chunkSize = Math.max(1, Number(args.chunk));
+    const workerCount = Math.max(1, numberArg('workers', os.availableParallelism ? os.availableParallelism() : os.cpus().length));
+
+    const invalid = options.archetypes.filter(a => !ARCHETYPES.includes(a));
+    if (invalid.length > 0) throw new Error(`Unknown archetype(s): ${invalid.join(', ')}`);
+    if (!(pets > 0) || !(options.days > 0) || !(options.stepMs > 0) || !(options.decisionMs > 0)) {
+        throw new Error('--pets, --days, --step-ms and --decision-ms must be positive numbers');
+    }
+
+    const scenarios = buildScenarios(args.policy.split(','), args.set);
+    const tasks = [];
+    scenarios.forEach(scenario => {
+        for (let first = 0; first < pets; first += chunkSize) {
+            tasks.push({
+                chunkIndex: tasks.length,
+                scenario: { id: scenario.id, policy: scenario.policy, overrides: scenario.overrides },
+                firstPet: first,
+                count: Math.min(chunkSize, pets - first),
+                options
+            });
+        }
+    });
+
+    console.log(`Simulating ${scenarios.length} scenario(s) x ${pets} pets x ${options.days} days on ${Math.min(workerCount, tasks.length)} worker(s)...`);
+    const start = performance.now();
+    const results = await runPool(tasks, workerCount, (done, total) => {
+        if (process.stderr.isTTY) process.stderr.write(`\r  ${done}/${total} chunks`);
+    });
+    if (process.stderr.isTTY) process.stderr.write('\n');
+    const seconds = (performance.now() - start) / 1000;
+
+    // Merge in chunk order so output does not depend on scheduling
+    const petRows = [];
+    const dailyTotals = scenarios.map(() => createDailyTotals(options.days));
+    results.forEach((result, i) => {
+        petRows.push(...result.rows);
+        mergeDailyTotals(dailyTotals[tasks[i].scenario.id], result.daily);
+    });
+
+    const summary = summarize(scenarios, petRows);
+    const manifest = writeTables(args.out, {
+        pets: petRows,
+        daily: scenarios.flatMap(scenario => dailyRows(scenario.id, dailyTotals[scenario.id], options.dayMs)),
+        scenarios: scenarios.map(scenario => ({ scenario: scenario.id, policy: scenario.policy, label: scenario.label, ...scenario.overrides })),
+        summary
+    }, { options, pets });
+    fs.writeFileSync(path.join(args.out, 'run.json'), JSON.stringify({
+        created: new Date().toISOString(),
+        node: process.version,
+        workers: Math.min(workerCount, tasks.length),
+        seconds
+    }, null, 2));
+
+    console.log(`Done in ${seconds.toFixed(1)}s (${Math.round(petRows.length / seconds)} pets/s)\n`);
+    console.log(`${'scenario'.padEnd(48)} ${'career%'.padStart(8)} ${'day50'.padStart(7)} ${'day90'.padStart(7)}  ${'happy/neutral/sad/angry'.padEnd(23)} ${'debris'.padStart(6)}`);
+    summary.forEach(row => {
+        const moods = MOODS.map(mood => fmt(row[`${mood}Frac`])).join('/');
+        console.log(`${row.label.slice(0, 48).padEnd(48)} ${fmt(row.careerRate * 100, 1).padStart(8)} ` +
+            `${fmt(row.medianCareerDay, 1).padStart(7)} ${fmt(row.p90CareerDay, 1).padStart(7)}  ${moods.padEnd(23)} ` +
+            `${fmt(row.equilibriumDebris, 1).padStart(6)}`);
+    });
+    console.log(`\nResults written to ${path.dirname(manifest)}`);
+    return 0;
+}
+
+if (process.argv[1] && path.resolve(process.argv[1]) === fileURLToPath(import.meta.url)) {
+    main().then(code => { process.exitCode = code; }, err => {
+        console.error(err.message);
+        process.exitCode = 1;
+    });
+}
@@ -0,0 +1,19 @@
+/**
+ * @fileoverview worker_threads entry point for tests/simulation/simulate.js.
+ * Receives chunk tasks from the main thread and posts back their results.
+ */
+
+import { parentPort } from 'worker_threads';
+import { setupLocalStorageMock } from '../helpers/mockLocalStorage.js';
+
+// Game code reads localStorage (e.g. Config.SECURITY.DNA_SALT), so the mock goes in before anything loads.
+setupLocalStorageMock();
+const { runChunk } = await import('./lifeSim.js');
+
+parentPort.on('message', (task) => {
+    try {
+        parentPort.postMessage({ ok: true, result: runChunk(task) });
+    } catch (e) {
+        parentPort.postMessage({ ok: false, chunkIndex: task.chunkIndex, error: e.stack || String(e) });
+    }
+});